@@ -0,0 +1,32 @@
+"""
+Celery application for backend project.
+
+Image optimization jobs can run for minutes on large albums, so they are
+routed to their own ``images`` queue and should be consumed by a dedicated
+fair-scheduled worker that only reserves one job at a time:
+
+    celery -A backend worker -Q images -c 2 -Ofair --prefetch-multiplier=1
+    celery -A backend worker -Q default,cleanup -c 8 -Ofair
+"""
+
+import os
+
+from celery import Celery
+from kombu import Queue
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+
+app = Celery('backend')
+
+# All CELERY_* names in settings.py become Celery configuration
+app.config_from_object('django.conf:settings', namespace='CELERY')
+
+# Image jobs are idempotent and can simply be re-queued, so the images queue
+# is transient (non-durable, non-persistent messages) to skip broker disk writes
+app.conf.task_queues = (
+    Queue('default', routing_key='default'),
+    Queue('images', routing_key='images', durable=False, delivery_mode=1),
+    Queue('cleanup', routing_key='cleanup'),
+)
+
+app.autodiscover_tasks()
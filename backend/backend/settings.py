@@ -249,6 +249,23 @@ else:
     IMAGE_OPTIMIZATION_THREADS = 1
     IMAGE_OPTIMIZATION_TIMEOUT = 1800  # 30 minutes timeout for image processing (increased for large uploads)
 
+# Celery Configuration - long-running image jobs get their own queue
+CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+CELERY_TASK_DEFAULT_QUEUE = 'default'
+CELERY_TASK_ROUTES = {
+    'portfolio.tasks.optimize_*': {'queue': 'images'},
+    'portfolio.tasks.delete_*': {'queue': 'cleanup'},
+}
+CELERY_TASK_ACKS_LATE = True  # Only ack once the job finished so restarts re-deliver it
+CELERY_TASK_REJECT_ON_WORKER_LOST = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1  # Don't let one worker hoard several long image jobs
+
+# Send image optimization to the Celery worker instead of the in-process file queue
+IMAGE_OPTIMIZATION_USE_CELERY = os.environ.get('IMAGE_OPTIMIZATION_USE_CELERY') == 'true'
+
+# Send contact form emails from the Celery worker (otherwise a background thread)
+CONTACT_EMAIL_USE_CELERY = os.environ.get('CONTACT_EMAIL_USE_CELERY') == 'true'
+
 # Image validation settings - INCREASED FOR HIGH-RESOLUTION PORTFOLIO IMAGES
 ALLOWED_IMAGE_TYPES = [
     'image/jpeg', 'image/jpg', 'image/png', 'image/gif', 
@@ -330,12 +347,23 @@ if IS_PRODUCTION:
         'x-requested-with',
     ]
 
-# Cache Configuration - Using dummy cache instead of Redis
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+# Cache Configuration - Redis when CACHE_REDIS_URL is set, otherwise a dummy cache
+# (cached payloads and ETags keyed on cache generations only take effect with Redis)
+CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL')
+if CACHE_REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_REDIS_URL,
+            'KEY_PREFIX': 'alex_design',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+        }
     }
-}
 
 # Email Configuration
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
@@ -417,12 +445,12 @@ LOGGING = {
         },
         'portfolio': {
             'handlers': ['console', 'file'],
-            'level': 'DEBUG',
+            'level': 'INFO' if IS_PRODUCTION else 'DEBUG',
             'propagate': False,
         },
         'rest_framework': {
             'handlers': ['console', 'file'],
-            'level': 'DEBUG',
+            'level': 'INFO' if IS_PRODUCTION else 'DEBUG',
             'propagate': False,
         },
     },
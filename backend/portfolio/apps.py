@@ -6,4 +6,8 @@ class PortfolioConfig(AppConfig):
     name = 'portfolio'
     
     def ready(self):
-        import portfolio.signals
+        # Receivers carry dispatch_uids too; this just avoids re-running the import
+        # when ready() is called more than once (autoreload, test setup)
+        if not getattr(self, '_signals_loaded', False):
+            import portfolio.signals
+            self._signals_loaded = True
@@ -6,15 +6,24 @@ Uses a simple file-based queue to avoid blocking HTTP responses
 import json
 import os
 import time
-import threading
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from django.conf import settings
+from django.db import close_old_connections
 from django.utils import timezone
 from .image_optimizer import ImageOptimizer
 
 logger = logging.getLogger(__name__)
 
+# Bounded pool that runs the queued optimization jobs - one job per queued task,
+# on reused workers instead of a new thread per save
+_IMG_POOL = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1),
+    thread_name_prefix='image-optimizer'
+)
+
 class AsyncImageOptimizer:
     """
     Manages asynchronous image optimization using a simple file-based queue
@@ -24,6 +33,14 @@ class AsyncImageOptimizer:
     QUEUE_DIR = Path(settings.BASE_DIR) / 'media' / '.optimization_queue'
     PROCESSING_DIR = Path(settings.BASE_DIR) / 'media' / '.optimization_processing'
     
+    # Jobs submitted by this process that haven't finished yet
+    _pending_jobs = 0
+    # One lock per project/service, so two jobs for the same target never run side by side
+    _target_locks = {}
+    _jobs_guard = threading.Lock()
+    # Tasks left in the queue by an earlier process are submitted with the first new one
+    _recovered = False
+    
     @classmethod
     def _ensure_dirs(cls):
         """Ensure queue directories exist"""
@@ -34,8 +51,15 @@ class AsyncImageOptimizer:
     def queue_project_optimization(cls, project_id, operation_type='update'):
         """
         Queue a project for optimization without any blocking operations
+        Hands off to the Celery worker when IMAGE_OPTIMIZATION_USE_CELERY is on
         """
         try:
+            if getattr(settings, 'IMAGE_OPTIMIZATION_USE_CELERY', False):
+                from .tasks import optimize_project_images_task
+                optimize_project_images_task.delay(project_id)
+                logger.info(f"Sent project optimization to Celery: {project_id}")
+                return
+            
             cls._ensure_dirs()
             
             task = {
@@ -56,8 +80,8 @@ class AsyncImageOptimizer:
             
             logger.info(f"Queued project optimization: {project_id} (file: {filename})")
             
-            # Start processor if not running (non-blocking check)
-            cls._start_processor_if_needed()
+            # Hand the task to the shared pool (non-blocking)
+            cls._submit(filepath)
             
         except Exception as e:
             logger.error(f"Failed to queue project optimization for {project_id}: {e}")
@@ -88,8 +112,8 @@ class AsyncImageOptimizer:
             
             logger.info(f"Queued file cleanup: {old_file_path} (file: {filename})")
             
-            # Start processor if not running (non-blocking check)
-            cls._start_processor_if_needed()
+            # Hand the task to the shared pool (non-blocking)
+            cls._submit(filepath)
             
         except Exception as e:
             logger.error(f"Failed to queue file cleanup for {old_file_path}: {e}")
@@ -98,8 +122,15 @@ class AsyncImageOptimizer:
     def queue_service_optimization(cls, service_id, operation_type='update'):
         """
         Queue a service for optimization without any blocking operations
+        Hands off to the Celery worker when IMAGE_OPTIMIZATION_USE_CELERY is on
         """
         try:
+            if getattr(settings, 'IMAGE_OPTIMIZATION_USE_CELERY', False):
+                from .tasks import optimize_service_images_task
+                optimize_service_images_task.delay(service_id)
+                logger.info(f"Sent service optimization to Celery: {service_id}")
+                return
+            
             cls._ensure_dirs()
             
             task = {
@@ -119,117 +150,64 @@ class AsyncImageOptimizer:
             
             logger.info(f"Queued service optimization: {service_id} (file: {filename})")
             
-            # Start processor if not running (non-blocking check)
-            cls._start_processor_if_needed()
+            # Hand the task to the shared pool (non-blocking)
+            cls._submit(filepath)
             
         except Exception as e:
             logger.error(f"Failed to queue service optimization for {service_id}: {e}")
     
     @classmethod
-    def _start_processor_if_needed(cls):
+    def _submit(cls, task_file):
         """
-        Start the background processor if it's not already running
-        Uses file-based locking to prevent multiple processors
+        Submit a queued task to the shared pool as its own job
         """
-        try:
-            lock_file = cls.PROCESSING_DIR / 'processor.lock'
-            
-            # Check if processor is already running
-            if lock_file.exists():
-                # Check if the process is still active
-                try:
-                    with open(lock_file, 'r') as f:
-                        data = json.load(f)
-                        pid = data.get('pid')
-                        started = data.get('started')
-                        
-                    # If lock is older than 5 minutes, assume process died
-                    if started and time.time() - started > 300:
-                        logger.warning("Removing stale processor lock")
-                        lock_file.unlink(missing_ok=True)
-                    else:
-                        # Processor is running
-                        return
-                except:
-                    # Corrupted lock file, remove it
-                    lock_file.unlink(missing_ok=True)
-            
-            # Start new processor
-            thread = threading.Thread(target=cls._background_processor, daemon=True)
-            thread.start()
-            
-        except Exception as e:
-            logger.error(f"Error starting processor: {e}")
+        with cls._jobs_guard:
+            task_files = [task_file]
+            if not cls._recovered:
+                cls._recovered = True
+                task_files = list(cls.QUEUE_DIR.glob('*.json'))
+            cls._pending_jobs += len(task_files)
+        
+        for path in task_files:
+            try:
+                _IMG_POOL.submit(cls._run_queued_task, path)
+            except RuntimeError:
+                # Pool already shut down (interpreter exiting) - the task stays queued
+                with cls._jobs_guard:
+                    cls._pending_jobs -= 1
     
     @classmethod
-    def _background_processor(cls):
+    def _run_queued_task(cls, task_file):
         """
-        Background processor that continuously processes the optimization queue
+        Pool job: process one queued task (runs in a pool worker)
         """
-        import os
-        
-        lock_file = cls.PROCESSING_DIR / 'processor.lock'
+        # project_12_<time>_<id>.json -> project_12
+        target = task_file.name.rsplit('_', 2)[0]
+        with cls._jobs_guard:
+            target_lock = cls._target_locks.setdefault(target, threading.Lock())
         
         try:
-            # Create lock file
-            with open(lock_file, 'w') as f:
-                json.dump({
-                    'pid': os.getpid(),
-                    'started': time.time()
-                }, f)
-            
-            logger.info("Background optimization processor started")
-            
-            while True:
-                try:
-                    # Process all files in queue with better batching
-                    queue_files = list(cls.QUEUE_DIR.glob('*.json'))
-                    
-                    if not queue_files:
-                        # No work to do, sleep and check again (shorter interval for responsiveness)
-                        time.sleep(1)
-                        continue
-                    
-                    # Process oldest file first (FIFO for better user experience)
-                    queue_files.sort(key=lambda f: f.stat().st_mtime)
-                    
-                    # Process up to 3 tasks at once for better throughput
-                    batch_size = min(3, len(queue_files))
-                    for queue_file in queue_files[:batch_size]:
-                        try:
-                            cls._process_task_file(queue_file)
-                        except Exception as e:
-                            logger.error(f"Error processing task {queue_file}: {e}")
-                            # Move failed task to processing dir for debugging
-                            try:
-                                failed_file = cls.PROCESSING_DIR / f"failed_{queue_file.name}"
-                                queue_file.rename(failed_file)
-                            except:
-                                pass
-                    
-                    # Brief pause between batches for better system responsiveness
-                    if len(queue_files) > batch_size:
-                        time.sleep(0.5)
-                
-                except Exception as e:
-                    logger.error(f"Error in background processor: {e}")
-                    time.sleep(3)  # Shorter wait before retrying
-                    
+            with target_lock:
+                cls._process_task_file(task_file)
         except Exception as e:
-            logger.error(f"Fatal error in background processor: {e}")
+            logger.error(f"Error processing task {task_file}: {e}")
         finally:
-            # Clean up lock file
-            lock_file.unlink(missing_ok=True)
-            logger.info("Background optimization processor stopped")
+            close_old_connections()
+            with cls._jobs_guard:
+                cls._pending_jobs -= 1
     
     @classmethod
     def _process_task_file(cls, task_file):
         """
         Process a single optimization task
         """
-        # Move to processing dir first
+        # Move to processing dir first - this claims the task
         processing_file = cls.PROCESSING_DIR / task_file.name
-        task_file.rename(processing_file)
+        try:
+            task_file.rename(processing_file)
+        except FileNotFoundError:
+            # Already claimed by another process's job
+            return
         
         try:
             with open(processing_file, 'r') as f:
@@ -328,11 +306,8 @@ class AsyncImageOptimizer:
         queued = len(list(cls.QUEUE_DIR.glob('*.json')))
         processing = len(list(cls.PROCESSING_DIR.glob('*.json')))
         
-        lock_file = cls.PROCESSING_DIR / 'processor.lock'
-        processor_running = lock_file.exists()
-        
         return {
             'queued_tasks': queued,
             'processing_tasks': processing,
-            'processor_running': processor_running
+            'processor_running': cls._pending_jobs > 0
         }
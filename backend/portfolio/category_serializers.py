@@ -10,10 +10,17 @@ class ProjectCategorySerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'created_at', 'subcategories_count', 'subcategories_names']
     
     def get_subcategories_count(self, obj):
+        names = getattr(obj, 'subcategory_names_annotated', None)
+        if names is not None:
+            return len(names)
         return obj.subcategories.count()
     
     def get_subcategories_names(self, obj):
-        return [sub.name for sub in obj.subcategories.all()]
+        # Annotated by the category views; fall back to a query for fresh instances
+        names = getattr(obj, 'subcategory_names_annotated', None)
+        if names is not None:
+            return names
+        return list(obj.subcategories.order_by('name').values_list('name', flat=True))
 
 class ProjectSubcategorySerializer(serializers.ModelSerializer):
     category_name = serializers.CharField(source='category.name', read_only=True)
@@ -31,10 +38,17 @@ class ServiceCategorySerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'created_at', 'subcategories_count', 'subcategories_names']
     
     def get_subcategories_count(self, obj):
+        names = getattr(obj, 'subcategory_names_annotated', None)
+        if names is not None:
+            return len(names)
         return obj.subcategories.count()
     
     def get_subcategories_names(self, obj):
-        return [sub.name for sub in obj.subcategories.all()]
+        # Annotated by the category views; fall back to a query for fresh instances
+        names = getattr(obj, 'subcategory_names_annotated', None)
+        if names is not None:
+            return names
+        return list(obj.subcategories.order_by('name').values_list('name', flat=True))
 
 class ServiceSubcategorySerializer(serializers.ModelSerializer):
     category_name = serializers.CharField(source='category.name', read_only=True)
@@ -4,12 +4,26 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAdminUser
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import Q, Value
 from .models import ProjectCategory, ProjectSubcategory, ServiceCategory, ServiceSubcategory
 from .category_serializers import (
     ProjectCategorySerializer, ProjectSubcategorySerializer,
     ServiceCategorySerializer, ServiceSubcategorySerializer
 )
 
+def _with_subcategory_names(queryset):
+    """
+    Annotate each category with its subcategory names (one aggregated query),
+    which the category serializers use for the names and count fields
+    """
+    return queryset.annotate(subcategory_names_annotated=ArrayAgg(
+        'subcategories__name',
+        filter=Q(subcategories__isnull=False),
+        order_by='subcategories__name',
+        default=Value([]),
+    )).order_by('name')
+
 class PublicCategoryView(APIView):
     """
     Public endpoint for getting categories and subcategories without authentication
@@ -21,13 +35,13 @@ class PublicCategoryView(APIView):
         category_type = request.query_params.get('type', 'project')
         
         if category_type == 'project':
-            categories = ProjectCategory.objects.all()
-            subcategories = ProjectSubcategory.objects.all()
+            categories = _with_subcategory_names(ProjectCategory.objects.all())
+            subcategories = ProjectSubcategory.objects.select_related('category')
             category_serializer = ProjectCategorySerializer
             subcategory_serializer = ProjectSubcategorySerializer
         elif category_type == 'service':
-            categories = ServiceCategory.objects.all()
-            subcategories = ServiceSubcategory.objects.all()
+            categories = _with_subcategory_names(ServiceCategory.objects.all())
+            subcategories = ServiceSubcategory.objects.select_related('category')
             category_serializer = ServiceCategorySerializer
             subcategory_serializer = ServiceSubcategorySerializer
         else:
@@ -50,6 +64,9 @@ class ProjectCategoryViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAdminUser]
     pagination_class = None  # Disable pagination to show all categories
     
+    def get_queryset(self):
+        return _with_subcategory_names(ProjectCategory.objects.all())
+    
     @action(detail=True, methods=['get'])
     def subcategories(self, request, pk=None):
         """Get all subcategories for this category"""
@@ -99,7 +116,7 @@ class ProjectSubcategoryViewSet(viewsets.ModelViewSet):
     pagination_class = None  # Disable pagination to show all subcategories
     
     def get_queryset(self):
-        queryset = ProjectSubcategory.objects.all()
+        queryset = ProjectSubcategory.objects.select_related('category')
         category_id = self.request.query_params.get('category', None)
         if category_id is not None:
             queryset = queryset.filter(category_id=category_id)
@@ -123,6 +140,9 @@ class ServiceCategoryViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAdminUser]
     pagination_class = None  # Disable pagination to show all categories
     
+    def get_queryset(self):
+        return _with_subcategory_names(ServiceCategory.objects.all())
+    
     @action(detail=True, methods=['get'])
     def subcategories(self, request, pk=None):
         """Get all subcategories for this category"""
@@ -172,7 +192,7 @@ class ServiceSubcategoryViewSet(viewsets.ModelViewSet):
     pagination_class = None  # Disable pagination to show all subcategories
     
     def get_queryset(self):
-        queryset = ServiceSubcategory.objects.all()
+        queryset = ServiceSubcategory.objects.select_related('category')
         category_id = self.request.query_params.get('category', None)
         if category_id is not None:
             queryset = queryset.filter(category_id=category_id)
@@ -266,7 +266,7 @@ This email was automatically generated from your website.
             recipient_email = getattr(settings, 'CONTACT_EMAIL', 'mohamedaboelhamd765@gmail.com')
             from_email = getattr(settings, 'DEFAULT_FROM_EMAIL', 'noreply@alexdesign.com')
             
-            print(f"Attempting to send email from {from_email} to {recipient_email}")
+            logger.debug(f"Attempting to send email from {from_email} to {recipient_email}")
             
             # Send email
             success = send_mail(
@@ -280,27 +280,24 @@ This email was automatically generated from your website.
             
             if success:
                 logger.info(f"Contact email sent successfully from {email}")
-                print(f"Professional email template sent successfully!")
                 return True
             else:
                 logger.error(f"Failed to send contact email from {email}")
-                print(f"Email sending failed!")
                 return False
                 
         except Exception as e:
             error_msg = str(e)
             logger.error(f"Error sending contact email: {error_msg}")
-            print(f"Email error: {error_msg}")
             
-            # Enhanced debugging for production
-            print(f"Email configuration debug:")
-            print(f"  EMAIL_HOST_USER: {'SET' if getattr(settings, 'EMAIL_HOST_USER', '') else 'NOT SET'}")
-            print(f"  EMAIL_HOST_PASSWORD: {'SET' if getattr(settings, 'EMAIL_HOST_PASSWORD', '') else 'NOT SET'}")
-            print(f"  EMAIL_HOST: {getattr(settings, 'EMAIL_HOST', 'NOT SET')}")
-            print(f"  EMAIL_PORT: {getattr(settings, 'EMAIL_PORT', 'NOT SET')}")
-            print(f"  EMAIL_USE_TLS: {getattr(settings, 'EMAIL_USE_TLS', 'NOT SET')}")
-            print(f"  FROM_EMAIL: {from_email}")
-            print(f"  TO_EMAIL: {recipient_email}")
+            # Configuration details for debugging delivery problems
+            logger.debug(
+                f"Email configuration: EMAIL_HOST_USER={'SET' if getattr(settings, 'EMAIL_HOST_USER', '') else 'NOT SET'}, "
+                f"EMAIL_HOST_PASSWORD={'SET' if getattr(settings, 'EMAIL_HOST_PASSWORD', '') else 'NOT SET'}, "
+                f"EMAIL_HOST={getattr(settings, 'EMAIL_HOST', 'NOT SET')}, "
+                f"EMAIL_PORT={getattr(settings, 'EMAIL_PORT', 'NOT SET')}, "
+                f"EMAIL_USE_TLS={getattr(settings, 'EMAIL_USE_TLS', 'NOT SET')}, "
+                f"FROM_EMAIL={from_email}, TO_EMAIL={recipient_email}"
+            )
             
             # Don't raise the exception, just return False
             return False
@@ -313,3 +310,16 @@ This email was automatically generated from your website.
     def save(self):
         """Send the email when save is called"""
         return self.send_email()
+
+
+def send_contact_email(data):
+    """
+    Validate already-accepted contact form data and send the email.
+    Runs outside the request (Celery task or background thread)
+    """
+    serializer = ContactSerializer(data=data)
+    if not serializer.is_valid():
+        logger.error(f"Dropping invalid contact form data: {serializer.errors}")
+        return False
+    return serializer.send_email()
+
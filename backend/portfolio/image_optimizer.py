@@ -8,10 +8,12 @@ import logging
 import time
 import gc
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from PIL import Image, ImageOps
 from django.conf import settings
 from django.core.files import File
 from django.core.files.storage import default_storage
+from .utils import bulk_unlink, project_folder, service_folder
 import uuid
 from datetime import datetime
 
@@ -49,6 +51,7 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+
 class ImageOptimizer:
     """
     Handles automatic image optimization for projects and services
@@ -121,9 +124,15 @@ class ImageOptimizer:
                 cls._optimize_main_image(project, project_folder)
             
             # Optimize album images
-            for album_image in project.album_images.all():
-                cls._optimize_album_image(album_image, project_folder)
+            cls._run_album_pipeline(
+                project.album_images.all(), project_folder, cls._update_project_album_optimized_paths
+            )
                 
+            # The per-row path saves skip the storage scan invalidation, so the
+            # new .webp files are accounted for once here
+            from .models import StorageStat
+            StorageStat.mark_stale()
+            
             logger.info(f"Successfully optimized all images for project: {project.title}")
             
         except Exception as e:
@@ -144,28 +153,77 @@ class ImageOptimizer:
                 cls._optimize_service_icon(service, service_folder)
             
             # Optimize album images
-            for album_image in service.album_images.all():
-                cls._optimize_service_album_image(album_image, service_folder)
+            cls._run_album_pipeline(
+                service.album_images.all(), service_folder, cls._update_service_album_optimized_paths
+            )
                 
+            # The per-row path saves skip the storage scan invalidation, so the
+            # new .webp files are accounted for once here
+            from .models import StorageStat
+            StorageStat.mark_stale()
+            
             logger.info(f"Successfully optimized all images for service: {service.name}")
             
         except Exception as e:
             logger.error(f"Error optimizing service images for {service.name}: {str(e)}")
             # Don't fail the service creation if optimization fails
     
+    @classmethod
+    def _run_album_pipeline(cls, album_images, folder, update_paths):
+        """
+        Encode album images on a small thread pool and persist their paths as each one finishes
+        Pillow releases the GIL while decoding/encoding, so the next image is decoded while the
+        previous one is still being encoded. Database writes stay on the calling thread.
+        """
+        workers = max(1, getattr(settings, 'IMAGE_OPTIMIZATION_THREADS', 1))
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='image-encode') as pool:
+            futures = {
+                pool.submit(cls._encode_album_image, album_image.image.path, folder): album_image
+                for album_image in album_images if album_image.image
+            }
+            
+            for future in as_completed(futures):
+                album_image = futures[future]
+                try:
+                    webp_album_folder, name_without_ext = future.result()
+                    update_paths(album_image, webp_album_folder, name_without_ext)
+                    logger.info(f"Optimized album image: {os.path.basename(album_image.image.name)}")
+                except Exception as e:
+                    logger.error(f"Error optimizing album image {album_image.image.name}: {str(e)}")
+    
+    @classmethod
+    def _encode_album_image(cls, original_path, folder):
+        """
+        Create the WebP version and thumbnails of an album image (file work only, no database access)
+        Returns the output folder and base name used for the optimized files
+        """
+        # Create webp/album folder
+        webp_album_folder = os.path.join(folder, 'webp', 'album')
+        os.makedirs(webp_album_folder, exist_ok=True)
+        
+        # Get original image info
+        original_filename = os.path.basename(original_path)
+        name_without_ext = os.path.splitext(original_filename)[0]
+        
+        # Create optimized WebP version
+        webp_path = os.path.join(webp_album_folder, f"{name_without_ext}.webp")
+        cls._create_optimized_webp(original_path, webp_path, 'album')
+        
+        # Create thumbnails
+        cls._create_thumbnails(original_path, webp_album_folder, name_without_ext, 'album')
+        
+        return webp_album_folder, name_without_ext
+    
     @classmethod
     def _get_project_folder(cls, project):
-        """Get the project folder path"""
-        from django.utils.text import slugify
-        project_name = slugify(project.title)[:50]
-        return os.path.join(settings.MEDIA_ROOT, 'projects', project_name)
+        """Get the project folder path (uses the stored folder_slug when available)"""
+        return project_folder(project.folder_slug or project.build_folder_slug())
     
     @classmethod
     def _get_service_folder(cls, service):
-        """Get the service folder path"""
-        from django.utils.text import slugify
-        service_name = slugify(service.name)[:50]
-        return os.path.join(settings.MEDIA_ROOT, 'services', service_name)
+        """Get the service folder path (uses the stored folder_slug when available)"""
+        return service_folder(service.folder_slug or service.build_folder_slug())
     
     @classmethod
     def _optimize_main_image(cls, project, project_folder):
@@ -216,18 +274,12 @@ class ImageOptimizer:
             project.optimized_image_large = f"{webp_folder_rel}/{base_name}_large.webp"
             
             # Save without triggering signals
-            from django.db.models.signals import post_save
-            from .signals import optimize_project_images_on_save
-            post_save.disconnect(optimize_project_images_on_save, sender=type(project))
-            
-            try:
+            from .signals import suppress_optimization_signals
+            with suppress_optimization_signals():
                 project.save(update_fields=[
                     'original_file_path', 'optimized_image', 'optimized_image_small', 
                     'optimized_image_medium', 'optimized_image_large'
                 ])
-            finally:
-                # Reconnect the signal
-                post_save.connect(optimize_project_images_on_save, sender=type(project))
                 
             logger.info(f"Updated optimized image paths for project: {project.title}")
             
@@ -238,26 +290,13 @@ class ImageOptimizer:
     def _optimize_album_image(cls, album_image, project_folder):
         """Optimize a project album image"""
         try:
-            # Create webp/album folder
-            webp_album_folder = os.path.join(project_folder, 'webp', 'album')
-            os.makedirs(webp_album_folder, exist_ok=True)
-            
-            # Get original image info
-            original_path = album_image.image.path
-            original_filename = os.path.basename(original_path)
-            name_without_ext = os.path.splitext(original_filename)[0]
-            
-            # Create optimized WebP version
-            webp_path = os.path.join(webp_album_folder, f"{name_without_ext}.webp")
-            cls._create_optimized_webp(original_path, webp_path, 'album')
-            
-            # Create thumbnails
-            cls._create_thumbnails(original_path, webp_album_folder, name_without_ext, 'album')
+            # Create optimized WebP version and thumbnails
+            webp_album_folder, name_without_ext = cls._encode_album_image(album_image.image.path, project_folder)
             
             # Update the album image model with optimized image paths
             cls._update_project_album_optimized_paths(album_image, webp_album_folder, name_without_ext)
             
-            logger.info(f"Optimized album image: {original_filename}")
+            logger.info(f"Optimized album image: {os.path.basename(album_image.image.path)}")
             
         except Exception as e:
             logger.error(f"Error optimizing album image {album_image.image.name}: {str(e)}")
@@ -283,18 +322,12 @@ class ImageOptimizer:
             album_image.optimized_image_large = f"{webp_folder_rel}/{base_name}_large.webp"
             
             # Save without triggering signals
-            from django.db.models.signals import post_save
-            from .signals import optimize_project_album_image_on_save
-            post_save.disconnect(optimize_project_album_image_on_save, sender=type(album_image))
-            
-            try:
+            from .signals import suppress_optimization_signals
+            with suppress_optimization_signals():
                 album_image.save(update_fields=[
                     'original_file_path', 'optimized_image', 'optimized_image_small', 
                     'optimized_image_medium', 'optimized_image_large'
                 ])
-            finally:
-                # Reconnect the signal
-                post_save.connect(optimize_project_album_image_on_save, sender=type(album_image))
                 
             logger.info(f"Updated optimized image paths for album image: {album_image.id}")
             
@@ -350,18 +383,12 @@ class ImageOptimizer:
             service.optimized_icon_large = f"{webp_folder_rel}/{base_name}_large.webp"
             
             # Save without triggering signals
-            from django.db.models.signals import post_save
-            from .signals import optimize_service_images_on_save
-            post_save.disconnect(optimize_service_images_on_save, sender=type(service))
-            
-            try:
+            from .signals import suppress_optimization_signals
+            with suppress_optimization_signals():
                 service.save(update_fields=[
                     'original_file_path', 'optimized_icon', 'optimized_icon_small', 
                     'optimized_icon_medium', 'optimized_icon_large'
                 ])
-            finally:
-                # Reconnect the signal
-                post_save.connect(optimize_service_images_on_save, sender=type(service))
                 
             logger.info(f"Updated optimized icon paths for service: {service.name}")
             
@@ -372,26 +399,13 @@ class ImageOptimizer:
     def _optimize_service_album_image(cls, album_image, service_folder):
         """Optimize a service album image"""
         try:
-            # Create webp/album folder
-            webp_album_folder = os.path.join(service_folder, 'webp', 'album')
-            os.makedirs(webp_album_folder, exist_ok=True)
-            
-            # Get original image info
-            original_path = album_image.image.path
-            original_filename = os.path.basename(original_path)
-            name_without_ext = os.path.splitext(original_filename)[0]
-            
-            # Create optimized WebP version
-            webp_path = os.path.join(webp_album_folder, f"{name_without_ext}.webp")
-            cls._create_optimized_webp(original_path, webp_path, 'album')
-            
-            # Create thumbnails
-            cls._create_thumbnails(original_path, webp_album_folder, name_without_ext, 'album')
+            # Create optimized WebP version and thumbnails
+            webp_album_folder, name_without_ext = cls._encode_album_image(album_image.image.path, service_folder)
             
             # Update the service album image model with optimized image paths
             cls._update_service_album_optimized_paths(album_image, webp_album_folder, name_without_ext)
             
-            logger.info(f"Optimized service album image: {original_filename}")
+            logger.info(f"Optimized service album image: {os.path.basename(album_image.image.path)}")
             
         except Exception as e:
             logger.error(f"Error optimizing service album image {album_image.image.name}: {str(e)}")
@@ -417,18 +431,12 @@ class ImageOptimizer:
             album_image.optimized_image_large = f"{webp_folder_rel}/{base_name}_large.webp"
             
             # Save without triggering signals
-            from django.db.models.signals import post_save
-            from .signals import optimize_service_album_image_on_save
-            post_save.disconnect(optimize_service_album_image_on_save, sender=type(album_image))
-            
-            try:
+            from .signals import suppress_optimization_signals
+            with suppress_optimization_signals():
                 album_image.save(update_fields=[
                     'original_file_path', 'optimized_image', 'optimized_image_small', 
                     'optimized_image_medium', 'optimized_image_large'
                 ])
-            finally:
-                # Reconnect the signal
-                post_save.connect(optimize_service_album_image_on_save, sender=type(album_image))
                 
             logger.info(f"Updated optimized image paths for service album image: {album_image.id}")
             
@@ -660,6 +668,80 @@ class ImageOptimizer:
                     # Convert any other modes to RGB
                     img = img.convert('RGB')
                 
+                # Encoder settings are the same for every size, so build them once
+                if cls.PRODUCTION_MODE and cls.WEBP_LOSSLESS:
+                    # Lossless WebP for maximum quality preservation
+                    save_kwargs = {
+                        'format': 'WEBP',
+                        'lossless': True,
+                        'method': cls.WEBP_METHOD,
+                        'optimize': True
+                    }
+                    
+                    # Add advanced quality settings if available and safe
+                    if cls.AWS_SAFE_MODE:
+                        try:
+                            if cls.ALPHA_QUALITY:
+                                save_kwargs['alpha_quality'] = cls.ALPHA_QUALITY
+                        except:
+                            pass  # Skip if not supported
+                    else:
+                        # Try advanced features if not in AWS safe mode
+                        try:
+                            if cls.ALPHA_QUALITY:
+                                save_kwargs['alpha_quality'] = cls.ALPHA_QUALITY
+                            if cls.USE_SHARP_YUVA:
+                                save_kwargs['sharp_yuva'] = True
+                        except:
+                            pass  # Ignore if PIL version doesn't support these options
+                    
+                    # Preserve metadata if possible and enabled
+                    if cls.PRESERVE_METADATA and hasattr(original_img, 'info') and original_img.info:
+                        try:
+                            if original_img.info.get('exif'):
+                                save_kwargs['exif'] = original_img.info.get('exif', b'')
+                            if cls.PRESERVE_ICC_PROFILE and original_img.info.get('icc_profile'):
+                                save_kwargs['icc_profile'] = original_img.info.get('icc_profile', b'')
+                        except:
+                            pass  # Ignore metadata errors
+                else:
+                    # High quality WebP
+                    save_kwargs = {
+                        'format': 'WEBP',
+                        'quality': cls.WEBP_QUALITY,
+                        'method': cls.WEBP_METHOD,
+                        'optimize': True
+                    }
+                    
+                    # Add advanced quality settings if available and safe
+                    if cls.AWS_SAFE_MODE:
+                        try:
+                            if cls.ALPHA_QUALITY:
+                                save_kwargs['alpha_quality'] = cls.ALPHA_QUALITY
+                        except:
+                            pass  # Skip if not supported
+                    else:
+                        # Try advanced features if not in AWS safe mode
+                        try:
+                            if cls.ALPHA_QUALITY:
+                                save_kwargs['alpha_quality'] = cls.ALPHA_QUALITY
+                            if cls.USE_SHARP_YUVA:
+                                save_kwargs['sharp_yuva'] = True
+                        except:
+                            pass  # Ignore if PIL version doesn't support these options
+                
+                # Basic settings used if the advanced save fails
+                fallback_kwargs = {
+                    'format': 'WEBP',
+                    'quality': cls.WEBP_QUALITY if not cls.WEBP_LOSSLESS else None,
+                    'lossless': cls.WEBP_LOSSLESS,
+                    'method': min(cls.WEBP_METHOD, 4)  # Use safer method
+                }
+                if cls.WEBP_LOSSLESS:
+                    fallback_kwargs.pop('quality', None)
+                else:
+                    fallback_kwargs.pop('lossless', None)
+                
                 # Create thumbnails for each size
                 for size_name, dimensions in cls.THUMBNAIL_SIZES.items():
                     if dimensions is None:  # Skip original size
@@ -712,84 +794,12 @@ class ImageOptimizer:
                     webp_filename = f"{base_name}_{size_name}.webp"
                     webp_path = os.path.join(output_folder, webp_filename)
                     
-                    if cls.PRODUCTION_MODE and cls.WEBP_LOSSLESS:
-                        # Lossless WebP for maximum quality preservation
-                        save_kwargs = {
-                            'format': 'WEBP',
-                            'lossless': True,
-                            'method': cls.WEBP_METHOD,
-                            'optimize': True
-                        }
-                        
-                        # Add advanced quality settings if available and safe
-                        if cls.AWS_SAFE_MODE:
-                            try:
-                                if cls.ALPHA_QUALITY:
-                                    save_kwargs['alpha_quality'] = cls.ALPHA_QUALITY
-                            except:
-                                pass  # Skip if not supported
-                        else:
-                            # Try advanced features if not in AWS safe mode
-                            try:
-                                if cls.ALPHA_QUALITY:
-                                    save_kwargs['alpha_quality'] = cls.ALPHA_QUALITY
-                                if cls.USE_SHARP_YUVA:
-                                    save_kwargs['sharp_yuva'] = True
-                            except:
-                                pass  # Ignore if PIL version doesn't support these options
-                        
-                        # Preserve metadata if possible and enabled
-                        if cls.PRESERVE_METADATA and hasattr(original_img, 'info') and original_img.info:
-                            try:
-                                if original_img.info.get('exif'):
-                                    save_kwargs['exif'] = original_img.info.get('exif', b'')
-                                if cls.PRESERVE_ICC_PROFILE and original_img.info.get('icc_profile'):
-                                    save_kwargs['icc_profile'] = original_img.info.get('icc_profile', b'')
-                            except:
-                                pass  # Ignore metadata errors
-                    else:
-                        # High quality WebP
-                        save_kwargs = {
-                            'format': 'WEBP',
-                            'quality': cls.WEBP_QUALITY,
-                            'method': cls.WEBP_METHOD,
-                            'optimize': True
-                        }
-                        
-                        # Add advanced quality settings if available and safe
-                        if cls.AWS_SAFE_MODE:
-                            try:
-                                if cls.ALPHA_QUALITY:
-                                    save_kwargs['alpha_quality'] = cls.ALPHA_QUALITY
-                            except:
-                                pass  # Skip if not supported
-                        else:
-                            # Try advanced features if not in AWS safe mode
-                            try:
-                                if cls.ALPHA_QUALITY:
-                                    save_kwargs['alpha_quality'] = cls.ALPHA_QUALITY
-                                if cls.USE_SHARP_YUVA:
-                                    save_kwargs['sharp_yuva'] = True
-                            except:
-                                pass  # Ignore if PIL version doesn't support these options
-                    
                     # Save with error handling and fallbacks
                     try:
                         thumbnail.save(webp_path, **save_kwargs)
                     except Exception as save_error:
                         logger.warning(f"Advanced WebP thumbnail save failed, trying basic save: {str(save_error)}")
                         # Fallback to basic save
-                        fallback_kwargs = {
-                            'format': 'WEBP',
-                            'quality': cls.WEBP_QUALITY if not cls.WEBP_LOSSLESS else None,
-                            'lossless': cls.WEBP_LOSSLESS,
-                            'method': min(cls.WEBP_METHOD, 4)  # Use safer method
-                        }
-                        if cls.WEBP_LOSSLESS:
-                            fallback_kwargs.pop('quality', None)
-                        else:
-                            fallback_kwargs.pop('lossless', None)
-                        
                         thumbnail.save(webp_path, **fallback_kwargs)
                     
                     # Set proper permissions
@@ -1103,6 +1113,26 @@ class ImageOptimizer:
             logger.error(f"Individual file cleanup also failed for {folder_path}: {str(cleanup_e)}")
             return False
 
+    @classmethod
+    def optimized_variant_paths(cls, original_path):
+        """
+        Return the existing optimized versions (main, sized and padded webp) of an image
+        """
+        image_dir = os.path.dirname(original_path)
+        name_without_ext = os.path.splitext(os.path.basename(original_path))[0]
+        
+        webp_folder = os.path.join(image_dir, 'webp')
+        if not os.path.exists(webp_folder):
+            return []
+        
+        candidates = [os.path.join(webp_folder, f"{name_without_ext}.webp")]
+        for size_name in cls.THUMBNAIL_SIZES.keys():
+            if size_name != 'original':
+                candidates.append(os.path.join(webp_folder, f"{name_without_ext}_{size_name}.webp"))
+                candidates.append(os.path.join(webp_folder, f"{name_without_ext}_{size_name}_padded.webp"))
+        
+        return [path for path in candidates if os.path.exists(path)]
+
     @classmethod
     def delete_image_file(cls, image_field):
         """
@@ -1124,33 +1154,11 @@ class ImageOptimizer:
                 
                 # Try to delete optimized versions if they exist
                 try:
-                    # Get the directory and filename
-                    image_dir = os.path.dirname(original_path)
-                    image_filename = os.path.basename(original_path)
-                    name_without_ext = os.path.splitext(image_filename)[0]
-                    
-                    # Check for webp folder
-                    webp_folder = os.path.join(image_dir, 'webp')
-                    if os.path.exists(webp_folder):
-                        # Look for optimized versions
-                        for size_name in cls.THUMBNAIL_SIZES.keys():
-                            if size_name != 'original':
-                                webp_path = os.path.join(webp_folder, f"{name_without_ext}_{size_name}.webp")
-                                if os.path.exists(webp_path):
-                                    cls._force_delete_file(webp_path)
-                                    logger.info(f"Deleted optimized image: {webp_path}")
-                                
-                                # Also check for padded versions
-                                padded_path = os.path.join(webp_folder, f"{name_without_ext}_{size_name}_padded.webp")
-                                if os.path.exists(padded_path):
-                                    cls._force_delete_file(padded_path)
-                                    logger.info(f"Deleted padded image: {padded_path}")
-                        
-                        # Check for main webp version
-                        main_webp = os.path.join(webp_folder, f"{name_without_ext}.webp")
-                        if os.path.exists(main_webp):
-                            cls._force_delete_file(main_webp)
-                            logger.info(f"Deleted main webp image: {main_webp}")
+                    # Unlink them concurrently rather than one after another
+                    existing = cls.optimized_variant_paths(original_path)
+                    deleted = bulk_unlink(existing, remove=cls._force_delete_file)
+                    if existing:
+                        logger.info(f"Deleted {deleted}/{len(existing)} optimized versions of: {os.path.basename(original_path)}")
                             
                 except Exception as webp_error:
                     logger.warning(f"Error cleaning up optimized images: {str(webp_error)}")
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.4 on 2026-10-15 12:00
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def populate_folder_slugs(apps, schema_editor):
+    """
+    Fill folder_slug for existing rows from their current title/name.
+    """
+    Project = apps.get_model('portfolio', 'Project')
+    Service = apps.get_model('portfolio', 'Service')
+    
+    projects = list(Project.objects.only('id', 'title'))
+    for project in projects:
+        project.folder_slug = slugify(project.title)[:50]
+    Project.objects.bulk_update(projects, ['folder_slug'])
+    
+    services = list(Service.objects.only('id', 'name'))
+    for service in services:
+        service.folder_slug = slugify(service.name)[:50]
+    Service.objects.bulk_update(services, ['folder_slug'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0029_reset_category_ordering'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='folder_slug',
+            field=models.SlugField(blank=True, editable=False, help_text="Name of the project's media folder"),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='folder_slug',
+            field=models.SlugField(blank=True, editable=False, help_text="Name of the service's media folder"),
+        ),
+        migrations.RunPython(populate_folder_slugs, migrations.RunPython.noop),
+    ]
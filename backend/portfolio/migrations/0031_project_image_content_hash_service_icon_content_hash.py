@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-15 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0030_project_folder_slug_service_folder_slug'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='image_content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='BLAKE2 fingerprint of the uploaded main image', max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='icon_content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='BLAKE2 fingerprint of the uploaded icon', max_length=64, null=True),
+        ),
+    ]
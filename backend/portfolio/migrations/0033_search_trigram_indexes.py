@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+# Expression indexes match what Django emits for __icontains on PostgreSQL
+# (UPPER(col::text) LIKE UPPER('%term%')), so substring search can use them.
+# pg_trgm is optional: without it the indexes are skipped and icontains
+# falls back to a sequential scan as before.
+TRIGRAM_INDEXES = [
+    ('portfolio_project_title_trgm', 'portfolio_project', 'title'),
+    ('portfolio_project_description_trgm', 'portfolio_project', 'description'),
+    ('portfolio_service_name_trgm', 'portfolio_service', 'name'),
+    ('portfolio_service_description_trgm', 'portfolio_service', 'description'),
+]
+
+CREATE_SQL = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+%s
+    END IF;
+END
+$$;
+""" % "\n".join(
+    f'        CREATE INDEX IF NOT EXISTS {index} ON {table} USING gin (UPPER({column}::text) gin_trgm_ops);'
+    for index, table, column in TRIGRAM_INDEXES
+)
+
+DROP_SQL = "\n".join(f"DROP INDEX IF EXISTS {index};" for index, _, _ in TRIGRAM_INDEXES)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0032_project_service_search_vector'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_SQL, reverse_sql=DROP_SQL),
+    ]
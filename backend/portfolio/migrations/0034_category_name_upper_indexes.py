@@ -0,0 +1,30 @@
+# Generated by Django 5.2.4 on 2026-10-15 23:12
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0033_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='projectcategory',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='projcat_name_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectsubcategory',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='projsubcat_name_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='servicecategory',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='servcat_name_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='servicesubcategory',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='servsubcat_name_upper_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.4 on 2026-10-15 23:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0034_category_name_upper_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StorageStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_bytes', models.BigIntegerField(default=0)),
+                ('file_count', models.PositiveIntegerField(default=0)),
+                ('stale', models.BooleanField(default=True)),
+                ('scanned_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Storage Statistics',
+                'verbose_name_plural': 'Storage Statistics',
+            },
+        ),
+    ]
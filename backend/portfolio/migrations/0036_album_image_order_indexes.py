@@ -0,0 +1,21 @@
+# Generated by Django 5.2.4 on 2026-10-15 23:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0035_storagestat'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='projectimage',
+            index=models.Index(fields=['project', 'order', 'id'], name='projimg_por_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='serviceimage',
+            index=models.Index(fields=['service', 'order', 'id'], name='servimg_sor_idx'),
+        ),
+    ]
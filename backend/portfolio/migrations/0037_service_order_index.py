@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-15 23:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0036_album_image_order_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['order', 'name'], name='portfolio_s_order_b373cb_idx'),
+        ),
+    ]
@@ -1,8 +1,12 @@
 from django.db import models
+from django.db.models.functions import Upper
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 import os
 import uuid
 import shutil
 import logging
+import threading
 from django.utils.text import slugify
 from django.core.files.storage import default_storage
 from django.contrib.auth.models import AbstractUser
@@ -18,6 +22,8 @@ class ProjectCategory(models.Model):
     class Meta:
         verbose_name_plural = "Project Categories"
         ordering = ['name']
+        # The list filters match names with __iexact, i.e. UPPER(name) = UPPER(value)
+        indexes = [models.Index(Upper('name'), name='projcat_name_upper_idx')]
     
     def __str__(self):
         return self.name
@@ -32,6 +38,8 @@ class ProjectSubcategory(models.Model):
         verbose_name_plural = "Project Subcategories"
         unique_together = ['name', 'category']
         ordering = ['category__name', 'name']
+        # The list filters match names with __iexact, i.e. UPPER(name) = UPPER(value)
+        indexes = [models.Index(Upper('name'), name='projsubcat_name_upper_idx')]
     
     def __str__(self):
         return f"{self.category.name} - {self.name}"
@@ -44,6 +52,8 @@ class ServiceCategory(models.Model):
     class Meta:
         verbose_name_plural = "Service Categories"
         ordering = ['name']
+        # The list filters match names with __iexact, i.e. UPPER(name) = UPPER(value)
+        indexes = [models.Index(Upper('name'), name='servcat_name_upper_idx')]
     
     def __str__(self):
         return self.name
@@ -58,6 +68,8 @@ class ServiceSubcategory(models.Model):
         verbose_name_plural = "Service Subcategories"
         unique_together = ['name', 'category']
         ordering = ['category__name', 'name']
+        # The list filters match names with __iexact, i.e. UPPER(name) = UPPER(value)
+        indexes = [models.Index(Upper('name'), name='servsubcat_name_upper_idx')]
     
     def __str__(self):
         return f"{self.category.name} - {self.name}"
@@ -108,7 +120,7 @@ def project_image_upload_path(instance, filename):
         
         if instance.title:
             # Create safe folder name from project title
-            project_folder = slugify(instance.title)[:50]  # Limit length
+            project_folder = instance.folder_slug or slugify(instance.title)[:50]  # Limit length
             
             # Ensure folder name is valid for server filesystem
             if not project_folder or project_folder.startswith('.'):
@@ -156,7 +168,7 @@ def service_icon_upload_path(instance, filename):
         
         if instance.name:
             # Create safe folder name from service name
-            service_folder = slugify(instance.name)[:50]  # Limit length
+            service_folder = instance.folder_slug or slugify(instance.name)[:50]  # Limit length
             
             # Ensure folder name is valid for server filesystem
             if not service_folder or service_folder.startswith('.'):
@@ -204,7 +216,7 @@ def project_album_image_upload_path(instance, filename):
         
         if instance.project and instance.project.title:
             # Create safe folder name from project title
-            project_folder = slugify(instance.project.title)[:50]  # Limit length
+            project_folder = instance.project.folder_slug or slugify(instance.project.title)[:50]  # Limit length
             
             # Ensure folder name is valid for server filesystem
             if not project_folder or project_folder.startswith('.'):
@@ -252,7 +264,7 @@ def service_album_image_upload_path(instance, filename):
         
         if instance.service and instance.service.name:
             # Create safe folder name from service name
-            service_folder = slugify(instance.service.name)[:50]  # Limit length
+            service_folder = instance.service.folder_slug or slugify(instance.service.name)[:50]  # Limit length
             
             # Ensure folder name is valid for server filesystem
             if not service_folder or service_folder.startswith('.'):
@@ -289,6 +301,19 @@ class Project(models.Model):
     # Original file path - store the original unoptimized file path
     original_file_path = models.CharField(max_length=500, blank=True, null=True, help_text="Path to the original unoptimized file")
     
+    # Media folder name - cached slugify(title)[:50], kept in sync by save()
+    folder_slug = models.SlugField(max_length=50, blank=True, editable=False, help_text="Name of the project's media folder")
+    
+    # Fingerprint of the last uploaded main image - re-optimize only when it changes
+    image_content_hash = models.CharField(max_length=64, blank=True, null=True, editable=False, help_text="BLAKE2 fingerprint of the uploaded main image")
+    
+    # Full-text search document, kept up to date by the database (GIN indexed)
+    search_vector = models.GeneratedField(
+        expression=SearchVector('title', 'description', config='english'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+    
     # Optimized image paths - store the .webp paths instead of original
     optimized_image = models.CharField(max_length=500, blank=True, null=True, help_text="Path to the optimized .webp version of the main image")
     optimized_image_small = models.CharField(max_length=500, blank=True, null=True, help_text="Path to the small optimized .webp version")
@@ -321,6 +346,10 @@ class Project(models.Model):
         help_text="Order position for manual arrangement. Lower numbers appear first. Projects are ordered by this field first, then by project_date (newest first)."
     )
     
+    def build_folder_slug(self):
+        """Media folder name for the current title (stored in folder_slug on save)"""
+        return slugify(self.title)[:50]
+    
     def save(self, *args, **kwargs):
         # Check if we're only updating optimized fields (skip cleanup logic)
         update_fields = kwargs.get('update_fields', [])
@@ -329,6 +358,9 @@ class Project(models.Model):
             super().save(*args, **kwargs)
             return
         
+        # Keep the cached media folder name in sync with the title
+        self.folder_slug = self.build_folder_slug()
+        
         # Set default order to next available position if not set
         if not self.order or self.order == 0:
             # Get the primary category for this project
@@ -367,7 +399,7 @@ class Project(models.Model):
         # Handle title change and file reorganization
         if self.pk:
             try:
-                old_instance = Project.objects.get(pk=self.pk)
+                old_instance = Project.objects.only('title', 'image').get(pk=self.pk)
                 
                 # Check if title has changed
                 if old_instance.title != self.title:
@@ -526,6 +558,7 @@ class Project(models.Model):
             models.Index(fields=['order', '-project_date']),
             models.Index(fields=['project_date']),
             models.Index(fields=['order']),
+            GinIndex(fields=['search_vector'], name='portfolio_project_search_gin'),
         ]  # Order by manual order first, then by project_date descending
 
     def get_category_names(self):
@@ -647,45 +680,58 @@ class Project(models.Model):
                 except Exception as e:
                     logger.error(f"Error deleting main project image for {project_title}: {str(e)}")
             
-            # 2. Delete all project album images (this should cascade automatically via foreign key)
-            album_images_count = self.album_images.count()
-            if album_images_count > 0:
-                logger.info(f"Found {album_images_count} album images for project: {project_title}")
-                # The album images will be deleted automatically due to CASCADE foreign key
-                # and their signals will handle file cleanup
+            # 2. Delete all project album rows with one DELETE, skipping the per-row
+            # post_delete signals - their files are removed as one batch instead
+            from django.conf import settings
+            album_images = self.album_images.all()
+            album_paths = [
+                os.path.join(settings.MEDIA_ROOT, name)
+                for name in album_images.exclude(image='').values_list('image', flat=True)
+            ]
+            album_images._raw_delete(album_images.db)
+            if album_paths:
+                logger.info(f"Deleted {len(album_paths)} album images for project: {project_title}")
+                if getattr(settings, 'IMAGE_OPTIMIZATION_USE_CELERY', False):
+                    from django.db import transaction
+                    from .tasks import delete_files_task
+                    transaction.on_commit(lambda: delete_files_task.delay(album_paths))
+                else:
+                    from .utils import bulk_unlink
+                    bulk_unlink(album_paths)
             
             # 3. Delete the entire project folder using ImageOptimizer
-            try:
-                # Longer delay to allow file handles to close, especially for optimized images
-                import time
-                import gc
-                gc.collect()
-                time.sleep(1.0)
-                gc.collect()
-                time.sleep(1.0)
+            # (deferred to the Celery cleanup queue by the post_delete signal when enabled)
+            if not getattr(settings, 'IMAGE_OPTIMIZATION_USE_CELERY', False):
+                try:
+                    # Longer delay to allow file handles to close, especially for optimized images
+                    import time
+                    import gc
+                    gc.collect()
+                    time.sleep(1.0)
+                    gc.collect()
+                    time.sleep(1.0)
                 
-                from .image_optimizer import ImageOptimizer
-                folder_deleted = ImageOptimizer.delete_project_folder(self)
-                if folder_deleted:
-                    logger.info(f"Successfully deleted project folder for: {project_title}")
-                else:
-                    logger.warning(f"Project folder deletion returned False for: {project_title}")
-            except Exception as e:
-                logger.error(f"Error deleting project folder for {project_title}: {str(e)}")
+                    from .image_optimizer import ImageOptimizer
+                    folder_deleted = ImageOptimizer.delete_project_folder(self)
+                    if folder_deleted:
+                        logger.info(f"Successfully deleted project folder for: {project_title}")
+                    else:
+                        logger.warning(f"Project folder deletion returned False for: {project_title}")
+                except Exception as e:
+                    logger.error(f"Error deleting project folder for {project_title}: {str(e)}")
                 
-                # Fallback: Try to delete folder manually
-                try:
-                    from django.conf import settings
-                    project_folder_name = slugify(project_title)[:50]
-                    if project_folder_name:
-                        project_folder_path = os.path.join(settings.MEDIA_ROOT, 'projects', project_folder_name)
-                        if os.path.exists(project_folder_path):
-                            shutil.rmtree(project_folder_path)
-                            logger.info(f"Fallback deletion successful for project folder: {project_folder_path}")
-                        else:
-                            logger.info(f"Project folder not found during fallback: {project_folder_path}")
-                except Exception as fallback_error:
-                    logger.error(f"Fallback folder deletion also failed for {project_title}: {str(fallback_error)}")
+                    # Fallback: Try to delete folder manually
+                    try:
+                        project_folder_name = self.folder_slug
+                        if project_folder_name:
+                            project_folder_path = os.path.join(settings.MEDIA_ROOT, 'projects', project_folder_name)
+                            if os.path.exists(project_folder_path):
+                                shutil.rmtree(project_folder_path)
+                                logger.info(f"Fallback deletion successful for project folder: {project_folder_path}")
+                            else:
+                                logger.info(f"Project folder not found during fallback: {project_folder_path}")
+                    except Exception as fallback_error:
+                        logger.error(f"Fallback folder deletion also failed for {project_title}: {str(fallback_error)}")
             
             # 4. Perform the actual model deletion
             super().delete(*args, **kwargs)
@@ -711,6 +757,19 @@ class Service(models.Model):
     # Original file path - store the original unoptimized file path
     original_file_path = models.CharField(max_length=500, blank=True, null=True, help_text="Path to the original unoptimized file")
     
+    # Media folder name - cached slugify(name)[:50], kept in sync by save()
+    folder_slug = models.SlugField(max_length=50, blank=True, editable=False, help_text="Name of the service's media folder")
+    
+    # Fingerprint of the last uploaded icon - re-optimize only when it changes
+    icon_content_hash = models.CharField(max_length=64, blank=True, null=True, editable=False, help_text="BLAKE2 fingerprint of the uploaded icon")
+    
+    # Full-text search document, kept up to date by the database (GIN indexed)
+    search_vector = models.GeneratedField(
+        expression=SearchVector('name', 'description', config='english'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+    
     # Optimized icon paths - store the .webp paths instead of original
     optimized_icon = models.CharField(max_length=500, blank=True, null=True, help_text="Path to the optimized .webp version of the icon")
     optimized_icon_small = models.CharField(max_length=500, blank=True, null=True, help_text="Path to the small optimized .webp version")
@@ -739,6 +798,10 @@ class Service(models.Model):
         help_text="Order position for manual arrangement. Lower numbers appear first. Services are ordered by this field first, then by name."
     )
     
+    def build_folder_slug(self):
+        """Media folder name for the current name (stored in folder_slug on save)"""
+        return slugify(self.name)[:50]
+    
     def save(self, *args, **kwargs):
         # Check if we're only updating optimized fields (skip cleanup logic)
         update_fields = kwargs.get('update_fields', [])
@@ -747,6 +810,9 @@ class Service(models.Model):
             super().save(*args, **kwargs)
             return
         
+        # Keep the cached media folder name in sync with the name
+        self.folder_slug = self.build_folder_slug()
+        
         # Set default order to next available position if not set
         if not self.order or self.order == 0:
             # Use a more efficient approach to avoid aggregate on every save
@@ -762,7 +828,7 @@ class Service(models.Model):
         # Handle name change and file reorganization
         if self.pk:
             try:
-                old_instance = Service.objects.get(pk=self.pk)
+                old_instance = Service.objects.only('name', 'icon').get(pk=self.pk)
                 
                 # Check if name has changed
                 if old_instance.name != self.name:
@@ -914,6 +980,10 @@ class Service(models.Model):
 
     class Meta:
         ordering = ['order', 'name']  # Order by manual order first, then by name
+        indexes = [
+            models.Index(fields=['order', 'name']),
+            GinIndex(fields=['search_vector'], name='portfolio_service_search_gin'),
+        ]
 
     def get_category_names(self):
         """Get all category names as a list"""
@@ -1034,37 +1104,50 @@ class Service(models.Model):
                 except Exception as e:
                     logger.error(f"Error deleting service icon for {service_name}: {str(e)}")
             
-            # 2. Delete all service album images (this should cascade automatically via foreign key)
-            album_images_count = self.album_images.count()
-            if album_images_count > 0:
-                logger.info(f"Found {album_images_count} album images for service: {service_name}")
-                # The album images will be deleted automatically due to CASCADE foreign key
-                # and their signals will handle file cleanup
+            # 2. Delete all service album rows with one DELETE, skipping the per-row
+            # post_delete signals - their files are removed as one batch instead
+            from django.conf import settings
+            album_images = self.album_images.all()
+            album_paths = [
+                os.path.join(settings.MEDIA_ROOT, name)
+                for name in album_images.exclude(image='').values_list('image', flat=True)
+            ]
+            album_images._raw_delete(album_images.db)
+            if album_paths:
+                logger.info(f"Deleted {len(album_paths)} album images for service: {service_name}")
+                if getattr(settings, 'IMAGE_OPTIMIZATION_USE_CELERY', False):
+                    from django.db import transaction
+                    from .tasks import delete_files_task
+                    transaction.on_commit(lambda: delete_files_task.delay(album_paths))
+                else:
+                    from .utils import bulk_unlink
+                    bulk_unlink(album_paths)
             
             # 3. Delete the entire service folder using ImageOptimizer
-            try:
-                from .image_optimizer import ImageOptimizer
-                folder_deleted = ImageOptimizer.delete_service_folder(self)
-                if folder_deleted:
-                    logger.info(f"Successfully deleted service folder for: {service_name}")
-                else:
-                    logger.warning(f"Service folder deletion returned False for: {service_name}")
-            except Exception as e:
-                logger.error(f"Error deleting service folder for {service_name}: {str(e)}")
-                
-                # Fallback: Try to delete folder manually
+            # (deferred to the Celery cleanup queue by the post_delete signal when enabled)
+            if not getattr(settings, 'IMAGE_OPTIMIZATION_USE_CELERY', False):
                 try:
-                    from django.conf import settings
-                    service_folder_name = slugify(service_name)[:50]
-                    if service_folder_name:
-                        service_folder_path = os.path.join(settings.MEDIA_ROOT, 'services', service_folder_name)
-                        if os.path.exists(service_folder_path):
-                            shutil.rmtree(service_folder_path)
-                            logger.info(f"Fallback deletion successful for service folder: {service_folder_path}")
-                        else:
-                            logger.info(f"Service folder not found during fallback: {service_folder_path}")
-                except Exception as fallback_error:
-                    logger.error(f"Fallback folder deletion also failed for {service_name}: {str(fallback_error)}")
+                    from .image_optimizer import ImageOptimizer
+                    folder_deleted = ImageOptimizer.delete_service_folder(self)
+                    if folder_deleted:
+                        logger.info(f"Successfully deleted service folder for: {service_name}")
+                    else:
+                        logger.warning(f"Service folder deletion returned False for: {service_name}")
+                except Exception as e:
+                    logger.error(f"Error deleting service folder for {service_name}: {str(e)}")
+                
+                    # Fallback: Try to delete folder manually
+                    try:
+                        service_folder_name = self.folder_slug
+                        if service_folder_name:
+                            service_folder_path = os.path.join(settings.MEDIA_ROOT, 'services', service_folder_name)
+                            if os.path.exists(service_folder_path):
+                                shutil.rmtree(service_folder_path)
+                                logger.info(f"Fallback deletion successful for service folder: {service_folder_path}")
+                            else:
+                                logger.info(f"Service folder not found during fallback: {service_folder_path}")
+                    except Exception as fallback_error:
+                        logger.error(f"Fallback folder deletion also failed for {service_name}: {str(fallback_error)}")
             
             # 4. Perform the actual model deletion
             super().delete(*args, **kwargs)
@@ -1125,6 +1208,7 @@ class ProjectImage(models.Model):
     
     class Meta:
         ordering = ['order']
+        indexes = [models.Index(fields=['project', 'order', 'id'], name='projimg_por_idx')]
         verbose_name = "Project Image"
         verbose_name_plural = "Project Images"
     
@@ -1144,7 +1228,7 @@ class ProjectImage(models.Model):
         # Delete old image if updating and a new image is provided
         if self.pk:
             try:
-                old_instance = ProjectImage.objects.get(pk=self.pk)
+                old_instance = ProjectImage.objects.only('image').get(pk=self.pk)
                 # Check if image field has changed and old image exists
                 if old_instance.image:
                     # Check if image has changed (different scenarios)
@@ -1234,6 +1318,7 @@ class ServiceImage(models.Model):
     
     class Meta:
         ordering = ['order']
+        indexes = [models.Index(fields=['service', 'order', 'id'], name='servimg_sor_idx')]
         verbose_name = "Service Image"
         verbose_name_plural = "Service Images"
     
@@ -1253,7 +1338,7 @@ class ServiceImage(models.Model):
         # Delete old image if updating and a new image is provided
         if self.pk:
             try:
-                old_instance = ServiceImage.objects.get(pk=self.pk)
+                old_instance = ServiceImage.objects.only('image').get(pk=self.pk)
                 # Check if image field has changed and old image exists
                 if old_instance.image:
                     # Check if image has changed (different scenarios)
@@ -1304,6 +1389,90 @@ class ServiceImage(models.Model):
         super().delete(*args, **kwargs)
 
 
+# Held while a non-Celery background rescan runs, so reads of a stale scan start at most one
+_storage_refresh_running = threading.Lock()
+
+
+class StorageStat(models.Model):
+    """
+    Result of the last media tree scan (single row, pk=1), so the admin dashboard
+    reads storage usage instead of walking MEDIA_ROOT on every request.
+    Media changes mark it stale and queue a rescan off the request (cleanup
+    worker with Celery, a background thread otherwise)
+    """
+    total_bytes = models.BigIntegerField(default=0)
+    file_count = models.PositiveIntegerField(default=0)
+    stale = models.BooleanField(default=True)
+    scanned_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        verbose_name = "Storage Statistics"
+        verbose_name_plural = "Storage Statistics"
+    
+    def __str__(self):
+        return f"Storage Statistics ({self.file_count} files)"
+    
+    @classmethod
+    def get_usage(cls):
+        """
+        (total bytes, file count) of the media tree from the last scan. Only the very
+        first read scans inline; a stale scan is returned while a rescan is queued
+        """
+        stat = cls.objects.filter(pk=1).first()
+        if stat is None:
+            stat = cls.refresh()
+        elif stat.stale:
+            cls.schedule_refresh()
+        return stat.total_bytes, stat.file_count
+    
+    @classmethod
+    def refresh(cls):
+        """Rescan the media tree and store the totals"""
+        from django.utils import timezone
+        from .utils import scan_media_usage
+        
+        # Clear the flag before scanning, so changes made during the scan mark it stale again
+        cls.objects.update_or_create(pk=1, defaults={'stale': False})
+        total_bytes, file_count = scan_media_usage()
+        cls.objects.filter(pk=1).update(total_bytes=total_bytes, file_count=file_count, scanned_at=timezone.now())
+        return cls.objects.get(pk=1)
+    
+    @classmethod
+    def mark_stale(cls):
+        cls.objects.filter(pk=1).update(stale=True)
+    
+    @classmethod
+    def schedule_refresh(cls):
+        """Rescan off the request: on the cleanup worker with Celery, else on a daemon thread"""
+        from django.conf import settings
+        
+        if getattr(settings, 'IMAGE_OPTIMIZATION_USE_CELERY', False):
+            from .tasks import refresh_storage_stats_task
+            refresh_storage_stats_task.delay()
+            return
+        
+        if not _storage_refresh_running.acquire(blocking=False):
+            return  # A rescan is already running
+        
+        def run():
+            from django.db import connection
+            try:
+                cls.refresh()
+            except Exception as e:
+                logging.getLogger(__name__).error(f"Background storage rescan failed: {e}")
+            finally:
+                _storage_refresh_running.release()
+                connection.close()
+        
+        # Daemon, so an unfinished scan never holds up interpreter exit
+        threading.Thread(target=run, name='storage-stats-refresh', daemon=True).start()
+    
+    @classmethod
+    def media_changed(cls):
+        """Mark the scan stale after media changed and queue a rescan"""
+        cls.mark_stale()
+        cls.schedule_refresh()
+
 class User(AbstractUser):
     email = models.EmailField(unique=True)
     
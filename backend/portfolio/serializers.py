@@ -3,6 +3,26 @@ from .models import (
     Project, Service, ProjectCategory, ProjectSubcategory, 
     ServiceCategory, ServiceSubcategory, ProjectImage, ServiceImage
 )
+from django.db import models
+from django.utils.encoding import iri_to_uri
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _absolute_uri(context, location):
+    """
+    request.build_absolute_uri(location) for site-relative paths, with the
+    scheme/host part (and its ALLOWED_HOSTS check) worked out once per
+    serializer context instead of once per URL field of every item
+    """
+    request = context['request']
+    if not location.startswith('/') or location.startswith('//'):
+        return request.build_absolute_uri(location)
+    base = context.get('_absolute_uri_base')
+    if base is None:
+        base = context['_absolute_uri_base'] = request.build_absolute_uri('/')[:-1]
+    return base + iri_to_uri(location)
 
 class ProjectCategorySimpleSerializer(serializers.ModelSerializer):
     class Meta:
@@ -44,7 +64,7 @@ class ProjectImageSerializer(serializers.ModelSerializer):
                     # Ensure the path is properly formatted
                     clean_path = obj.optimized_image_medium.replace('\\', '/').strip()
                     if clean_path:
-                        return request.build_absolute_uri(f"/media/{clean_path}")
+                        return _absolute_uri(self.context, f"/media/{clean_path}")
                 return f"/media/{obj.optimized_image_medium.replace('\\', '/').strip()}"
             elif hasattr(obj, 'optimized_image') and obj.optimized_image and obj.optimized_image.strip():
                 # Fallback to default optimized image
@@ -52,14 +72,14 @@ class ProjectImageSerializer(serializers.ModelSerializer):
                 if request:
                     clean_path = obj.optimized_image.replace('\\', '/').strip()
                     if clean_path:
-                        return request.build_absolute_uri(f"/media/{clean_path}")
+                        return _absolute_uri(self.context, f"/media/{clean_path}")
                 return f"/media/{obj.optimized_image.replace('\\', '/').strip()}"
             elif hasattr(obj, 'image') and obj.image:
                 # Fallback to original if no optimized version exists
                 try:
                     request = self.context.get('request')
                     if request:
-                        return request.build_absolute_uri(obj.image.url)
+                        return _absolute_uri(self.context, obj.image.url)
                     return obj.image.url
                 except Exception:
                     # If URL building fails, return a safe fallback
@@ -67,7 +87,7 @@ class ProjectImageSerializer(serializers.ModelSerializer):
             return None
         except Exception as e:
             # If URL building fails, return a safe fallback
-            print(f"Error building image URL for ProjectImage {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error building image URL for ProjectImage %s: %s", getattr(obj, 'id', 'unknown'), e)
             return None
     
     def get_original_image_url(self, obj):
@@ -77,20 +97,20 @@ class ProjectImageSerializer(serializers.ModelSerializer):
             if hasattr(obj, 'original_file_path') and obj.original_file_path and obj.original_file_path.strip():
                 request = self.context.get('request')
                 if request:
-                    return request.build_absolute_uri(f"/media/{obj.original_file_path.replace('\\', '/').strip()}")
+                    return _absolute_uri(self.context, f"/media/{obj.original_file_path.replace('\\', '/').strip()}")
                 return f"/media/{obj.original_file_path.replace('\\', '/').strip()}"
             elif hasattr(obj, 'image') and obj.image:
                 # Fallback to original image field
                 try:
                     request = self.context.get('request')
                     if request:
-                        return request.build_absolute_uri(obj.image.url)
+                        return _absolute_uri(self.context, obj.image.url)
                     return obj.image.url
                 except Exception:
                     return f"/media/{obj.image.name}" if obj.image.name else None
             return None
         except Exception as e:
-            print(f"Error building original image URL for ProjectImage {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error building original image URL for ProjectImage %s: %s", getattr(obj, 'id', 'unknown'), e)
             return None
     
     def to_representation(self, instance):
@@ -131,14 +151,14 @@ class ProjectImageSerializer(serializers.ModelSerializer):
                     representation['image_url'] = None
             except Exception as e:
                 # If image URL handling fails, set safe defaults
-                print(f"Error handling image URLs for ProjectImage {getattr(instance, 'id', 'unknown')}: {e}")
+                logger.error("Error handling image URLs for ProjectImage %s: %s", getattr(instance, 'id', 'unknown'), e)
                 representation['image'] = None
                 representation['image_url'] = None
             
             return representation
         except Exception as e:
             # If representation fails completely, return a safe fallback
-            print(f"Error in to_representation for ProjectImage {getattr(instance, 'id', 'unknown')}: {e}")
+            logger.error("Error in to_representation for ProjectImage %s: %s", getattr(instance, 'id', 'unknown'), e)
             return {
                 'id': getattr(instance, 'id', None),
                 'image': None,
@@ -173,7 +193,7 @@ class ServiceImageSerializer(serializers.ModelSerializer):
                     # Ensure the path is properly formatted
                     clean_path = obj.optimized_image_medium.replace('\\', '/').strip()
                     if clean_path:
-                        return request.build_absolute_uri(f"/media/{clean_path}")
+                        return _absolute_uri(self.context, f"/media/{clean_path}")
                 return f"/media/{obj.optimized_image_medium.replace('\\', '/').strip()}"
             elif hasattr(obj, 'optimized_image') and obj.optimized_image and obj.optimized_image.strip():
                 # Fallback to default optimized image
@@ -181,14 +201,14 @@ class ServiceImageSerializer(serializers.ModelSerializer):
                 if request:
                     clean_path = obj.optimized_image.replace('\\', '/').strip()
                     if clean_path:
-                        return request.build_absolute_uri(f"/media/{clean_path}")
+                        return _absolute_uri(self.context, f"/media/{clean_path}")
                 return f"/media/{obj.optimized_image.replace('\\', '/').strip()}"
             elif hasattr(obj, 'image') and obj.image:
                 # Fallback to original if no optimized version exists
                 try:
                     request = self.context.get('request')
                     if request:
-                        return request.build_absolute_uri(obj.image.url)
+                        return _absolute_uri(self.context, obj.image.url)
                     return obj.image.url
                 except Exception:
                     # If URL building fails, return a safe fallback
@@ -196,7 +216,7 @@ class ServiceImageSerializer(serializers.ModelSerializer):
             return None
         except Exception as e:
             # If URL building fails, return a safe fallback
-            print(f"Error building image URL for ServiceImage {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error building image URL for ServiceImage %s: %s", getattr(obj, 'id', 'unknown'), e)
             return None
     
     def get_original_image_url(self, obj):
@@ -206,20 +226,20 @@ class ServiceImageSerializer(serializers.ModelSerializer):
             if hasattr(obj, 'original_file_path') and obj.original_file_path and obj.original_file_path.strip():
                 request = self.context.get('request')
                 if request:
-                    return request.build_absolute_uri(f"/media/{obj.original_file_path.replace('\\', '/').strip()}")
+                    return _absolute_uri(self.context, f"/media/{obj.original_file_path.replace('\\', '/').strip()}")
                 return f"/media/{obj.original_file_path.replace('\\', '/').strip()}"
             elif hasattr(obj, 'image') and obj.image:
                 # Fallback to original image field
                 try:
                     request = self.context.get('request')
                     if request:
-                        return request.build_absolute_uri(obj.image.url)
+                        return _absolute_uri(self.context, obj.image.url)
                     return obj.image.url
                 except Exception:
                     return f"/media/{obj.image.name}" if obj.image.name else None
             return None
         except Exception as e:
-            print(f"Error building original image URL for ServiceImage {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error building original image URL for ServiceImage %s: %s", getattr(obj, 'id', 'unknown'), e)
             return None
     
     def to_representation(self, instance):
@@ -260,14 +280,14 @@ class ServiceImageSerializer(serializers.ModelSerializer):
                     representation['image_url'] = None
             except Exception as e:
                 # If image URL handling fails, set safe defaults
-                print(f"Error handling image URLs for ServiceImage {getattr(instance, 'id', 'unknown')}: {e}")
+                logger.error("Error handling image URLs for ServiceImage %s: %s", getattr(instance, 'id', 'unknown'), e)
                 representation['image'] = None
                 representation['image_url'] = None
             
             return representation
         except Exception as e:
             # If representation fails completely, return a safe fallback
-            print(f"Error in to_representation for ServiceImage {getattr(instance, 'id', 'unknown')}: {e}")
+            logger.error("Error in to_representation for ServiceImage %s: %s", getattr(instance, 'id', 'unknown'), e)
             return {
                 'id': getattr(instance, 'id', None),
                 'image': None,
@@ -282,6 +302,77 @@ class ServiceImageSerializer(serializers.ModelSerializer):
                 'optimized_image_large': None
             }
 
+def _insert_orders(orders):
+    """
+    Final orders for items inserted one after another at the given orders, where
+    each insert shifts everything at or after its order up by one (None = no
+    explicit order). Also returns, for the rows already stored, the thresholds
+    of that shift: a stored row with order s moves up by the number of
+    thresholds <= s (thresholds are non-decreasing)
+    """
+    final = []
+    for order in orders:
+        if order is None or order < 1:
+            final.append(order)
+            continue
+        for earlier, placed in enumerate(final):
+            if placed is not None and placed >= order:
+                final[earlier] = placed + 1
+        final.append(order)
+    placed = sorted(order for order in final if order is not None and order >= 1)
+    return final, [order - index for index, order in enumerate(placed)]
+
+
+class BulkCreateListSerializer(serializers.ListSerializer):
+    """
+    Creates a list payload with one multi-row INSERT (plus one per many-to-many
+    table) instead of a save() per item. Like QuerySet.bulk_create this skips
+    Model.save() and signals, so the bits of save() that matter for new rows
+    (folder_slug, via the model's build_folder_slug) are filled in here, and
+    explicit orders are placed as one-by-one creates would place them, with a
+    single UPDATE ... CASE shifting the stored rows
+    """
+    def create(self, validated_data):
+        model = self.child.Meta.model
+        m2m_fields = [field for field in model._meta.many_to_many if field.name in self.child.fields]
+        
+        if any(field.name == 'order' for field in model._meta.concrete_fields):
+            final, thresholds = _insert_orders([item.get('order') for item in validated_data])
+            if thresholds:
+                model.objects.filter(order__gte=thresholds[0]).update(order=models.Case(
+                    *[models.When(order__gte=threshold, then=models.F('order') + shift)
+                      for shift, threshold in reversed(list(enumerate(thresholds, start=1)))],
+                    default=models.F('order'),
+                    output_field=models.PositiveIntegerField(),
+                ))
+            # validated_data holds this save's own copies of the items
+            for item, order in zip(validated_data, final):
+                if order is not None:
+                    item['order'] = order
+        
+        instances = []
+        relations = []
+        for item in validated_data:
+            relations.append({field.name: item.pop(field.name, []) for field in m2m_fields})
+            instance = model(**item)
+            if hasattr(instance, 'build_folder_slug'):
+                instance.folder_slug = instance.build_folder_slug()
+            instances.append(instance)
+        
+        instances = model.objects.bulk_create(instances, batch_size=500)
+        
+        for field in m2m_fields:
+            through = field.remote_field.through
+            source, target = f"{field.m2m_field_name()}_id", f"{field.m2m_reverse_field_name()}_id"
+            through.objects.bulk_create([
+                through(**{source: instance.pk, target: related.pk})
+                for instance, related_objects in zip(instances, relations)
+                for related in related_objects[field.name]
+            ], batch_size=500)
+        
+        return instances
+
+
 class ProjectSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()  # For reading the full URL
     original_image_url = serializers.SerializerMethodField()  # For original unoptimized image URL
@@ -296,7 +387,8 @@ class ProjectSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Project
-        fields = '__all__'
+        exclude = ['search_vector']
+        list_serializer_class = BulkCreateListSerializer
     
     def get_image_url(self, obj):
         """Get the optimized image URL from the database"""
@@ -305,24 +397,24 @@ class ProjectSerializer(serializers.ModelSerializer):
                 # Use the medium optimized image if available
                 request = self.context.get('request')
                 if request:
-                    return request.build_absolute_uri(f"/media/{obj.optimized_image_medium.replace('\\', '/')}")
+                    return _absolute_uri(self.context, f"/media/{obj.optimized_image_medium.replace('\\', '/')}")
                 return f"/media/{obj.optimized_image_medium.replace('\\', '/')}"
             elif hasattr(obj, 'optimized_image') and obj.optimized_image:
                 # Fallback to default optimized image
                 request = self.context.get('request')
                 if request:
-                    return request.build_absolute_uri(f"/media/{obj.optimized_image.replace('\\', '/')}")
+                    return _absolute_uri(self.context, f"/media/{obj.optimized_image.replace('\\', '/')}")
                 return f"/media/{obj.optimized_image.replace('\\', '/')}"
             elif hasattr(obj, 'image') and obj.image:
                 # Fallback to original if no optimized version exists
                 request = self.context.get('request')
                 if request:
-                    return request.build_absolute_uri(obj.image.url)
+                    return _absolute_uri(self.context, obj.image.url)
                 return obj.image.url
             return None
         except Exception as e:
             # If URL building fails, return a safe fallback
-            print(f"Error building image URL for Project {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error building image URL for Project %s: %s", getattr(obj, 'id', 'unknown'), e)
             return None
     
     def get_original_image_url(self, obj):
@@ -332,20 +424,20 @@ class ProjectSerializer(serializers.ModelSerializer):
             if hasattr(obj, 'original_file_path') and obj.original_file_path and obj.original_file_path.strip():
                 request = self.context.get('request')
                 if request:
-                    return request.build_absolute_uri(f"/media/{obj.original_file_path.replace('\\', '/').strip()}")
+                    return _absolute_uri(self.context, f"/media/{obj.original_file_path.replace('\\', '/').strip()}")
                 return f"/media/{obj.original_file_path.replace('\\', '/').strip()}"
             elif hasattr(obj, 'image') and obj.image:
                 # Fallback to original image field
                 try:
                     request = self.context.get('request')
                     if request:
-                        return request.build_absolute_uri(obj.image.url)
+                        return _absolute_uri(self.context, obj.image.url)
                     return obj.image.url
                 except Exception:
                     return f"/media/{obj.image.name}" if obj.image.name else None
             return None
         except Exception as e:
-            print(f"Error building original image URL for Project {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error building original image URL for Project %s: %s", getattr(obj, 'id', 'unknown'), e)
             return None
     
     def get_category_name(self, obj):
@@ -353,7 +445,7 @@ class ProjectSerializer(serializers.ModelSerializer):
         try:
             return obj.get_category_name()
         except Exception as e:
-            print(f"Error getting category name for Project {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error getting category name for Project %s: %s", getattr(obj, 'id', 'unknown'), e)
             return ""
     
     def get_subcategory_name(self, obj):
@@ -361,7 +453,7 @@ class ProjectSerializer(serializers.ModelSerializer):
         try:
             return obj.get_subcategory_name()
         except Exception as e:
-            print(f"Error getting subcategory name for Project {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error getting subcategory name for Project %s: %s", getattr(obj, 'id', 'unknown'), e)
             return ""
     
     def get_category_names(self, obj):
@@ -369,7 +461,7 @@ class ProjectSerializer(serializers.ModelSerializer):
         try:
             return obj.get_category_names()
         except Exception as e:
-            print(f"Error getting category names for Project {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error getting category names for Project %s: %s", getattr(obj, 'id', 'unknown'), e)
             return []
 
     def get_subcategory_names(self, obj):
@@ -377,23 +469,26 @@ class ProjectSerializer(serializers.ModelSerializer):
         try:
             return obj.get_subcategory_names()
         except Exception as e:
-            print(f"Error getting subcategory names for Project {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error getting subcategory names for Project %s: %s", getattr(obj, 'id', 'unknown'), e)
             return []
     
     def get_album_images_count(self, obj):
         """Get the count of album images - optimized to avoid extra queries"""
         try:
             # Use the annotation if available, otherwise fallback to count
-            return getattr(obj, 'album_images_count_annotated', obj.album_images.count())
+            count = getattr(obj, 'album_images_count_annotated', None)
+            return count if count is not None else obj.album_images.count()
         except Exception as e:
-            print(f"Error getting album images count for Project {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error getting album images count for Project %s: %s", getattr(obj, 'id', 'unknown'), e)
             return 0
     
     def get_featured_album_images(self, obj):
         """Get first few album images for preview - optimized"""
         try:
             # Use prefetched data if available to avoid N+1 queries
-            if hasattr(obj, '_prefetched_objects_cache') and 'album_images' in obj._prefetched_objects_cache:
+            if hasattr(obj, 'featured_album_images_prefetched'):
+                featured_images = obj.featured_album_images_prefetched[:6]  # Already limited by the list prefetch
+            elif hasattr(obj, '_prefetched_objects_cache') and 'album_images' in obj._prefetched_objects_cache:
                 featured_images = list(obj.album_images.all()[:6])  # Limit to 6 for performance
             else:
                 featured_images = obj.album_images.all()[:6]
@@ -402,11 +497,11 @@ class ProjectSerializer(serializers.ModelSerializer):
             try:
                 return ProjectImageSerializer(featured_images, many=True, context=self.context).data
             except Exception as e:
-                print(f"Error serializing featured album images for project {getattr(obj, 'id', 'unknown')}: {e}")
+                logger.error("Error serializing featured album images for project %s: %s", getattr(obj, 'id', 'unknown'), e)
                 # Return empty list if serialization fails
                 return []
         except Exception as e:
-            print(f"Error getting featured album images for project {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error getting featured album images for project %s: %s", getattr(obj, 'id', 'unknown'), e)
             return []
     
     def to_representation(self, instance):
@@ -445,14 +540,14 @@ class ProjectSerializer(serializers.ModelSerializer):
                     representation['image_url'] = None
             except Exception as e:
                 # If image URL handling fails, set safe defaults
-                print(f"Error handling image URLs for Project {getattr(instance, 'id', 'unknown')}: {e}")
+                logger.error("Error handling image URLs for Project %s: %s", getattr(instance, 'id', 'unknown'), e)
                 representation['image'] = None
                 representation['image_url'] = None
             
             return representation
         except Exception as e:
             # If representation fails completely, return a safe fallback
-            print(f"Error in to_representation for Project {getattr(instance, 'id', 'unknown')}: {e}")
+            logger.error("Error in to_representation for Project %s: %s", getattr(instance, 'id', 'unknown'), e)
             return {
                 'id': getattr(instance, 'id', None),
                 'title': getattr(instance, 'title', ''),
@@ -468,6 +563,22 @@ class ProjectSerializer(serializers.ModelSerializer):
             }
 
 
+class RecentProjectSerializer(serializers.ModelSerializer):
+    """Lightweight project card for the admin dashboard"""
+    image_url = serializers.SerializerMethodField()
+    category_names = serializers.SerializerMethodField()
+    
+    # Only these columns are loaded for dashboard rows
+    LOAD_FIELDS = ('id', 'title', 'project_date', 'order', 'image', 'optimized_image', 'optimized_image_medium')
+    
+    class Meta:
+        model = Project
+        fields = ['id', 'title', 'image_url', 'project_date', 'order', 'category_names']
+    
+    get_image_url = ProjectSerializer.get_image_url
+    get_category_names = ProjectSerializer.get_category_names
+
+
 class ServiceSerializer(serializers.ModelSerializer):
     icon_url = serializers.SerializerMethodField()
     original_image_url = serializers.SerializerMethodField()  # For original unoptimized icon URL
@@ -482,7 +593,7 @@ class ServiceSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Service
-        fields = '__all__'
+        exclude = ['search_vector']
     
     def get_icon_url(self, obj):
         """Get the optimized icon URL from the database"""
@@ -495,7 +606,7 @@ class ServiceSerializer(serializers.ModelSerializer):
                     # Ensure the path is properly formatted
                     clean_path = obj.optimized_icon_medium.replace('\\', '/').strip()
                     if clean_path:
-                        return request.build_absolute_uri(f"/media/{clean_path}")
+                        return _absolute_uri(self.context, f"/media/{clean_path}")
                 return f"/media/{obj.optimized_icon_medium.replace('\\', '/').strip()}"
             elif hasattr(obj, 'optimized_icon') and obj.optimized_icon and obj.optimized_icon.strip():
                 # Fallback to default optimized icon
@@ -503,14 +614,14 @@ class ServiceSerializer(serializers.ModelSerializer):
                 if request:
                     clean_path = obj.optimized_icon.replace('\\', '/').strip()
                     if clean_path:
-                        return request.build_absolute_uri(f"/media/{clean_path}")
+                        return _absolute_uri(self.context, f"/media/{clean_path}")
                 return f"/media/{obj.optimized_icon.replace('\\', '/').strip()}"
             elif hasattr(obj, 'icon') and obj.icon:
                 # Fallback to original if no optimized version exists
                 try:
                     request = self.context.get('request')
                     if request:
-                        return request.build_absolute_uri(obj.icon.url)
+                        return _absolute_uri(self.context, obj.icon.url)
                     return obj.icon.url
                 except Exception:
                     # If URL building fails, return a safe fallback
@@ -518,7 +629,7 @@ class ServiceSerializer(serializers.ModelSerializer):
             return None
         except Exception as e:
             # If URL building fails, return a safe fallback
-            print(f"Error building icon URL for Service {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error building icon URL for Service %s: %s", getattr(obj, 'id', 'unknown'), e)
             return None
 
     def get_original_image_url(self, obj):
@@ -528,20 +639,20 @@ class ServiceSerializer(serializers.ModelSerializer):
             if hasattr(obj, 'original_file_path') and obj.original_file_path and obj.original_file_path.strip():
                 request = self.context.get('request')
                 if request:
-                    return request.build_absolute_uri(f"/media/{obj.original_file_path.replace('\\', '/').strip()}")
+                    return _absolute_uri(self.context, f"/media/{obj.original_file_path.replace('\\', '/').strip()}")
                 return f"/media/{obj.original_file_path.replace('\\', '/').strip()}"
             elif hasattr(obj, 'icon') and obj.icon:
                 # Fallback to original icon field
                 try:
                     request = self.context.get('request')
                     if request:
-                        return request.build_absolute_uri(obj.icon.url)
+                        return _absolute_uri(self.context, obj.icon.url)
                     return obj.icon.url
                 except Exception:
                     return f"/media/{obj.icon.name}" if obj.icon.name else None
             return None
         except Exception as e:
-            print(f"Error building original icon URL for Service {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error building original icon URL for Service %s: %s", getattr(obj, 'id', 'unknown'), e)
             return None
 
     def get_category_names(self, obj):
@@ -549,7 +660,7 @@ class ServiceSerializer(serializers.ModelSerializer):
         try:
             return obj.get_category_names()
         except Exception as e:
-            print(f"Error getting category names for Service {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error getting category names for Service %s: %s", getattr(obj, 'id', 'unknown'), e)
             return []
 
     def get_subcategory_names(self, obj):
@@ -557,7 +668,7 @@ class ServiceSerializer(serializers.ModelSerializer):
         try:
             return obj.get_subcategory_names()
         except Exception as e:
-            print(f"Error getting subcategory names for Service {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error getting subcategory names for Service %s: %s", getattr(obj, 'id', 'unknown'), e)
             return []
     
     def get_category_name(self, obj):
@@ -565,7 +676,7 @@ class ServiceSerializer(serializers.ModelSerializer):
         try:
             return obj.get_category_name()
         except Exception as e:
-            print(f"Error getting category name for Service {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error getting category name for Service %s: %s", getattr(obj, 'id', 'unknown'), e)
             return ""
     
     def get_subcategory_name(self, obj):
@@ -573,22 +684,25 @@ class ServiceSerializer(serializers.ModelSerializer):
         try:
             return obj.get_subcategory_name()
         except Exception as e:
-            print(f"Error getting subcategory name for Service {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error getting subcategory name for Service %s: %s", getattr(obj, 'id', 'unknown'), e)
             return ""
     
     def get_album_images_count(self, obj):
         """Get the count of album images - optimized to avoid extra queries"""
         try:
-            return getattr(obj, 'album_images_count_annotated', obj.album_images.count())
+            count = getattr(obj, 'album_images_count_annotated', None)
+            return count if count is not None else obj.album_images.count()
         except Exception as e:
-            print(f"Error getting album images count for Service {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error getting album images count for Service %s: %s", getattr(obj, 'id', 'unknown'), e)
             return 0
     
     def get_featured_album_images(self, obj):
         """Get all album images for preview - optimized"""
         try:
             # Use prefetched data if available to avoid N+1 queries
-            if hasattr(obj, '_prefetched_objects_cache') and 'album_images' in obj._prefetched_objects_cache:
+            if hasattr(obj, 'featured_album_images_prefetched'):
+                featured_images = obj.featured_album_images_prefetched[:6]  # Already limited by the list prefetch
+            elif hasattr(obj, '_prefetched_objects_cache') and 'album_images' in obj._prefetched_objects_cache:
                 featured_images = list(obj.album_images.all()[:6])  # Limit to 6 for performance
             else:
                 featured_images = obj.album_images.all()[:6]
@@ -597,11 +711,11 @@ class ServiceSerializer(serializers.ModelSerializer):
             try:
                 return ServiceImageSerializer(featured_images, many=True, context=self.context).data
             except Exception as e:
-                print(f"Error serializing featured album images for service {getattr(obj, 'id', 'unknown')}: {e}")
+                logger.error("Error serializing featured album images for service %s: %s", getattr(obj, 'id', 'unknown'), e)
                 # Return empty list if serialization fails
                 return []
         except Exception as e:
-            print(f"Error getting featured album images for service {getattr(obj, 'id', 'unknown')}: {e}")
+            logger.error("Error getting featured album images for service %s: %s", getattr(obj, 'id', 'unknown'), e)
             return []
     
     def to_representation(self, instance):
@@ -640,14 +754,14 @@ class ServiceSerializer(serializers.ModelSerializer):
                     representation['icon_url'] = None
             except Exception as e:
                 # If icon URL handling fails, set safe defaults
-                print(f"Error handling icon URLs for Service {getattr(instance, 'id', 'unknown')}: {e}")
+                logger.error("Error handling icon URLs for Service %s: %s", getattr(instance, 'id', 'unknown'), e)
                 representation['icon'] = None
                 representation['icon_url'] = None
             
             return representation
         except Exception as e:
             # If representation fails completely, return a safe fallback
-            print(f"Error in to_representation for Service {getattr(instance, 'id', 'unknown')}: {e}")
+            logger.error("Error in to_representation for Service %s: %s", getattr(instance, 'id', 'unknown'), e)
             return {
                 'id': getattr(instance, 'id', None),
                 'name': getattr(instance, 'name', ''),
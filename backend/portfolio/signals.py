@@ -3,18 +3,25 @@ Signals for Alex Design Portfolio
 Handles automatic operations when models are created, updated, or deleted
 """
 
-from django.db.models.signals import post_save, post_delete, pre_save
+from django.db.models.signals import post_save, post_delete, pre_save, m2m_changed
 from django.dispatch import receiver
-from django.core.cache import cache
 from django.db import transaction
 from django.conf import settings
 import os
+import hashlib
 import logging
 import shutil
 import threading
-from .models import Project, Service, ProjectImage, ServiceImage
+import uuid
+from contextlib import contextmanager
+from .models import (
+    Project, Service, ProjectImage, ServiceImage,
+    ProjectCategory, ProjectSubcategory, ServiceCategory, ServiceSubcategory, StorageStat,
+)
 from .image_optimizer import ImageOptimizer
 from .async_optimizer import AsyncImageOptimizer
+from .tasks import delete_files_task, delete_folder_task
+from .utils import bump_cache_generation, project_folder, service_folder
 
 logger = logging.getLogger(__name__)
 
@@ -22,224 +29,322 @@ logger = logging.getLogger(__name__)
 optimization_lock = threading.Lock()
 currently_optimizing = set()
 
-@receiver(post_save, sender=Project)
+# Per-thread switch for the optimization part of the post_save receivers
+_signal_state = threading.local()
+
+@contextmanager
+def suppress_optimization_signals():
+    """
+    Skip optimization queuing in the post_save receivers for saves made inside
+    this block (callers queue optimization themselves). Cache invalidation still
+    runs. Unlike disconnecting receivers this only affects the current thread
+    """
+    previous = getattr(_signal_state, 'suppressed', False)
+    _signal_state.suppressed = True
+    try:
+        yield
+    finally:
+        _signal_state.suppressed = previous
+
+def _optimization_suppressed():
+    return getattr(_signal_state, 'suppressed', False)
+
+def _queue_once_on_commit(key, queue):
+    """
+    Run ``queue`` after commit at most once per key per transaction. All keyed
+    callbacks of a transaction share one aggregated on_commit hook, so a batch of
+    album rows saved together adds a single hook (one optimization per parent,
+    one cache bump per namespace) instead of one hook per row.
+    The batch is reset whenever the connection starts a new list of commit hooks
+    (commit, rollback), so a rolled-back key never blocks later saves
+    """
+    hooks = transaction.get_connection().run_on_commit
+    batch = getattr(_signal_state, 'batch', None)
+    if batch is not None and _signal_state.batch_hooks is hooks:
+        if key in batch:
+            return False
+        batch[key] = queue
+        return True
+    
+    batch = {key: queue}
+    _signal_state.batch = batch
+    _signal_state.batch_hooks = hooks
+    
+    def flush():
+        if getattr(_signal_state, 'batch', None) is batch:
+            _signal_state.batch = None
+        for batch_key, callback in batch.items():
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error running post-commit callback {batch_key}: {str(e)}")
+    
+    transaction.on_commit(flush)
+    return True
+
+def _bump_cache_on_commit(namespace):
+    """Invalidate a cache namespace once the current transaction commits"""
+    _queue_once_on_commit(('cache', namespace), lambda: bump_cache_generation(namespace))
+
+def _should_queue_optimization(instance, created, update_fields, has_image):
+    """Decide whether a Project/Service save needs its images optimized"""
+    if _optimization_suppressed():
+        return False
+    
+    # SKIP for optimization-related updates to avoid infinite loops
+    if update_fields and any(field.startswith('optimized_') or field == 'order' for field in update_fields):
+        return False
+    
+    # SKIP if instance is marked as already processed
+    if hasattr(instance, '_needs_optimization') and not instance._needs_optimization:
+        return False
+    
+    # Existing rows only when new image content was uploaded (set by views or the
+    # fingerprint check); new rows only when they actually have an image
+    if not created:
+        return getattr(instance, '_image_files_changed', False)
+    return has_image
+
+def _deletion_deferred():
+    """File deletion goes to the Celery cleanup queue instead of running in the request"""
+    return getattr(settings, 'IMAGE_OPTIMIZATION_USE_CELERY', False)
+
+def _defer_folder_delete(folder_path):
+    """
+    After commit, move the folder aside (so a new row with the same name can't
+    collide with it) and let the cleanup queue remove it
+    """
+    def move_and_queue():
+        try:
+            if not os.path.exists(folder_path):
+                return
+            tombstone = f"{folder_path}.deleted-{uuid.uuid4().hex[:8]}"
+            os.rename(folder_path, tombstone)
+            delete_folder_task.delay(tombstone)
+        except Exception as e:
+            logger.error(f"Error queuing folder deletion for {folder_path}: {str(e)}")
+    
+    transaction.on_commit(move_and_queue)
+
+def _defer_image_delete(image_field):
+    """After commit, hand an image and its optimized versions to the cleanup queue"""
+    original_path = image_field.path
+    paths = [original_path] + ImageOptimizer.optimized_variant_paths(original_path)
+    transaction.on_commit(lambda: delete_files_task.delay(paths))
+
+def _fingerprint_upload(field_file):
+    """
+    Return a BLAKE2 fingerprint (first 1MB + size) of a freshly uploaded file,
+    or None when the field holds no new upload
+    """
+    if not field_file or field_file._committed:
+        return None
+    
+    upload = field_file.file
+    upload.seek(0)
+    hasher = hashlib.blake2b(upload.read(1 << 20), digest_size=32)
+    hasher.update(str(upload.size).encode())
+    upload.seek(0)
+    return hasher.hexdigest()
+
+@receiver(post_save, sender=Project, dispatch_uid="portfolio.project.post_save.v1")
 def optimize_project_images_on_save(sender, instance, created, **kwargs):
     """
-    Automatically optimize project images when a project is created or updated
-    ULTRA-OPTIMIZED: Only queue optimization when absolutely necessary
+    Invalidate project caches and queue image optimization when actually needed,
+    both after commit so readers can't re-cache pre-commit data in between
     """
     try:
-        # SKIP ENTIRELY for optimization-related updates to avoid infinite loops
-        update_fields = kwargs.get('update_fields')
-        if update_fields and any(field.startswith('optimized_') or field == 'order' for field in update_fields):
-            return
+        pid = instance.id
         
-        # SKIP ENTIRELY if instance is marked as already processed
-        if hasattr(instance, '_needs_optimization') and not instance._needs_optimization:
+        if not _should_queue_optimization(instance, created, kwargs.get('update_fields'), bool(instance.image)):
+            _bump_cache_on_commit('projects')
             return
         
-        # SKIP ENTIRELY for existing projects without new images
-        if not created:
-            # Only optimize if explicitly marked as having new images
-            if not (hasattr(instance, '_image_files_changed') and instance._image_files_changed):
-                return
-            logger.info(f"Project has new image files - queuing optimization: {instance.title}")
-        else:
-            # For new projects, only optimize if they actually have images
-            has_main_image = bool(instance.image)
-            if not has_main_image:
-                return
-            logger.info(f"New project created with main image - queuing optimization: {instance.title}")
-        
-        # Queue optimization asynchronously - instant and non-blocking
-        AsyncImageOptimizer.queue_project_optimization(
-            project_id=instance.id,
-            operation_type='create' if created else 'update'
-        )
-        
-        # Clear cache
-        cache_key = f"project_{instance.id}_images"
-        cache.delete(cache_key)
+        operation_type = 'create' if created else 'update'
+        logger.info(f"Queuing {operation_type} optimization for project: {instance.title}")
+        _queue_once_on_commit(('project', pid), lambda: AsyncImageOptimizer.queue_project_optimization(
+            project_id=pid, operation_type=operation_type
+        ))
+        _bump_cache_on_commit('projects')
         
     except Exception as e:
         logger.error(f"Error in project image optimization signal: {str(e)}")
 
-@receiver(post_save, sender=Service)
+@receiver(post_save, sender=Service, dispatch_uid="portfolio.service.post_save.v1")
 def optimize_service_images_on_save(sender, instance, created, **kwargs):
     """
-    Automatically optimize service images when a service is created or updated
-    ULTRA-OPTIMIZED: Only queue optimization when absolutely necessary
+    Invalidate service caches and queue image optimization when actually needed,
+    both after commit so readers can't re-cache pre-commit data in between
     """
     try:
-        # SKIP ENTIRELY for optimization-related updates to avoid infinite loops
-        update_fields = kwargs.get('update_fields')
-        if update_fields and any(field.startswith('optimized_') or field == 'order' for field in update_fields):
-            return
+        sid = instance.id
         
-        # SKIP ENTIRELY if instance is marked as already processed
-        if hasattr(instance, '_needs_optimization') and not instance._needs_optimization:
+        if not _should_queue_optimization(instance, created, kwargs.get('update_fields'), bool(instance.icon)):
+            _bump_cache_on_commit('services')
             return
         
-        # SKIP ENTIRELY for existing services without new images
-        if not created:
-            # Only optimize if explicitly marked as having new images
-            if not (hasattr(instance, '_image_files_changed') and instance._image_files_changed):
-                return
-            logger.info(f"Service has new image files - queuing optimization: {instance.name}")
-        else:
-            # For new services, only optimize if they actually have images
-            has_icon = bool(instance.icon)
-            if not has_icon:
-                return
-            logger.info(f"New service created with icon - queuing optimization: {instance.name}")
-        
-        # Queue optimization asynchronously - instant and non-blocking
-        AsyncImageOptimizer.queue_service_optimization(
-            service_id=instance.id,
-            operation_type='create' if created else 'update'
-        )
-        
-        # Clear cache
-        cache_key = f"service_{instance.id}_images"
-        cache.delete(cache_key)
+        operation_type = 'create' if created else 'update'
+        logger.info(f"Queuing {operation_type} optimization for service: {instance.name}")
+        _queue_once_on_commit(('service', sid), lambda: AsyncImageOptimizer.queue_service_optimization(
+            service_id=sid, operation_type=operation_type
+        ))
+        _bump_cache_on_commit('services')
         
     except Exception as e:
         logger.error(f"Error in service image optimization signal: {str(e)}")
 
-@receiver(post_save, sender=ProjectImage)
+@receiver(post_save, sender=ProjectImage, dispatch_uid="portfolio.projectimage.post_save.v1")
 def optimize_project_album_image_on_save(sender, instance, created, **kwargs):
     """
     Automatically optimize project album images when they are created or updated
     OPTIMIZED: Uses async queue system, only triggers for single uploads
     """
     try:
-        if created and instance.project:
-            # Prevent duplicate optimization with lock
-            with optimization_lock:
-                project_key = f"project_{instance.project.id}"
-                if project_key in currently_optimizing:
-                    logger.info(f"Skipping album image optimization - project already optimizing: {instance.project.title}")
-                    return
-            
-            # Check if this is part of a bulk upload (multiple images created rapidly)
-            recent_images = ProjectImage.objects.filter(
-                project=instance.project,
-                id__gte=instance.id - 10  # Check last 10 IDs
-            ).count()
-            
-            if recent_images > 3:  # Likely bulk upload, skip individual optimization
-                logger.info(f"Skipping individual optimization for album image {instance.id} - appears to be bulk upload")
+        if not instance.project_id:
+            return
+        
+        # Invalidate cached project data after commit (the common, non-create path)
+        _bump_cache_on_commit('projects')
+        if not created or _optimization_suppressed():
+            return
+        
+        # Prevent duplicate optimization with lock
+        with optimization_lock:
+            project_key = f"project_{instance.project_id}"
+            if project_key in currently_optimizing:
+                logger.info(f"Skipping album image optimization - project already optimizing: {instance.project.title}")
                 return
-            
-            # Single image upload - queue optimization asynchronously
-            AsyncImageOptimizer.queue_project_optimization(
-                project_id=instance.project.id,
-                operation_type='album_image_create'
-            )
+        
+        # Check if this is part of a bulk upload (multiple images created rapidly)
+        recent_images = ProjectImage.objects.filter(
+            project_id=instance.project_id,
+            id__gte=instance.id - 10  # Check last 10 IDs
+        ).count()
+        
+        if recent_images > 3:  # Likely bulk upload, skip individual optimization
+            logger.info(f"Skipping individual optimization for album image {instance.id} - appears to be bulk upload")
+            return
+        
+        # Single image upload - queue one optimization per project after commit
+        queued = _queue_once_on_commit(('project', instance.project_id), lambda pid=instance.project_id: AsyncImageOptimizer.queue_project_optimization(
+            project_id=pid, operation_type='album_image_create'
+        ))
+        if queued:
             logger.info(f"Queued single album image optimization for project: {instance.project.title}")
             
-        # Clear cache for the parent project
-        if instance.project:
-            cache_key = f"project_{instance.project.id}_images"
-            cache.delete(cache_key)
-            
     except Exception as e:
         logger.error(f"Error in project album image optimization signal: {str(e)}")
 
-@receiver(post_save, sender=ServiceImage)
+@receiver(post_save, sender=ServiceImage, dispatch_uid="portfolio.serviceimage.post_save.v1")
 def optimize_service_album_image_on_save(sender, instance, created, **kwargs):
     """
     Automatically optimize service album images when they are created or updated
     OPTIMIZED: Uses async queue system, only triggers for single uploads
     """
     try:
-        if created and instance.service:
-            # Prevent duplicate optimization with lock
-            with optimization_lock:
-                service_key = f"service_{instance.service.id}"
-                if service_key in currently_optimizing:
-                    logger.info(f"Skipping album image optimization - service already optimizing: {instance.service.name}")
-                    return
-            
-            # Check if this is part of a bulk upload (multiple images created rapidly)
-            recent_images = ServiceImage.objects.filter(
-                service=instance.service,
-                id__gte=instance.id - 10  # Check last 10 IDs
-            ).count()
-            
-            if recent_images > 3:  # Likely bulk upload, skip individual optimization
-                logger.info(f"Skipping individual optimization for album image {instance.id} - appears to be bulk upload")
+        if not instance.service_id:
+            return
+        
+        # Invalidate cached service data after commit (the common, non-create path)
+        _bump_cache_on_commit('services')
+        if not created or _optimization_suppressed():
+            return
+        
+        # Prevent duplicate optimization with lock
+        with optimization_lock:
+            service_key = f"service_{instance.service_id}"
+            if service_key in currently_optimizing:
+                logger.info(f"Skipping album image optimization - service already optimizing: {instance.service.name}")
                 return
-            
-            # Single image upload - queue optimization asynchronously
-            AsyncImageOptimizer.queue_service_optimization(
-                service_id=instance.service.id,
-                operation_type='album_image_create'
-            )
+        
+        # Check if this is part of a bulk upload (multiple images created rapidly)
+        recent_images = ServiceImage.objects.filter(
+            service_id=instance.service_id,
+            id__gte=instance.id - 10  # Check last 10 IDs
+        ).count()
+        
+        if recent_images > 3:  # Likely bulk upload, skip individual optimization
+            logger.info(f"Skipping individual optimization for album image {instance.id} - appears to be bulk upload")
+            return
+        
+        # Single image upload - queue one optimization per service after commit
+        queued = _queue_once_on_commit(('service', instance.service_id), lambda sid=instance.service_id: AsyncImageOptimizer.queue_service_optimization(
+            service_id=sid, operation_type='album_image_create'
+        ))
+        if queued:
             logger.info(f"Queued single album image optimization for service: {instance.service.name}")
             
-        # Clear cache for the parent service
-        if instance.service:
-            cache_key = f"service_{instance.service.id}_images"
-            cache.delete(cache_key)
-            
     except Exception as e:
         logger.error(f"Error in service album image optimization signal: {str(e)}")
 
-@receiver(pre_save, sender=Project)
-def handle_project_title_change(sender, instance, **kwargs):
+@receiver(pre_save, sender=Project, dispatch_uid="portfolio.project.pre_save.v1")
+def handle_project_pre_save(sender, instance, **kwargs):
     """
-    Handle project title changes and cleanup old optimized images
+    Flag the project for optimization only when a newly uploaded main image differs
+    from the stored fingerprint. The folder move on a title change is done by Project.save()
     """
     try:
-        if instance.pk:  # Only for existing projects
-            try:
-                old_instance = Project.objects.get(pk=instance.pk)
-                if old_instance.title != instance.title:
-                    # Get old folder path using ImageOptimizer method
-                    old_folder_path = ImageOptimizer._get_project_folder(old_instance)
-                    
-                    # Clean up old optimized images
-                    if os.path.exists(old_folder_path):
-                        ImageOptimizer.cleanup_old_optimized_images(old_folder_path)
-                        logger.info(f"Cleaned up old optimized images for project: {old_instance.title}")
-                        
-            except Project.DoesNotExist:
-                pass
+        content_hash = _fingerprint_upload(instance.image)
+        
+        if content_hash is not None:
+            # None means a new project (or the row doesn't exist yet)
+            old_hash = None
+            if instance.pk:
+                old_hash = Project.objects.filter(pk=instance.pk).values_list('image_content_hash', flat=True).first()
+            if content_hash != old_hash:
+                instance.image_content_hash = content_hash
+                instance._image_files_changed = True
+            else:
+                logger.info(f"Uploaded main image is identical to the stored one, skipping optimization: {instance.title}")
+        elif not instance.image and instance.image_content_hash:
+            # The main image was removed: forget its fingerprint (so uploading it again
+            # is optimized) and let the storage receiver know media changed
+            instance.image_content_hash = None
+            instance._image_removed = True
                 
     except Exception as e:
-        logger.error(f"Error handling project title change: {str(e)}")
+        logger.error(f"Error in project pre_save handling: {str(e)}")
 
-@receiver(pre_save, sender=Service)
-def handle_service_name_change(sender, instance, **kwargs):
+@receiver(pre_save, sender=Service, dispatch_uid="portfolio.service.pre_save.v1")
+def handle_service_pre_save(sender, instance, **kwargs):
     """
-    Handle service name changes and cleanup old optimized images
+    Flag the service for optimization only when a newly uploaded icon differs
+    from the stored fingerprint. The folder move on a name change is done by Service.save()
     """
     try:
-        if instance.pk:  # Only for existing services
-            try:
-                old_instance = Service.objects.get(pk=instance.pk)
-                if old_instance.name != instance.name:
-                    # Get old folder path using ImageOptimizer method
-                    old_folder_path = ImageOptimizer._get_service_folder(old_instance)
-                    
-                    # Clean up old optimized images
-                    if os.path.exists(old_folder_path):
-                        ImageOptimizer.cleanup_old_optimized_images(old_folder_path)
-                        logger.info(f"Cleaned up old optimized images for service: {old_instance.name}")
-                        
-            except Service.DoesNotExist:
-                pass
+        content_hash = _fingerprint_upload(instance.icon)
+        
+        if content_hash is not None:
+            # None means a new service (or the row doesn't exist yet)
+            old_hash = None
+            if instance.pk:
+                old_hash = Service.objects.filter(pk=instance.pk).values_list('icon_content_hash', flat=True).first()
+            if content_hash != old_hash:
+                instance.icon_content_hash = content_hash
+                instance._image_files_changed = True
+            else:
+                logger.info(f"Uploaded icon is identical to the stored one, skipping optimization: {instance.name}")
+        elif not instance.icon and instance.icon_content_hash:
+            # The icon was removed: forget its fingerprint (so uploading it again
+            # is optimized) and let the storage receiver know media changed
+            instance.icon_content_hash = None
+            instance._image_removed = True
                 
     except Exception as e:
-        logger.error(f"Error handling service name change: {str(e)}")
+        logger.error(f"Error in service pre_save handling: {str(e)}")
 
-@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=Project, dispatch_uid="portfolio.project.post_delete.v1")
 def cleanup_project_images_on_delete(sender, instance, **kwargs):
     """
     Clean up entire project folder when a project is deleted
     """
     try:
+        _bump_cache_on_commit('projects')
+        
+        if _deletion_deferred():
+            _defer_folder_delete(ImageOptimizer._get_project_folder(instance))
+            return
+        
         # Use the ImageOptimizer method to delete the entire project folder
         success = ImageOptimizer.delete_project_folder(instance)
         
@@ -252,21 +357,25 @@ def cleanup_project_images_on_delete(sender, instance, **kwargs):
         logger.error(f"Error deleting project folder for {instance.title}: {str(e)}")
         # Try to get basic folder path as fallback
         try:
-            from django.utils.text import slugify
-            project_folder_name = slugify(instance.title)[:50]
-            project_folder_path = os.path.join(settings.MEDIA_ROOT, 'projects', project_folder_name)
-            if os.path.exists(project_folder_path):
+            project_folder_path = project_folder(instance.folder_slug)
+            if instance.folder_slug and os.path.exists(project_folder_path):
                 shutil.rmtree(project_folder_path)
                 logger.info(f"Fallback deletion successful for project folder: {project_folder_path}")
         except Exception as fallback_error:
             logger.error(f"Fallback deletion also failed for {instance.title}: {str(fallback_error)}")
 
-@receiver(post_delete, sender=Service)
+@receiver(post_delete, sender=Service, dispatch_uid="portfolio.service.post_delete.v1")
 def cleanup_service_images_on_delete(sender, instance, **kwargs):
     """
     Clean up entire service folder when a service is deleted
     """
     try:
+        _bump_cache_on_commit('services')
+        
+        if _deletion_deferred():
+            _defer_folder_delete(ImageOptimizer._get_service_folder(instance))
+            return
+        
         # Use the ImageOptimizer method to delete the entire service folder
         success = ImageOptimizer.delete_service_folder(instance)
         
@@ -279,23 +388,25 @@ def cleanup_service_images_on_delete(sender, instance, **kwargs):
         logger.error(f"Error deleting service folder for {instance.name}: {str(e)}")
         # Try to get basic folder path as fallback
         try:
-            from django.utils.text import slugify
-            service_folder_name = slugify(instance.name)[:50]
-            service_folder_path = os.path.join(settings.MEDIA_ROOT, 'services', service_folder_name)
-            if os.path.exists(service_folder_path):
+            service_folder_path = service_folder(instance.folder_slug)
+            if instance.folder_slug and os.path.exists(service_folder_path):
                 shutil.rmtree(service_folder_path)
                 logger.info(f"Fallback deletion successful for service folder: {service_folder_path}")
         except Exception as fallback_error:
             logger.error(f"Fallback deletion also failed for {instance.name}: {str(fallback_error)}")
 
 # Individual image deletion signals
-@receiver(post_delete, sender=ProjectImage)
+@receiver(post_delete, sender=ProjectImage, dispatch_uid="portfolio.projectimage.post_delete.v1")
 def cleanup_project_album_image_on_delete(sender, instance, **kwargs):
     """
     Clean up individual project album image file when deleted
     """
     try:
-        if instance.image:
+        _bump_cache_on_commit('projects')
+        
+        if instance.image and _deletion_deferred():
+            _defer_image_delete(instance.image)
+        elif instance.image:
             # Use the ImageOptimizer method to delete the image file and its optimized versions
             success = ImageOptimizer.delete_image_file(instance.image)
             
@@ -307,13 +418,17 @@ def cleanup_project_album_image_on_delete(sender, instance, **kwargs):
     except Exception as e:
         logger.error(f"Error deleting project album image file: {str(e)}")
 
-@receiver(post_delete, sender=ServiceImage)
+@receiver(post_delete, sender=ServiceImage, dispatch_uid="portfolio.serviceimage.post_delete.v1")
 def cleanup_service_album_image_on_delete(sender, instance, **kwargs):
     """
     Clean up individual service album image file when deleted
     """
     try:
-        if instance.image:
+        _bump_cache_on_commit('services')
+        
+        if instance.image and _deletion_deferred():
+            _defer_image_delete(instance.image)
+        elif instance.image:
             # Use the ImageOptimizer method to delete the image file and its optimized versions
             success = ImageOptimizer.delete_image_file(instance.image)
             
@@ -325,33 +440,75 @@ def cleanup_service_album_image_on_delete(sender, instance, **kwargs):
     except Exception as e:
         logger.error(f"Error deleting service album image file: {str(e)}")
 
-# Cache management signals
-@receiver(post_save, sender=Project)
-def clear_project_cache(sender, instance, **kwargs):
-    """Clear cache when projects are updated"""
+@receiver(post_save, sender=ProjectCategory, dispatch_uid="portfolio.projectcategory.post_save.v1")
+@receiver(post_delete, sender=ProjectCategory, dispatch_uid="portfolio.projectcategory.post_delete.v1")
+@receiver(post_save, sender=ProjectSubcategory, dispatch_uid="portfolio.projectsubcategory.post_save.v1")
+@receiver(post_delete, sender=ProjectSubcategory, dispatch_uid="portfolio.projectsubcategory.post_delete.v1")
+@receiver(post_save, sender=ServiceCategory, dispatch_uid="portfolio.servicecategory.post_save.v1")
+@receiver(post_delete, sender=ServiceCategory, dispatch_uid="portfolio.servicecategory.post_delete.v1")
+@receiver(post_save, sender=ServiceSubcategory, dispatch_uid="portfolio.servicesubcategory.post_save.v1")
+@receiver(post_delete, sender=ServiceSubcategory, dispatch_uid="portfolio.servicesubcategory.post_delete.v1")
+def clear_category_cache(sender, instance, **kwargs):
+    """
+    Invalidate the cached category/subcategory payloads after commit
+    """
     try:
-        # Clear project list cache
-        cache.delete('projects_list')
-        cache.delete('featured_projects')
-        
-        # Clear specific project cache
-        cache.delete(f'project_{instance.id}')
-        cache.delete(f'project_{instance.id}_images')
-        
+        _bump_cache_on_commit('categories')
     except Exception as e:
-        logger.error(f"Error clearing project cache: {str(e)}")
+        logger.error(f"Error invalidating category cache: {str(e)}")
 
-@receiver(post_save, sender=Service)
-def clear_service_cache(sender, instance, **kwargs):
-    """Clear cache when services are updated"""
+@receiver(m2m_changed, sender=Project.categories.through, dispatch_uid="portfolio.project.categories.m2m_changed.v1")
+@receiver(m2m_changed, sender=Project.subcategories.through, dispatch_uid="portfolio.project.subcategories.m2m_changed.v1")
+@receiver(m2m_changed, sender=Service.categories.through, dispatch_uid="portfolio.service.categories.m2m_changed.v1")
+@receiver(m2m_changed, sender=Service.subcategories.through, dispatch_uid="portfolio.service.subcategories.m2m_changed.v1")
+def clear_cache_on_category_links_change(sender, action, **kwargs):
+    """
+    Project/service payloads embed their category names, and set()/add()/remove()
+    on these relations run after the owner's post_save, so invalidate after commit
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
     try:
-        # Clear service list cache
-        cache.delete('services_list')
-        cache.delete('featured_services')
-        
-        # Clear specific service cache
-        cache.delete(f'service_{instance.id}')
-        cache.delete(f'service_{instance.id}_images')
-        
+        if sender in (Project.categories.through, Project.subcategories.through):
+            _bump_cache_on_commit('projects')
+        else:
+            _bump_cache_on_commit('services')
+    except Exception as e:
+        logger.error(f"Error invalidating cache after a category link change: {str(e)}")
+
+def _saved_media_files(instance, created, update_fields):
+    """
+    Whether a post_save can have added, replaced or removed a media file. Title
+    edits, reorders and the optimizer's optimized_* path updates can't (the
+    optimizer marks the scan stale itself once its run has written the files)
+    """
+    if created:
+        return True
+    if update_fields:
+        return 'image' in update_fields or 'icon' in update_fields
+    if isinstance(instance, (Project, Service)):
+        # Set by the pre_save fingerprint check
+        return getattr(instance, '_image_files_changed', False) or getattr(instance, '_image_removed', False)
+    # Album rows don't fingerprint their file, so a full save may have replaced it
+    return True
+
+@receiver(post_save, sender=Project, dispatch_uid="portfolio.project.storage_post_save.v1")
+@receiver(post_delete, sender=Project, dispatch_uid="portfolio.project.storage_post_delete.v1")
+@receiver(post_save, sender=Service, dispatch_uid="portfolio.service.storage_post_save.v1")
+@receiver(post_delete, sender=Service, dispatch_uid="portfolio.service.storage_post_delete.v1")
+@receiver(post_save, sender=ProjectImage, dispatch_uid="portfolio.projectimage.storage_post_save.v1")
+@receiver(post_delete, sender=ProjectImage, dispatch_uid="portfolio.projectimage.storage_post_delete.v1")
+@receiver(post_save, sender=ServiceImage, dispatch_uid="portfolio.serviceimage.storage_post_save.v1")
+@receiver(post_delete, sender=ServiceImage, dispatch_uid="portfolio.serviceimage.storage_post_delete.v1")
+def mark_storage_stats_stale(sender, instance, **kwargs):
+    """
+    Media files change with these rows (uploads, deletes), so the stored storage
+    scan is invalidated once per transaction after commit. Saves that can't have
+    changed a file are skipped
+    """
+    try:
+        if kwargs.get('signal') is post_save and not _saved_media_files(instance, kwargs['created'], kwargs.get('update_fields')):
+            return
+        _queue_once_on_commit(('storage',), StorageStat.media_changed)
     except Exception as e:
-        logger.error(f"Error clearing service cache: {str(e)}")
+        logger.error(f"Error invalidating storage statistics: {str(e)}")
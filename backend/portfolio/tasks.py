@@ -0,0 +1,102 @@
+"""
+Celery tasks for Alex Design Portfolio
+Image optimization runs on a worker (routed to the 'images' queue) instead of the web process
+"""
+
+import logging
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+# Optimization of a large album can take minutes; kill runaway jobs rather than
+# letting them hold one of the few image worker slots forever
+IMAGE_TASK_TIME_LIMIT = 600
+
+
+@shared_task(queue='images', acks_late=True, time_limit=IMAGE_TASK_TIME_LIMIT)
+def optimize_project_images_task(project_id):
+    """
+    Load the project by pk and optimize its images on the worker
+    """
+    from .models import Project
+    from .image_optimizer import ImageOptimizer
+    
+    try:
+        project = Project.objects.get(pk=project_id)
+    except Project.DoesNotExist:
+        logger.warning(f"Project {project_id} not found for optimization")
+        return
+    
+    ImageOptimizer.optimize_project_images(project)
+    logger.info(f"Successfully optimized project: {project.title}")
+
+
+@shared_task(queue='images', acks_late=True, time_limit=IMAGE_TASK_TIME_LIMIT)
+def optimize_service_images_task(service_id):
+    """
+    Load the service by pk and optimize its images on the worker
+    """
+    from .models import Service
+    from .image_optimizer import ImageOptimizer
+    
+    try:
+        service = Service.objects.get(pk=service_id)
+    except Service.DoesNotExist:
+        logger.warning(f"Service {service_id} not found for optimization")
+        return
+    
+    ImageOptimizer.optimize_service_images(service)
+    logger.info(f"Successfully optimized service: {service.name}")
+
+
+@shared_task(queue='cleanup')
+def delete_files_task(paths):
+    """
+    Unlink files whose rows were already deleted, off the request cycle
+    """
+    from .utils import bulk_unlink
+    
+    from .models import StorageStat
+    
+    deleted = bulk_unlink(paths)
+    logger.info(f"Deleted {deleted}/{len(paths)} files")
+    # The delete's post_delete signal already queued refresh_storage_stats_task;
+    # if that scan ran first, the next read picks this change up
+    StorageStat.mark_stale()
+
+
+@shared_task(queue='cleanup')
+def delete_folder_task(folder_path):
+    """
+    Remove a media folder that was moved aside when its project/service was deleted
+    """
+    from .image_optimizer import ImageOptimizer
+    
+    from .models import StorageStat
+    
+    if ImageOptimizer._force_delete_folder(folder_path):
+        logger.info(f"Deleted folder: {folder_path}")
+        StorageStat.mark_stale()
+
+
+@shared_task(queue='cleanup')
+def refresh_storage_stats_task():
+    """
+    Rescan the media tree after it changed, so the dashboard never walks it in a request
+    """
+    from .models import StorageStat
+    
+    stat = StorageStat.refresh()
+    logger.info(f"Storage statistics refreshed: {stat.file_count} files, {stat.total_bytes} bytes")
+
+
+@shared_task(acks_late=False)
+def send_contact_email_task(data):
+    """
+    Send a contact form email on the worker. Acked on receipt so a worker
+    crash can't deliver the same message twice
+    """
+    from .contact_serializers import send_contact_email
+    
+    send_contact_email(data)
+
@@ -1,8 +1,17 @@
-from django.test import TestCase
+import os
+import shutil
+import tempfile
+from unittest import mock
+from django.test import TestCase, override_settings
+from django.db import connection
+from django.core.cache import cache
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 from rest_framework import status
-from .models import Project, Service
+from .models import Project, ProjectImage, Service, ProjectCategory, ServiceCategory, StorageStat
+from .signals import suppress_optimization_signals
+from .utils import bump_cache_generation
 
 User = get_user_model()
 
@@ -32,7 +41,7 @@ class OrderResequencingTestCase(TestCase):
     def test_project_deletion_resequencing(self):
         """Test that deleting a project automatically resequences remaining projects"""
         # Initial state: projects with orders 1, 2, 3, 4, 5
-        initial_orders = [p.order for p in Project.objects.order_by('order')]
+        initial_orders = list(Project.objects.order_by('order').values_list('order', flat=True))
         self.assertEqual(initial_orders, [1, 2, 3, 4, 5])
         
         # Delete project with order 3 (middle project)
@@ -41,11 +50,11 @@ class OrderResequencingTestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         
         # Check that remaining projects are resequenced
-        remaining_orders = [p.order for p in Project.objects.order_by('order')]
+        remaining_orders = list(Project.objects.order_by('order').values_list('order', flat=True))
         self.assertEqual(remaining_orders, [1, 2, 3, 4])  # Orders should be 1, 2, 3, 4 (no gaps)
         
         # Verify specific projects are in correct positions
-        projects_by_title = {p.title: p.order for p in Project.objects.all()}
+        projects_by_title = dict(Project.objects.values_list('title', 'order'))
         self.assertEqual(projects_by_title['Project 1'], 1)
         self.assertEqual(projects_by_title['Project 2'], 2)
         self.assertEqual(projects_by_title['Project 4'], 3)  # Should move from 4 to 3
@@ -65,7 +74,7 @@ class OrderResequencingTestCase(TestCase):
             services.append(service)
         
         # Initial state: services with orders 1, 2, 3, 4, 5
-        initial_orders = [s.order for s in Service.objects.order_by('order')]
+        initial_orders = list(Service.objects.order_by('order').values_list('order', flat=True))
         self.assertEqual(initial_orders, [1, 2, 3, 4, 5])
         
         # Delete service with order 2 (early service)
@@ -74,11 +83,11 @@ class OrderResequencingTestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         
         # Check that remaining services are resequenced
-        remaining_orders = [s.order for s in Service.objects.order_by('order')]
+        remaining_orders = list(Service.objects.order_by('order').values_list('order', flat=True))
         self.assertEqual(remaining_orders, [1, 2, 3, 4])  # Orders should be 1, 2, 3, 4 (no gaps)
         
         # Verify specific services are in correct positions
-        services_by_name = {s.name: s.order for s in Service.objects.all()}
+        services_by_name = dict(Service.objects.values_list('name', 'order'))
         self.assertEqual(services_by_name['Service 1'], 1)
         self.assertEqual(services_by_name['Service 3'], 2)  # Should move from 3 to 2
         self.assertEqual(services_by_name['Service 4'], 3)  # Should move from 4 to 3
@@ -92,7 +101,7 @@ class OrderResequencingTestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         
         # Check that remaining projects keep their original orders
-        remaining_orders = [p.order for p in Project.objects.order_by('order')]
+        remaining_orders = list(Project.objects.order_by('order').values_list('order', flat=True))
         self.assertEqual(remaining_orders, [1, 2, 3, 4])  # No gaps, no changes needed
     
     def test_delete_first_item_resequencing(self):
@@ -103,12 +112,379 @@ class OrderResequencingTestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         
         # Check that remaining projects are resequenced
-        remaining_orders = [p.order for p in Project.objects.order_by('order')]
+        remaining_orders = list(Project.objects.order_by('order').values_list('order', flat=True))
         self.assertEqual(remaining_orders, [1, 2, 3, 4])  # All should shift down by 1
         
         # Verify specific projects moved correctly
-        projects_by_title = {p.title: p.order for p in Project.objects.all()}
+        projects_by_title = dict(Project.objects.values_list('title', 'order'))
         self.assertEqual(projects_by_title['Project 2'], 1)  # Should move from 2 to 1
         self.assertEqual(projects_by_title['Project 3'], 2)  # Should move from 3 to 2
         self.assertEqual(projects_by_title['Project 4'], 3)  # Should move from 4 to 3
         self.assertEqual(projects_by_title['Project 5'], 4)  # Should move from 5 to 4
+
+
+class ProjectBulkCreateTestCase(TestCase):
+    def setUp(self):
+        """Set up test data"""
+        self.admin_user = User.objects.create_superuser(
+            username='admin',
+            email='admin@test.com',
+            password='admin123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin_user)
+        self.category = ProjectCategory.objects.create(name='Residential')
+        for i in range(1, 3):
+            Project.objects.create(
+                title=f'Project {i}',
+                description=f'Description {i}',
+                project_date='2025-08-19',
+                order=i
+            )
+    
+    def test_list_post_shifts_orders_and_sets_slugs(self):
+        """A list POST orders, slugs and links its items as the same creates made one by one would"""
+        payload = [
+            {'title': 'Lakeside Villa', 'description': 'd', 'project_date': '2025-08-19',
+             'order': 2, 'categories': [self.category.id]},
+            {'title': 'Office Tower', 'description': 'd', 'project_date': '2025-08-19', 'order': 1},
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post('/api/projects/', payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 2)
+        # Stored rows are shifted by one UPDATE, however many items carry an order
+        project_updates = [q['sql'] for q in queries.captured_queries if q['sql'].startswith('UPDATE "portfolio_project"')]
+        self.assertEqual(len(project_updates), 1)
+        
+        self.assertEqual(
+            list(Project.objects.order_by('order').values_list('title', 'order')),
+            [('Office Tower', 1), ('Project 1', 2), ('Lakeside Villa', 3), ('Project 2', 4)]
+        )
+        self.assertEqual(
+            dict(Project.objects.values_list('title', 'folder_slug'))['Lakeside Villa'],
+            'lakeside-villa'
+        )
+        self.assertEqual(
+            list(Project.objects.get(title='Lakeside Villa').categories.values_list('name', flat=True)),
+            ['Residential']
+        )
+        self.assertFalse(Project.objects.get(title='Office Tower').categories.exists())
+
+
+class ProjectBulkReorderTestCase(TestCase):
+    def setUp(self):
+        """Set up test data"""
+        self.admin_user = User.objects.create_superuser(
+            username='admin',
+            email='admin@test.com',
+            password='admin123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin_user)
+        self.projects = [
+            Project.objects.create(
+                title=f'Project {i}',
+                description=f'Description {i}',
+                project_date='2025-08-19',
+                order=i
+            )
+            for i in range(1, 4)
+        ]
+    
+    def test_reorder_applies_new_orders(self):
+        """Each listed ID gets its position in the list as its order"""
+        first, second, third = (project.id for project in self.projects)
+        response = self.client.post('/api/projects/bulk_reorder/', {'project_ids': [third, first, second]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            list(Project.objects.order_by('id').values_list('id', 'order')),
+            [(first, 2), (second, 3), (third, 1)]
+        )
+    
+    def test_reorder_with_missing_ids_is_rejected(self):
+        """Unknown IDs are listed in the 400 response and no order is changed"""
+        first = self.projects[0].id
+        response = self.client.post('/api/projects/bulk_reorder/', {'project_ids': [first, 9998, 9999]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['missing_ids'], [9998, 9999])
+        self.assertEqual(
+            list(Project.objects.order_by('id').values_list('order', flat=True)),
+            [1, 2, 3]
+        )
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'project-list-tests'}})
+class ProjectListETagTestCase(TestCase):
+    def setUp(self):
+        """Set up test data"""
+        self.admin_user = User.objects.create_superuser(
+            username='admin',
+            email='admin@test.com',
+            password='admin123'
+        )
+        self.client = APIClient()
+        self.projects = [
+            Project.objects.create(
+                title=f'Project {i}',
+                description=f'Description {i}',
+                project_date='2025-08-19',
+                order=i
+            )
+            for i in range(1, 3)
+        ]
+        # The list ETag is built from these generations; None (no ETag) until they exist
+        bump_cache_generation('projects')
+        bump_cache_generation('categories')
+    
+    def tearDown(self):
+        cache.clear()
+    
+    def test_etag_revalidation_until_reorder(self):
+        """A matching If-None-Match gets a 304 without any query until the projects are reordered"""
+        response = self.client.get('/api/projects/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/projects/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(len(queries), 0)
+        
+        admin = APIClient()
+        admin.force_authenticate(user=self.admin_user)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = admin.post('/api/projects/bulk_reorder/', {
+                'project_ids': [project.id for project in reversed(self.projects)]
+            }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+        response = self.client.get('/api/projects/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'category-tests'}})
+class CategorySubcategoriesViewTestCase(TestCase):
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category = ProjectCategory.objects.create(name='Residential')
+        self.url = '/api/categories/subcategories/'
+    
+    def tearDown(self):
+        cache.clear()
+    
+    def test_etag_revalidation_until_category_changes(self):
+        """A matching If-None-Match gets a 304 until a category is saved"""
+        response = self.client.get(self.url, {'type': 'project'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        
+        response = self.client.get(self.url, {'type': 'project'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category.name = 'Commercial'
+            self.category.save()
+        response = self.client.get(self.url, {'type': 'project'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(list(response.data['categories']), ['Commercial'])
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'album-tests'}})
+class ProjectAlbumViewTestCase(TestCase):
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        # Keep the storage rescan these media saves queue out of the test database
+        self.enterContext(mock.patch.object(StorageStat, 'schedule_refresh'))
+        # Album image creates bump the cache generations the album ETag is built from
+        with self.captureOnCommitCallbacks(execute=True), suppress_optimization_signals():
+            ProjectCategory.objects.create(name='Residential')
+            self.project = Project.objects.create(
+                title='Lakeside Villa',
+                description='Description',
+                project_date='2025-08-19',
+                order=1
+            )
+            for i in range(1, 4):
+                self.add_image(i)
+        self.url = f'/api/projects/{self.project.id}/album/'
+    
+    def tearDown(self):
+        cache.clear()
+    
+    def add_image(self, order):
+        return ProjectImage.objects.create(
+            project=self.project,
+            image=f'projects/lakeside-villa/album/photo-{order}.jpg',
+            order=order
+        )
+    
+    def test_etag_revalidation_until_album_changes(self):
+        """A matching If-None-Match gets a 304 until an album image is saved"""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        with self.captureOnCommitCallbacks(execute=True), suppress_optimization_signals():
+            self.add_image(4)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['total_images'], 4)
+    
+    def test_etag_changes_when_project_is_recategorized(self):
+        """Changing a project's category links changes the album ETag (the payload embeds the names)"""
+        with self.captureOnCommitCallbacks(execute=True):
+            commercial = ProjectCategory.objects.create(name='Commercial')
+        response = self.client.get(self.url)
+        etag = response['ETag']
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.categories.set([commercial])
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['project']['category_name'], 'Commercial')
+    
+    def test_limit_offset_returns_window_and_total(self):
+        """?limit=&offset= returns that slice of the album, with the full album size as total_images"""
+        response = self.client.get(self.url, {'limit': 2, 'offset': 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([image['order'] for image in response.data['album_images']], [2, 3])
+        self.assertEqual(response.data['total_images'], 3)
+    
+    def test_missing_or_invalid_limit_returns_whole_album(self):
+        """Without a usable limit the whole album is returned"""
+        for params in ({}, {'limit': 'abc'}, {'limit': 0}, {'offset': 2}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual([image['order'] for image in response.data['album_images']], [1, 2, 3])
+            self.assertEqual(response.data['total_images'], 3)
+
+
+class ProjectSearchTestCase(TestCase):
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        Project.objects.create(
+            title='Lakeside Villa',
+            description='Residential renovation with open kitchens',
+            project_date='2025-08-19',
+            order=1
+        )
+        Project.objects.create(
+            title='Office Tower',
+            description='Commercial workspace',
+            project_date='2025-08-19',
+            order=2
+        )
+    
+    def search_titles(self, term):
+        response = self.client.get('/api/projects/', {'search': term})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.data['results'] if isinstance(response.data, dict) else response.data
+        return [project['title'] for project in data]
+    
+    def test_search_matches_words_and_substrings(self):
+        """Search matches stemmed words (full-text) and partial words (substring)"""
+        self.assertEqual(self.search_titles('kitchen'), ['Lakeside Villa'])  # stemmed: kitchens
+        self.assertEqual(self.search_titles('reside'), ['Lakeside Villa'])  # substring of Residential
+        self.assertEqual(self.search_titles('tower'), ['Office Tower'])
+        self.assertEqual(self.search_titles('warehouse'), [])
+
+
+class ProjectListQueryCountTestCase(TestCase):
+    def list_query_count(self, url='/api/projects/'):
+        with CaptureQueriesContext(connection) as queries:
+            response = APIClient().get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(queries)
+    
+    def create_projects(self, start, count, category):
+        for i in range(start, start + count):
+            project = Project.objects.create(
+                title=f'Project {i}',
+                description=f'Description {i}',
+                project_date='2025-08-19',
+                order=i
+            )
+            project.categories.add(category)
+    
+    def test_list_query_count_does_not_grow_with_rows(self):
+        """Related data is prefetched, so listing 10 projects costs the same queries as 2"""
+        category = ProjectCategory.objects.create(name='Residential')
+        self.create_projects(1, 2, category)
+        baseline = self.list_query_count()
+        
+        self.create_projects(3, 8, category)
+        self.assertEqual(self.list_query_count(), baseline)
+    
+    def test_service_list_query_count_does_not_grow_with_rows(self):
+        """Same guarantee for services"""
+        category = ServiceCategory.objects.create(name='Interior Design')
+        services = [
+            Service.objects.create(name=f'Service {i}', description=f'Description {i}', order=i)
+            for i in range(1, 11)
+        ]
+        for service in services[:2]:
+            service.categories.add(category)
+        baseline = self.list_query_count('/api/services/?page_size=2')
+        
+        for service in services[2:]:
+            service.categories.add(category)
+        self.assertEqual(self.list_query_count('/api/services/?page_size=10'), baseline)
+
+
+class StorageStatTestCase(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        self.enterContext(override_settings(MEDIA_ROOT=os.path.join(self.media_root, 'media')))
+        os.makedirs(os.path.join(self.media_root, 'media', 'projects'))
+        self.write_file('first.webp', 100)
+        # Rescans run off the request (worker/thread); the tests call refresh() themselves
+        self.schedule_refresh = self.enterContext(mock.patch.object(StorageStat, 'schedule_refresh'))
+    
+    def write_file(self, name, size):
+        with open(os.path.join(self.media_root, 'media', 'projects', name), 'wb') as f:
+            f.write(b'x' * size)
+    
+    def test_scan_is_reused_until_media_changes(self):
+        """Storage usage is read from the stored scan and only rescanned, off the request, after a media model changes"""
+        self.assertEqual(StorageStat.get_usage(), (100, 1))
+        
+        self.write_file('second.webp', 50)
+        self.assertEqual(StorageStat.get_usage(), (100, 1))
+        self.schedule_refresh.assert_not_called()
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            Project.objects.create(title='Storage', description='d', project_date='2025-08-19')
+        self.schedule_refresh.assert_called_once()
+        # Until the queued rescan has run, reads return the last scan
+        self.assertEqual(StorageStat.get_usage(), (100, 1))
+        
+        StorageStat.refresh()
+        self.assertEqual(StorageStat.get_usage(), (150, 2))
+    
+    def test_saves_without_file_changes_keep_the_scan(self):
+        """Title edits and optimized-path updates don't invalidate the stored scan"""
+        with self.captureOnCommitCallbacks(execute=True):
+            project = Project.objects.create(title='Storage', description='d', project_date='2025-08-19')
+        self.assertEqual(StorageStat.get_usage(), (100, 1))
+        self.schedule_refresh.reset_mock()
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            project.title = 'Storage Renamed'
+            project.save()
+            project.optimized_image = 'projects/storage-renamed/webp/cover.webp'
+            project.save(update_fields=['optimized_image'])
+        self.schedule_refresh.assert_not_called()
+        self.assertFalse(StorageStat.objects.get(pk=1).stale)
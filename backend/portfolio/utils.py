@@ -4,7 +4,14 @@ Custom utilities for the portfolio app
 from rest_framework.views import exception_handler
 from rest_framework.response import Response
 from rest_framework import status
+from django.core.cache import cache
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from django.conf import settings
+import hashlib
 import logging
+import os
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -34,3 +41,110 @@ def custom_exception_handler(exc, context):
     logger.error(f"Response status: {response.status_code}")
     
     return response
+
+def bulk_unlink(paths, remove=os.remove, max_workers=32):
+    """
+    Delete many small files concurrently instead of one unlink at a time.
+    Missing files are skipped; returns the number of paths handled successfully
+    """
+    paths = list(paths)
+    if not paths:
+        return 0
+    
+    def unlink(path):
+        try:
+            return remove(path) is not False
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning(f"Error deleting file {path}: {str(e)}")
+            return False
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as pool:
+        return sum(pool.map(unlink, paths))
+
+def directory_usage(path):
+    """
+    (total bytes, file count) under path, walked with os.scandir so directory
+    entries supply their type and cached stat() instead of a getsize() per file.
+    Like os.walk, symlinked directories are not descended into
+    """
+    total_size = 0
+    file_count = 0
+    pending = [path]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif not entry.is_dir():
+                        total_size += entry.stat().st_size
+                        file_count += 1
+                except OSError:
+                    pass
+    return total_size, file_count
+
+def scan_media_usage():
+    """(total bytes, file count) of MEDIA_ROOT plus the old projects directory"""
+    media_root = str(settings.MEDIA_ROOT)
+    total_size = 0
+    file_count = 0
+    for path in (media_root, os.path.join(os.path.dirname(media_root), 'projects')):
+        if os.path.exists(path):
+            size, count = directory_usage(path)
+            total_size += size
+            file_count += count
+    return total_size, file_count
+
+def get_cache_generation(namespace):
+    """
+    Current generation number for a cache namespace ('projects', 'services').
+    Cached views put it in their keys, so bumping it makes every old entry miss
+    """
+    return cache.get(f"{namespace}:rev", 0)
+
+def cached_key(namespace, name):
+    """Build a cache key that belongs to the namespace's current generation"""
+    return f"{name}:v{get_cache_generation(namespace)}"
+
+def bump_cache_generation(namespace):
+    """Invalidate everything cached under a namespace with a single cache op"""
+    try:
+        cache.incr(f"{namespace}:rev")
+    except ValueError:
+        # First bump (or the key was evicted) - start a new generation. Seed it from
+        # the clock so an evicted counter never reissues numbers clients hold as ETags
+        cache.set(f"{namespace}:rev", int(time.time() * 1000), None)
+
+def generation_etag(namespace, name):
+    """
+    ETag for data that only changes together with the namespace's generation.
+    None while the namespace has no generation yet (never bumped, evicted, or a
+    dummy cache), so callers never answer 304 from a counter they can't trust
+    """
+    generation = cache.get(f"{namespace}:rev")
+    if generation is None:
+        return None
+    return '"%s"' % hashlib.md5(f"{name}:v{generation}".encode()).hexdigest()
+
+
+# The only memoized folder lookup. Keyed by the stored slug (not the title),
+# so a rename produces a new key and nothing needs invalidating
+@lru_cache(maxsize=4096)
+def _media_folder(media_root, kind, slug):
+    return os.path.join(media_root, kind, slug)
+
+
+def project_folder(slug):
+    """Absolute media folder for a project slug (memoized per MEDIA_ROOT)"""
+    return _media_folder(str(settings.MEDIA_ROOT), 'projects', slug)
+
+
+def service_folder(slug):
+    """Absolute media folder for a service slug (memoized per MEDIA_ROOT)"""
+    return _media_folder(str(settings.MEDIA_ROOT), 'services', slug)
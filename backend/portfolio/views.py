@@ -1,7 +1,10 @@
 from django.shortcuts import render
 from rest_framework import viewsets
-from .models import Project, Service, ProjectImage, ServiceImage
-from .serializers import ProjectSerializer, ServiceSerializer, ProjectImageSerializer, ServiceImageSerializer
+from .models import (
+    Project, Service, ProjectImage, ServiceImage,
+    ProjectCategory, ProjectSubcategory, ServiceCategory, ServiceSubcategory, StorageStat,
+)
+from .serializers import ProjectSerializer, ServiceSerializer, ProjectImageSerializer, ServiceImageSerializer, RecentProjectSerializer, _absolute_uri
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -9,27 +12,42 @@ from django.contrib.auth import login
 from rest_framework.authtoken.models import Token
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from .auth_serializers import RegistrationSerializer, LoginSerializer
 from rest_framework.exceptions import ValidationError
+from rest_framework.serializers import ListSerializer
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import OrderingFilter
 from django_filters import FilterSet, CharFilter
 import django_filters
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models.functions import Coalesce, JSONObject
+from django.contrib.postgres.search import SearchQuery
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.decorators import action, permission_classes
 from django.http import JsonResponse
 from django.core.files.storage import default_storage
 import os
 import shutil
-from .contact_serializers import ContactSerializer
-from django.db import transaction
+from concurrent.futures import ThreadPoolExecutor
+from .contact_serializers import ContactSerializer, send_contact_email
+from .image_optimizer import ImageOptimizer
+from .async_optimizer import AsyncImageOptimizer
+from .signals import suppress_optimization_signals
+from .tasks import send_contact_email_task
+from .utils import bulk_unlink, bump_cache_generation, cached_key, generation_etag
 from django.middleware.csrf import get_token
 from django.conf import settings
+from django.core.cache import cache
 import time
+import threading
+import operator
+from functools import reduce
+from urllib.parse import quote
 from asgiref.sync import sync_to_async
 from celery import shared_task
 import logging
+import traceback
 from rest_framework.pagination import PageNumberPagination
 
 logger = logging.getLogger(__name__)
@@ -48,6 +66,107 @@ class ServicePagination(PageNumberPagination):
     page_size_query_param = 'page_size'
     max_page_size = 100
 
+# List serializers only show this many album images per project/service
+FEATURED_ALBUM_IMAGES = 6
+
+
+def _album_images_prefetch(image_model, action):
+    """
+    List pages only render the first FEATURED_ALBUM_IMAGES album images of each row,
+    so only those are prefetched (one windowed query) into featured_album_images_prefetched;
+    other actions get the full set
+    """
+    if action == 'list':
+        return models.Prefetch(
+            'album_images',
+            queryset=image_model.objects.all()[:FEATURED_ALBUM_IMAGES],
+            to_attr='featured_album_images_prefetched',
+        )
+    return 'album_images'
+
+
+def _swap_order(model, instance, neighbor, namespace):
+    """
+    Swap two rows' order in one UPDATE ... CASE that only writes the order column.
+    Both rows are locked (SELECT ... FOR UPDATE) and their orders re-read first, so
+    concurrent reorders can't swap from stale values. Must run inside a transaction;
+    update() skips save()/post_save, so the cached listings are invalidated here
+    """
+    orders = dict(
+        model.objects.select_for_update().filter(id__in=[instance.id, neighbor.id]).values_list('id', 'order')
+    )
+    if len(orders) < 2:
+        return
+    model.objects.filter(id__in=orders).update(order=models.Case(
+        models.When(id=instance.id, then=models.Value(orders[neighbor.id])),
+        models.When(id=neighbor.id, then=models.Value(orders[instance.id])),
+        output_field=models.PositiveIntegerField(),
+    ))
+    instance.order, neighbor.order = orders[neighbor.id], orders[instance.id]
+    transaction.on_commit(lambda: bump_cache_generation(namespace))
+
+
+def _generation_etag_with_categories(namespace, name):
+    """
+    ETag for project/service payloads: they change with their namespace's cache
+    generation (saves, deletes, reorders, album and category links bump it) and
+    with the category names they embed
+    """
+    categories = generation_etag('categories', name)
+    return categories and generation_etag(namespace, f"{name}:{categories}")
+
+
+def _taxonomy_prefetches(category_model, subcategory_model):
+    """
+    Categories/subcategories are only rendered by id and name, so the prefetches
+    skip their description and timestamp columns
+    """
+    return (
+        models.Prefetch('categories', queryset=category_model.objects.only('id', 'name')),
+        models.Prefetch('subcategories', queryset=subcategory_model.objects.only('id', 'name')),
+    )
+
+
+def _album_images_count(image_model, parent_field):
+    """Album image count as a correlated subquery, avoiding a GROUP BY over every parent column"""
+    counts = image_model.objects.filter(**{parent_field: models.OuterRef('pk')}).order_by().values(
+        parent_field
+    ).annotate(total=models.Count('pk')).values('total')
+    return Coalesce(models.Subquery(counts), 0)
+
+class CachedPermissionsMixin:
+    """
+    Permission objects are stateless, so each distinct set of permission classes
+    is instantiated once and the same instances are reused for every request
+    """
+    _permission_cache = {}
+
+    def _cached_permissions(self, permission_classes):
+        permissions = self._permission_cache.get(permission_classes)
+        if permissions is None:
+            permissions = [permission() for permission in permission_classes]
+            self._permission_cache[permission_classes] = permissions
+        return permissions
+
+    def get_permissions(self):
+        return self._cached_permissions(tuple(self.permission_classes))
+
+
+class PublicReadAdminWriteMixin(CachedPermissionsMixin):
+    """
+    Allow public read access, but require admin for write operations.
+    Custom @action routes keep the permission_classes they declare.
+    """
+    WRITE_ACTIONS = frozenset({'create', 'update', 'partial_update', 'destroy'})
+
+    def get_permissions(self):
+        if self.action in self.WRITE_ACTIONS:
+            return self._cached_permissions((IsAdminUser,))
+        if self.action in ('list', 'retrieve', None):
+            return self._cached_permissions(())
+        return super().get_permissions()
+
+
 @shared_task
 def create_project_image(project_id, image_data, order):
     try:
@@ -65,6 +184,15 @@ def create_project_image(project_id, image_data, order):
 
 # Create your views here.
 
+_PROJECT_SEARCH_FIELDS = ('title__icontains', 'description__icontains')
+_SERVICE_SEARCH_FIELDS = ('name__icontains', 'description__icontains')
+
+
+def _substring_search(lookups, value):
+    """OR of case-insensitive substring matches over the given lookups"""
+    return reduce(operator.or_, (models.Q(**{lookup: value}) for lookup in lookups))
+
+
 class ProjectFilter(FilterSet):
     category = CharFilter(method='filter_category')
     subcategory = CharFilter(method='filter_subcategory')
@@ -79,10 +207,12 @@ class ProjectFilter(FilterSet):
         return queryset.filter(subcategories__name__iexact=value)
     
     def filter_search(self, queryset, name, value):
-        return queryset.filter(
-            models.Q(title__icontains=value) | 
-            models.Q(description__icontains=value)
-        )
+        substring = _substring_search(_PROJECT_SEARCH_FIELDS, value)
+        # On PostgreSQL also match stemmed words via the GIN-indexed search_vector;
+        # the substring match is served by the pg_trgm indexes when available
+        if connection.vendor == 'postgresql':
+            return queryset.filter(models.Q(search_vector=SearchQuery(value, config='english')) | substring)
+        return queryset.filter(substring)
     
     class Meta:
         model = Project
@@ -103,77 +233,69 @@ class ServiceFilter(FilterSet):
         return queryset.filter(subcategories__name__iexact=value)
     
     def filter_search(self, queryset, name, value):
-        return queryset.filter(
-            models.Q(name__icontains=value) | 
-            models.Q(description__icontains=value)
-        )
+        substring = _substring_search(_SERVICE_SEARCH_FIELDS, value)
+        # On PostgreSQL also match stemmed words via the GIN-indexed search_vector;
+        # the substring match is served by the pg_trgm indexes when available
+        if connection.vendor == 'postgresql':
+            return queryset.filter(models.Q(search_vector=SearchQuery(value, config='english')) | substring)
+        return queryset.filter(substring)
     
     class Meta:
         model = Service
         fields = ['category', 'subcategory']
 
 
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(PublicReadAdminWriteMixin, viewsets.ModelViewSet):
     serializer_class = ProjectSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_class = ProjectFilter
-    search_fields = ['title', 'description']
     ordering_fields = ['project_date', 'title', 'order']
     ordering = ['order', '-project_date']
     pagination_class = ProjectPagination
 
     def get_queryset(self):
         """Optimized queryset with prefetching to avoid N+1 queries"""
-        return Project.objects.select_related().prefetch_related(
-            'categories',
-            'subcategories', 
-            'album_images'
+        return Project.objects.prefetch_related(
+            *_taxonomy_prefetches(ProjectCategory, ProjectSubcategory),
+            _album_images_prefetch(ProjectImage, self.action)
         ).annotate(
-            album_images_count_annotated=models.Count('album_images')
+            album_images_count_annotated=_album_images_count(ProjectImage, 'project')
         ).order_by('order', '-project_date')
 
-    def get_serializer_context(self):
-        """Add request to serializer context so it can build absolute URLs"""
-        context = super().get_serializer_context()
-        context['request'] = self.request
-        return context
-
-    def get_permissions(self):
-        """
-        Allow public read access, but require admin for write operations
-        """
-        if self.action in ['create', 'update', 'partial_update', 'destroy']:
-            permission_classes = [IsAdminUser]
-        else:
-            permission_classes = []
-        return [permission() for permission in permission_classes]
+    @method_decorator(condition(etag_func=lambda request, *args, **kwargs: _generation_etag_with_categories(
+        'projects', f"list:{request.get_full_path()}"
+    )))
+    def list(self, request, *args, **kwargs):
+        # Clients revalidating an unchanged listing get a 304 before any query or serialization
+        return super().list(request, *args, **kwargs)
 
     def perform_create(self, serializer):
+        if isinstance(serializer, ListSerializer):
+            # Bulk INSERT - no per-row save() or signals, so invalidate caches here
+            with transaction.atomic():
+                # Explicit orders are made room for inside the bulk create
+                serializer.save()
+                transaction.on_commit(lambda: bump_cache_generation('projects'))
+            return
+        
         try:
             # Capture original filename from uploaded image
             image_file = self.request.FILES.get('image')
             
             # CRITICAL FIX: Completely disable ALL optimization signals during creation for instant response
-            from django.db.models.signals import post_save, pre_save
-            from portfolio.signals import optimize_project_images_on_save
-            
-            # Disconnect ALL optimization signals to ensure instant response
-            post_save.disconnect(optimize_project_images_on_save, sender=serializer.Meta.model)
             
-            try:
+            # Suppress optimization signals (this thread only) to ensure instant response
+            with suppress_optimization_signals():
                 # Get the order from the data
                 order = serializer.validated_data.get('order')
                 
                 with transaction.atomic():
                     # If an order is specified, shift existing projects to make room
                     if order is not None and order >= 1:
-                        # Only shift if there are actually projects with order >= new_order
-                        # This avoids unnecessary database operations
-                        existing_count = Project.objects.filter(order__gte=order).count()
-                        if existing_count > 0:
-                            Project.objects.filter(order__gte=order).update(
-                                order=models.F('order') + 1
-                            )
+                        # A single UPDATE; it simply matches no rows when nothing needs shifting
+                        Project.objects.filter(order__gte=order).update(
+                            order=models.F('order') + 1
+                        )
                     
                     # Save the project with the image filename if provided - NO PROCESSING
                     if image_file:
@@ -187,7 +309,6 @@ class ProjectViewSet(viewsets.ModelViewSet):
                     if image_file:
                         def queue_optimization():
                             try:
-                                from portfolio.async_optimizer import AsyncImageOptimizer
                                 AsyncImageOptimizer.queue_project_optimization(
                                     project_id=instance.id,
                                     operation_type='create'
@@ -199,14 +320,9 @@ class ProjectViewSet(viewsets.ModelViewSet):
                         # Queue after transaction commits (non-blocking)
                         transaction.on_commit(queue_optimization)
                         
-            finally:
-                # Reconnect the signal
-                post_save.connect(optimize_project_images_on_save, sender=serializer.Meta.model)
-                
         except Exception as e:
             logger.error(f"Error in perform_create: {e}")
             logger.error(f"Error type: {type(e)}")
-            import traceback
             logger.error(traceback.format_exc())
             raise e
 
@@ -217,13 +333,9 @@ class ProjectViewSet(viewsets.ModelViewSet):
             album_images = self.request.FILES.getlist('album_images')
             
             # CRITICAL FIX: Completely disable ALL signals during updates to prevent blocking
-            from django.db.models.signals import post_save, pre_save
-            from portfolio.signals import optimize_project_images_on_save
             
-            # Disconnect ALL optimization signals to ensure instant response
-            post_save.disconnect(optimize_project_images_on_save, sender=serializer.Meta.model)
-            
-            try:
+            # Suppress optimization signals (this thread only) to ensure instant response
+            with suppress_optimization_signals():
                 # Save without any processing - FAST PATH
                 instance = serializer.save()
                 
@@ -241,7 +353,6 @@ class ProjectViewSet(viewsets.ModelViewSet):
                 if image_file or album_images:
                     def queue_optimization():
                         try:
-                            from portfolio.async_optimizer import AsyncImageOptimizer
                             AsyncImageOptimizer.queue_project_optimization(
                                 project_id=instance.id,
                                 operation_type='main_image_update' if image_file else 'album_update'
@@ -253,14 +364,9 @@ class ProjectViewSet(viewsets.ModelViewSet):
                     # Queue after transaction commits (non-blocking)
                     transaction.on_commit(queue_optimization)
                     
-            finally:
-                # Reconnect the signal
-                post_save.connect(optimize_project_images_on_save, sender=serializer.Meta.model)
-                
         except Exception as e:
             logger.error(f"Error in perform_update: {e}")
             logger.error(f"Error type: {type(e)}")
-            import traceback
             logger.error(traceback.format_exc())
             raise e
 
@@ -282,19 +388,17 @@ class ProjectViewSet(viewsets.ModelViewSet):
 
     def create(self, request, *args, **kwargs):
         try:
-            if isinstance(request.data, list):
-                serializer = self.get_serializer(data=request.data, many=True)
-                serializer.is_valid(raise_exception=True)
-                self.perform_create(serializer)
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
-            elif isinstance(request.data, dict):
-                return super().create(request, *args, **kwargs)
-            else:
+            many = isinstance(request.data, list)
+            if not many and not isinstance(request.data, dict):
                 raise ValidationError("Invalid data format. Expected a dictionary or a list of dictionaries.")
+            serializer = self.get_serializer(data=request.data, many=many)
+            serializer.is_valid(raise_exception=True)
+            self.perform_create(serializer)
+            headers = self.get_success_headers(serializer.data)
+            return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
         except Exception as e:
             logger.error(f"Error in project create: {e}")
             logger.error(f"Error type: {type(e)}")
-            import traceback
             logger.error(traceback.format_exc())
             
             # Return a proper error response instead of letting Django handle it
@@ -382,9 +486,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
                     
                     if previous_project:
                         # Swap orders
-                        project.order, previous_project.order = previous_project.order, project.order
-                        project.save()
-                        previous_project.save()
+                        _swap_order(Project, project, previous_project, 'projects')
                         return Response({'message': 'Project moved up successfully'})
                     else:
                         return Response({'error': 'Project is already first'}, status=status.HTTP_400_BAD_REQUEST)
@@ -403,9 +505,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
                     
                     if next_project:
                         # Swap orders
-                        project.order, next_project.order = next_project.order, project.order
-                        project.save()
-                        next_project.save()
+                        _swap_order(Project, project, next_project, 'projects')
                         return Response({'message': 'Project moved down successfully'})
                     else:
                         return Response({'error': 'Project is already last'}, status=status.HTTP_400_BAD_REQUEST)
@@ -423,10 +523,30 @@ class ProjectViewSet(viewsets.ModelViewSet):
         if not project_ids:
             return Response({'error': 'project_ids array is required'}, status=status.HTTP_400_BAD_REQUEST)
         
+        try:
+            # One UPDATE ... CASE for the whole list (later duplicates win, as before)
+            new_orders = {int(project_id): index for index, project_id in enumerate(project_ids, start=1)}
+        except (TypeError, ValueError):
+            return Response({'error': 'project_ids must be a list of integer IDs'}, status=status.HTTP_400_BAD_REQUEST)
+        
         try:
             with transaction.atomic():
-                for index, project_id in enumerate(project_ids, start=1):
-                    Project.objects.filter(id=project_id).update(order=index)
+                # Every ID must exist; checked with one SELECT before the single UPDATE
+                existing = set(Project.objects.filter(id__in=new_orders).values_list('id', flat=True))
+                missing = [project_id for project_id in new_orders if project_id not in existing]
+                if missing:
+                    return Response({
+                        'error': 'Projects not found',
+                        'missing_ids': missing
+                    }, status=status.HTTP_400_BAD_REQUEST)
+                
+                Project.objects.filter(id__in=new_orders).update(order=models.Case(
+                    *[models.When(id=project_id, then=models.Value(index)) for project_id, index in new_orders.items()],
+                    default=models.F('order'),
+                    output_field=models.PositiveIntegerField(),
+                ))
+                # update() skips post_save, so invalidate the cached listings here
+                transaction.on_commit(lambda: bump_cache_generation('projects'))
             
             return Response({'message': f'{len(project_ids)} projects reordered successfully'})
         except Exception as e:
@@ -437,14 +557,10 @@ class ProjectViewSet(viewsets.ModelViewSet):
         """
         DEBUG ENDPOINT: Manually trigger optimization for a specific project
         """
-        import logging
-        logger = logging.getLogger(__name__)
         
         project = self.get_object()
         
         try:
-            from .image_optimizer import ImageOptimizer
-            
             # Check project state
             has_main_image = bool(project.image)
             has_album_images = project.album_images.exists()
@@ -486,54 +602,32 @@ class ProjectViewSet(viewsets.ModelViewSet):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class ServiceViewSet(viewsets.ModelViewSet):
+class ServiceViewSet(PublicReadAdminWriteMixin, viewsets.ModelViewSet):
     serializer_class = ServiceSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_class = ServiceFilter
-    search_fields = ['name', 'description']
     ordering_fields = ['name', 'order']
     ordering = ['order', 'name']
     pagination_class = ServicePagination
 
     def get_queryset(self):
         """Optimized queryset with prefetching to avoid N+1 queries"""
-        return Service.objects.select_related().prefetch_related(
-            'categories',
-            'subcategories',
-            'album_images'
+        return Service.objects.prefetch_related(
+            *_taxonomy_prefetches(ServiceCategory, ServiceSubcategory),
+            _album_images_prefetch(ServiceImage, self.action)
         ).annotate(
-            album_images_count_annotated=models.Count('album_images')
+            album_images_count_annotated=_album_images_count(ServiceImage, 'service')
         ).order_by('order', 'name')
 
-    def get_serializer_context(self):
-        """Add request to serializer context so it can build absolute URLs"""
-        context = super().get_serializer_context()
-        context['request'] = self.request
-        return context
-
-    def get_permissions(self):
-        """
-        Allow public read access, but require admin for write operations
-        """
-        if self.action in ['create', 'update', 'partial_update', 'destroy']:
-            permission_classes = [IsAdminUser]
-        else:
-            permission_classes = []
-        return [permission() for permission in permission_classes]
-
     def perform_create(self, serializer):
         try:
             # Capture original filename from uploaded icon
             icon_file = self.request.FILES.get('icon')
             
             # CRITICAL FIX: Disable service optimization signals for instant response
-            from django.db.models.signals import post_save
-            from portfolio.signals import optimize_service_images_on_save
-            
-            # Disconnect optimization signals to ensure instant response
-            post_save.disconnect(optimize_service_images_on_save, sender=serializer.Meta.model)
             
-            try:
+            # Suppress optimization signals (this thread only) to ensure instant response
+            with suppress_optimization_signals():
                 # Get the order from the data
                 order = serializer.validated_data.get('order')
                 
@@ -556,7 +650,6 @@ class ServiceViewSet(viewsets.ModelViewSet):
                     if icon_file:
                         def queue_optimization():
                             try:
-                                from portfolio.async_optimizer import AsyncImageOptimizer
                                 AsyncImageOptimizer.queue_service_optimization(
                                     service_id=instance.id,
                                     operation_type='create'
@@ -568,14 +661,9 @@ class ServiceViewSet(viewsets.ModelViewSet):
                         # Queue after transaction commits (non-blocking)
                         transaction.on_commit(queue_optimization)
                         
-            finally:
-                # Reconnect the signal
-                post_save.connect(optimize_service_images_on_save, sender=serializer.Meta.model)
-                
         except Exception as e:
             logger.error(f"Error in service perform_create: {e}")
             logger.error(f"Error type: {type(e)}")
-            import traceback
             logger.error(traceback.format_exc())
             raise e
 
@@ -586,13 +674,9 @@ class ServiceViewSet(viewsets.ModelViewSet):
             album_images = self.request.FILES.getlist('album_images')
             
             # CRITICAL FIX: Disable service optimization signals for instant response
-            from django.db.models.signals import post_save
-            from portfolio.signals import optimize_service_images_on_save
-            
-            # Disconnect optimization signals to ensure instant response
-            post_save.disconnect(optimize_service_images_on_save, sender=serializer.Meta.model)
             
-            try:
+            # Suppress optimization signals (this thread only) to ensure instant response
+            with suppress_optimization_signals():
                 # Save without any processing - FAST PATH
                 instance = serializer.save()
                 
@@ -610,7 +694,6 @@ class ServiceViewSet(viewsets.ModelViewSet):
                 if icon_file or album_images:
                     def queue_optimization():
                         try:
-                            from portfolio.async_optimizer import AsyncImageOptimizer
                             AsyncImageOptimizer.queue_service_optimization(
                                 service_id=instance.id,
                                 operation_type='icon_update' if icon_file else 'album_update'
@@ -622,14 +705,9 @@ class ServiceViewSet(viewsets.ModelViewSet):
                     # Queue after transaction commits (non-blocking)
                     transaction.on_commit(queue_optimization)
                     
-            finally:
-                # Reconnect the signal
-                post_save.connect(optimize_service_images_on_save, sender=serializer.Meta.model)
-                
         except Exception as e:
             logger.error(f"Error in service perform_update: {e}")
             logger.error(f"Error type: {type(e)}")
-            import traceback
             logger.error(traceback.format_exc())
             raise e
 
@@ -699,9 +777,7 @@ class ServiceViewSet(viewsets.ModelViewSet):
                     
                     if previous_service:
                         # Swap orders
-                        service.order, previous_service.order = previous_service.order, service.order
-                        service.save()
-                        previous_service.save()
+                        _swap_order(Service, service, previous_service, 'services')
                         return Response({'message': 'Service moved up successfully'})
                     else:
                         return Response({'error': 'Service is already first'}, status=status.HTTP_400_BAD_REQUEST)
@@ -714,9 +790,7 @@ class ServiceViewSet(viewsets.ModelViewSet):
                     
                     if next_service:
                         # Swap orders
-                        service.order, next_service.order = next_service.order, service.order
-                        service.save()
-                        next_service.save()
+                        _swap_order(Service, service, next_service, 'services')
                         return Response({'message': 'Service moved down successfully'})
                     else:
                         return Response({'error': 'Service is already last'}, status=status.HTTP_400_BAD_REQUEST)
@@ -734,24 +808,45 @@ class ServiceViewSet(viewsets.ModelViewSet):
         if not service_ids:
             return Response({'error': 'service_ids array is required'}, status=status.HTTP_400_BAD_REQUEST)
         
+        try:
+            # One UPDATE ... CASE for the whole list (later duplicates win, as before)
+            new_orders = {int(service_id): index for index, service_id in enumerate(service_ids, start=1)}
+        except (TypeError, ValueError):
+            return Response({'error': 'service_ids must be a list of integer IDs'}, status=status.HTTP_400_BAD_REQUEST)
+        
         try:
             with transaction.atomic():
-                for index, service_id in enumerate(service_ids, start=1):
-                    Service.objects.filter(id=service_id).update(order=index)
+                # Every ID must exist; checked with one SELECT before the single UPDATE
+                existing = set(Service.objects.filter(id__in=new_orders).values_list('id', flat=True))
+                missing = [service_id for service_id in new_orders if service_id not in existing]
+                if missing:
+                    return Response({
+                        'error': 'Services not found',
+                        'missing_ids': missing
+                    }, status=status.HTTP_400_BAD_REQUEST)
+                
+                Service.objects.filter(id__in=new_orders).update(order=models.Case(
+                    *[models.When(id=service_id, then=models.Value(index)) for service_id, index in new_orders.items()],
+                    default=models.F('order'),
+                    output_field=models.PositiveIntegerField(),
+                ))
+                # update() skips post_save, so invalidate the cached listings here
+                transaction.on_commit(lambda: bump_cache_generation('services'))
             
             return Response({'message': f'{len(service_ids)} services reordered successfully'})
         except Exception as e:
             return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class RegistrationView(APIView):
+class RegistrationView(CachedPermissionsMixin, APIView):
     authentication_classes = []
     permission_classes = []
     def post(self, request):
         serializer = RegistrationSerializer(data=request.data)
         if serializer.is_valid():
             user = serializer.save()
-            token, created = Token.objects.get_or_create(user=user)
+            # A brand-new user cannot have a token yet, so skip get_or_create's SELECT
+            token = Token.objects.create(user=user)
             return Response({
                 "message": "User registered successfully",
                 "token": token.key,
@@ -764,7 +859,7 @@ class RegistrationView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class LoginView(APIView):
+class LoginView(CachedPermissionsMixin, APIView):
     authentication_classes = []
     permission_classes = []
     def post(self, request):
@@ -784,123 +879,100 @@ class LoginView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class CategorySubcategoriesView(APIView):
+class CategorySubcategoriesView(CachedPermissionsMixin, APIView):
     """
     API endpoint to get categories and subcategories for projects and services.
+    Each branch is served by a single query, and payloads are cached until the
+    taxonomy changes (category signals bump the 'categories' cache generation).
     """
+    CACHE_TIMEOUT = 300
+    # type -> (category model, subcategory model); unknown types fall back to projects
+    MODEL_MAP = {
+        'project': (ProjectCategory, ProjectSubcategory),
+        'service': (ServiceCategory, ServiceSubcategory),
+    }
+    
+    @staticmethod
+    def _payload_name(request):
+        model_type = request.GET.get('type', 'project')  # 'project' or 'service'
+        return f"category_subcategories:{quote(model_type)}:{quote(request.GET.get('category') or '')}"
+    
+    @method_decorator(condition(etag_func=lambda request: generation_etag('categories', CategorySubcategoriesView._payload_name(request))))
     def get(self, request):
+        # Clients revalidating an unchanged taxonomy get a 304 from the ETag above
         model_type = request.GET.get('type', 'project')  # 'project' or 'service'
         category = request.GET.get('category')
         
-        # Import models here to avoid circular imports
-        from .models import ProjectCategory, ProjectSubcategory, ServiceCategory, ServiceSubcategory
+        cache_key = cached_key('categories', self._payload_name(request))
+        payload = cache.get(cache_key)
+        if payload is None:
+            payload = self._build_payload(model_type, category)
+            cache.set(cache_key, payload, self.CACHE_TIMEOUT)
+        return Response(payload)
+    
+    def _build_payload(self, model_type, category):
+        category_model, subcategory_model = self.MODEL_MAP.get(model_type, self.MODEL_MAP['project'])
         
-        if model_type == 'service':
-            # Get service categories from database with optimized queries
-            if category:
-                # Find the category and return its subcategories
-                try:
-                    cat_obj = ServiceCategory.objects.prefetch_related('subcategories').get(name=category)
-                    subcategories = [
-                        {'value': sub.name, 'label': sub.name} 
-                        for sub in cat_obj.subcategories.all()
-                    ]
-                    return Response({
-                        'category': category,
-                        'subcategories': subcategories
-                    })
-                except ServiceCategory.DoesNotExist:
-                    return Response({
-                        'category': category,
-                        'subcategories': []
-                    })
-            else:
-                # Return all service categories and their subcategories with optimized query
-                categories = ServiceCategory.objects.prefetch_related('subcategories').all()
-                formatted_categories = {}
-                category_list = []
-                
-                for cat in categories:
-                    subcategories = [
-                        {'value': sub.name, 'label': sub.name} 
-                        for sub in cat.subcategories.all()
-                    ]
-                    formatted_categories[cat.name] = subcategories
-                    category_list.append({'value': cat.name, 'label': cat.name})
-                
-                return Response({
-                    'type': model_type,
-                    'categories': formatted_categories,
-                    'category_list': category_list
-                })
+        if category:
+            # Subcategories of one category (empty when the category doesn't exist)
+            subcategories = subcategory_model.objects.filter(
+                category__name=category
+            ).order_by('name').values_list(JSONObject(value='name', label='name'), flat=True)
+            return {
+                'category': category,
+                'subcategories': list(subcategories)
+            }
+        
+        if connection.vendor == 'postgresql':
+            formatted_categories, category_list = self._aggregate_categories(category_model, subcategory_model)
         else:
-            # Get project categories from database with optimized queries
-            if category:
-                # Find the category and return its subcategories
-                try:
-                    cat_obj = ProjectCategory.objects.prefetch_related('subcategories').get(name=category)
-                    subcategories = [
-                        {'value': sub.name, 'label': sub.name} 
-                        for sub in cat_obj.subcategories.all()
-                    ]
-                    return Response({
-                        'category': category,
-                        'subcategories': subcategories
-                    })
-                except ProjectCategory.DoesNotExist:
-                    return Response({
-                        'category': category,
-                        'subcategories': []
-                    })
-            else:
-                # Return all project categories and their subcategories with optimized query
-                categories = ProjectCategory.objects.prefetch_related('subcategories').all()
-                formatted_categories = {}
-                category_list = []
-                
-                for cat in categories:
-                    subcategories = [
-                        {'value': sub.name, 'label': sub.name} 
-                        for sub in cat.subcategories.all()
-                    ]
-                    formatted_categories[cat.name] = subcategories
-                    category_list.append({'value': cat.name, 'label': cat.name})
-                
-                return Response({
-                    'type': model_type,
-                    'categories': formatted_categories,
-                    'category_list': category_list
-                })
+            # All categories with their subcategories in one LEFT JOIN
+            formatted_categories = {}
+            category_list = []
+            rows = category_model.objects.order_by('name', 'subcategories__name').values_list('name', 'subcategories__name')
+            for cat_name, sub_name in rows:
+                if cat_name not in formatted_categories:
+                    formatted_categories[cat_name] = []
+                    category_list.append({'value': cat_name, 'label': cat_name})
+                if sub_name is not None:
+                    formatted_categories[cat_name].append({'value': sub_name, 'label': sub_name})
+        
+        return {
+            'type': model_type,
+            'categories': formatted_categories,
+            'category_list': category_list
+        }
+    
+    @staticmethod
+    def _aggregate_categories(category_model, subcategory_model):
+        """
+        Build the name -> subcategories mapping and the category list server-side with
+        JSON aggregation, so no model rows are instantiated or looped over in Python.
+        json (not jsonb) aggregation keeps the categories in name order.
+        """
+        sql = f"""
+            SELECT
+                COALESCE(json_object_agg(c.name, COALESCE(sub.subs, '[]'::json) ORDER BY c.name), '{{}}'::json),
+                COALESCE(json_agg(json_build_object('value', c.name, 'label', c.name) ORDER BY c.name), '[]'::json)
+            FROM {category_model._meta.db_table} c
+            LEFT JOIN LATERAL (
+                SELECT json_agg(json_build_object('value', s.name, 'label', s.name) ORDER BY s.name) AS subs
+                FROM {subcategory_model._meta.db_table} s
+                WHERE s.category_id = c.id
+            ) sub ON TRUE
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+            return cursor.fetchone()
 
 
 def calculate_storage_info():
-    """Calculate storage usage information"""
+    """
+    Calculate storage usage information. Media totals come from the stored
+    scan (StorageStat), which is only redone after media changes
+    """
     media_root = settings.MEDIA_ROOT
-    total_size = 0
-    file_count = 0
-    
-    # Calculate size of media files
-    if os.path.exists(media_root):
-        for root, dirs, files in os.walk(media_root):
-            for file in files:
-                file_path = os.path.join(root, file)
-                try:
-                    total_size += os.path.getsize(file_path)
-                    file_count += 1
-                except OSError:
-                    pass
-    
-    # Also check old projects directory if it exists
-    old_projects_dir = os.path.join(os.path.dirname(media_root), 'projects')
-    if os.path.exists(old_projects_dir):
-        for root, dirs, files in os.walk(old_projects_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                try:
-                    total_size += os.path.getsize(file_path)
-                    file_count += 1
-                except OSError:
-                    pass
+    total_size, file_count = StorageStat.get_usage()
     
     # Convert to MB
     total_size_mb = total_size / (1024 * 1024)
@@ -924,7 +996,7 @@ def calculate_storage_info():
     }
 
 
-class AdminStorageStatsView(APIView):
+class AdminStorageStatsView(CachedPermissionsMixin, APIView):
     """
     API endpoint for getting only storage statistics (faster than full dashboard)
     """
@@ -937,7 +1009,26 @@ class AdminStorageStatsView(APIView):
         })
 
 
-class AdminDashboardView(APIView):
+def _category_tree(category_model):
+    """
+    {category name: [{id, name, description} of its subcategories]} read with a
+    single LEFT JOIN values_list, ordered like the models' default orderings.
+    The subcategory dicts are built by the database (JSONObject)
+    """
+    tree = {}
+    rows = category_model.objects.order_by('name', 'subcategories__name').values_list(
+        'name', 'subcategories__id', JSONObject(
+            id='subcategories__id', name='subcategories__name', description='subcategories__description'
+        )
+    )
+    for cat_name, sub_id, subcategory in rows:
+        subcategories = tree.setdefault(cat_name, [])
+        if sub_id is not None:
+            subcategories.append(subcategory)
+    return tree
+
+
+class AdminDashboardView(CachedPermissionsMixin, APIView):
     """
     Admin dashboard API endpoint for superuser only
     """
@@ -947,47 +1038,29 @@ class AdminDashboardView(APIView):
         try:
             user = request.user
             
-            # Import models here to avoid circular imports
-            from .models import ProjectCategory, ProjectSubcategory, ServiceCategory, ServiceSubcategory
-            
-            # Get statistics
-            projects_count = Project.objects.count()
-            services_count = Service.objects.count()
-            recent_projects = Project.objects.order_by('order', '-project_date')[:5]
+            # Get statistics (both counts in one round trip)
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT (SELECT COUNT(*) FROM %s), (SELECT COUNT(*) FROM %s)" % (
+                    connection.ops.quote_name(Project._meta.db_table),
+                    connection.ops.quote_name(Service._meta.db_table),
+                ))
+                projects_count, services_count = cursor.fetchone()
+            recent_projects = Project.objects.only(*RecentProjectSerializer.LOAD_FIELDS).prefetch_related(
+                'categories'
+            ).order_by('order', '-project_date')[:5]
             
             # Get storage information
             storage_info = calculate_storage_info()
             
-            # Get dynamic categories
-            project_categories = ProjectCategory.objects.prefetch_related('subcategories').all()
-            service_categories = ServiceCategory.objects.prefetch_related('subcategories').all()
-            
-            # Format project categories
-            project_cats_formatted = {}
-            for cat in project_categories:
-                subcategories = [
-                    {'id': sub.id, 'name': sub.name, 'description': sub.description} 
-                    for sub in cat.subcategories.all()
-                ]
-                project_cats_formatted[cat.name] = subcategories
-            
-            # Format service categories
-            service_cats_formatted = {}
-            for cat in service_categories:
-                subcategories = [
-                    {'id': sub.id, 'name': sub.name, 'description': sub.description} 
-                    for sub in cat.subcategories.all()
-                ]
-                service_cats_formatted[cat.name] = subcategories
+            # Get dynamic categories (one query per taxonomy, no model instances)
+            project_cats_formatted = _category_tree(ProjectCategory)
+            service_cats_formatted = _category_tree(ServiceCategory)
             
             # Serialize recent projects with proper context
             try:
-                recent_projects_data = ProjectSerializer(recent_projects, many=True, context={'request': request}).data
+                recent_projects_data = RecentProjectSerializer(recent_projects, many=True, context={'request': request}).data
             except Exception as e:
-                print(f"Error serializing recent projects: {e}")
-                print(f"Error type: {type(e)}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("Error serializing recent projects: %s", e)
                 # Return empty list if serialization fails
                 recent_projects_data = []
             
@@ -1011,10 +1084,7 @@ class AdminDashboardView(APIView):
                 }
             })
         except Exception as e:
-            print(f"Error in AdminDashboardView: {e}")
-            print(f"Error type: {type(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error in AdminDashboardView: %s", e)
             
             # Return a basic response if there's an error
             return Response({
@@ -1045,7 +1115,7 @@ class AdminDashboardView(APIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class AdminCheckView(APIView):
+class AdminCheckView(CachedPermissionsMixin, APIView):
     """
     Check if current user is admin
     """
@@ -1070,7 +1140,7 @@ class AdminCheckView(APIView):
             })
 
 
-class OptimizationStatusView(APIView):
+class OptimizationStatusView(CachedPermissionsMixin, APIView):
     """
     Check the status of background image optimization
     """
@@ -1078,7 +1148,6 @@ class OptimizationStatusView(APIView):
     
     def get(self, request):
         try:
-            from portfolio.async_optimizer import AsyncImageOptimizer
             status = AsyncImageOptimizer.get_queue_status()
             
             return Response({
@@ -1092,7 +1161,7 @@ class OptimizationStatusView(APIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class CSRFTokenView(APIView):
+class CSRFTokenView(CachedPermissionsMixin, APIView):
     """
     Return CSRF token for frontend use
     """
@@ -1103,7 +1172,7 @@ class CSRFTokenView(APIView):
         return JsonResponse({'csrfToken': token})
 
 
-class ContactView(APIView):
+class ContactView(CachedPermissionsMixin, APIView):
     """
     Handle contact form submissions - no authentication required
     """
@@ -1111,48 +1180,70 @@ class ContactView(APIView):
     
     def post(self, request):
         """Handle contact form submission"""
-        print(f"Contact form data received: {request.data}")
+        logger.debug("Contact form data received: %s", request.data)
         
         serializer = ContactSerializer(data=request.data)
         
         if serializer.is_valid():
-            try:
-                # Send the email
-                success = serializer.save()
-                
-                if success:
-                    return Response({
-                        'message': 'Thank you for your message! We will get back to you soon.',
-                        'success': True
-                    }, status=status.HTTP_200_OK)
-                else:
-                    return Response({
-                        'message': 'Message received but email notification failed. We will still respond to you.',
-                        'success': True
-                    }, status=status.HTTP_200_OK)
-                    
-            except Exception as e:
-                print(f"Contact form error: {str(e)}")
-                return Response({
-                    'message': 'Message received but email notification failed. We will still respond to you.',
-                    'success': True
-                }, status=status.HTTP_200_OK)
+            # Send the email off the request cycle - SMTP can take seconds
+            self._queue_email(dict(serializer.validated_data))
+            return Response({
+                'message': 'Thank you for your message! We will get back to you soon.',
+                'success': True
+            }, status=status.HTTP_200_OK)
         
-        print(f"Validation errors: {serializer.errors}")
+        logger.warning(f"Contact form validation errors: {serializer.errors}")
         return Response({
             'errors': serializer.errors,
             'success': False
         }, status=status.HTTP_400_BAD_REQUEST)
+    
+    def _queue_email(self, data):
+        if getattr(settings, 'CONTACT_EMAIL_USE_CELERY', False):
+            try:
+                send_contact_email_task.delay(data)
+                return
+            except Exception as e:
+                logger.error(f"Could not queue contact email, sending in background thread: {str(e)}")
+        
+        threading.Thread(target=send_contact_email, args=(data,), daemon=True).start()
+
+
+def _store_album_uploads(album_images, uploads):
+    """
+    Write uploaded files for unsaved album image rows to storage in parallel
+    and point each row at its stored name, so bulk_create only has to INSERT
+    """
+    if not album_images:
+        return
+    
+    field = type(album_images[0])._meta.get_field('image')
+    
+    def store(pair):
+        album_image, upload = pair
+        name = field.generate_filename(album_image, upload.name)
+        album_image.image = field.storage.save(name, upload, max_length=field.max_length)
+    
+    with ThreadPoolExecutor(max_workers=min(16, len(album_images))) as pool:
+        list(pool.map(store, zip(album_images, uploads)))
 
 
-class ProjectImageViewSet(viewsets.ModelViewSet):
+def _discard_album_uploads(album_images):
+    """Delete files stored by _store_album_uploads whose rows were never inserted"""
+    if not album_images:
+        return
+    storage = type(album_images[0])._meta.get_field('image').storage
+    bulk_unlink([album_image.image.name for album_image in album_images if album_image.image], remove=storage.delete)
+
+
+class ProjectImageViewSet(PublicReadAdminWriteMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing project album images
     """
     serializer_class = ProjectImageSerializer
     filter_backends = [DjangoFilterBackend, OrderingFilter]
-    ordering_fields = ['order', 'created_at']
-    ordering = ['order', 'created_at']
+    ordering_fields = ['order', 'id']
+    ordering = ['order', 'id']
 
     def get_queryset(self):
         """Filter images by project if project_id is provided"""
@@ -1162,34 +1253,12 @@ class ProjectImageViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(project_id=project_id)
         return queryset
 
-    def get_serializer_context(self):
-        """Add request to serializer context so it can build absolute URLs"""
-        context = super().get_serializer_context()
-        context['request'] = self.request
-        return context
-
-    def get_permissions(self):
-        """
-        Allow public read access, but require admin for write operations
-        """
-        if self.action in ['create', 'update', 'partial_update', 'destroy']:
-            permission_classes = [IsAdminUser]
-        else:
-            permission_classes = []
-        return [permission() for permission in permission_classes]
-
     @action(detail=False, methods=['post'], permission_classes=[IsAdminUser])
     def bulk_upload(self, request):
         """
         Bulk upload multiple images for a project
         OPTIMIZED: Sends response immediately, processes images efficiently with single optimization call
         """
-        import logging
-        import threading
-        from django.db.models.signals import post_save
-        from .signals import optimize_project_album_image_on_save
-        
-        logger = logging.getLogger(__name__)
         start_time = time.time()
 
         # Validate inputs first
@@ -1198,7 +1267,8 @@ class ProjectImageViewSet(viewsets.ModelViewSet):
             return Response({'error': 'project_id is required'}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            project = Project.objects.get(id=project_id)
+            # Only what the album upload path needs (title/folder_slug)
+            project = Project.objects.only('id', 'title', 'folder_slug').get(id=project_id)
         except Project.DoesNotExist:
             return Response({'error': 'Project not found'}, status=status.HTTP_404_NOT_FOUND)
 
@@ -1215,30 +1285,41 @@ class ProjectImageViewSet(viewsets.ModelViewSet):
 
         replace_existing = request.data.get('replace_existing', 'false').lower() == 'true'
 
-        # CRITICAL FIX: Disconnect ALL optimization signals during bulk upload for instant response
-        post_save.disconnect(optimize_project_album_image_on_save, sender=ProjectImage)
-        
+        # CRITICAL FIX: Suppress optimization signals during bulk upload for instant response
         try:
+            # Write the files to storage in parallel before opening the transaction,
+            # so no row locks are held while uploads are stored
+            new_images = [
+                ProjectImage(project=project, original_filename=image.name, order=i)
+                for i, image in enumerate(images)
+            ]
+            _store_album_uploads(new_images, images)
+            
             # FASTEST PATH: Only database operations, no image processing at all
-            with transaction.atomic():
-                if replace_existing:
-                    # Delete existing images without processing
-                    existing_images = ProjectImage.objects.filter(project=project)
-                    for existing_image in existing_images:
-                        if existing_image.image:
-                            existing_image.image.delete(save=False)
-                    existing_images.delete()
-
-                # Create image records ONLY - no processing whatsoever
-                created_images = []
-                for i, image in enumerate(images):
-                    project_image = ProjectImage.objects.create(
-                        project=project,
-                        image=image,
-                        original_filename=image.name,
-                        order=i
-                    )
-                    created_images.append(project_image)
+            try:
+                with transaction.atomic(), suppress_optimization_signals():
+                    if replace_existing:
+                        # Delete existing images without processing - read only the file
+                        # names, drop the rows in one DELETE and unlink the files as a batch
+                        existing_images = ProjectImage.objects.filter(project=project)
+                        existing_paths = [
+                            os.path.join(settings.MEDIA_ROOT, name)
+                            for name in existing_images.exclude(image='').values_list('image', flat=True)
+                        ]
+                        existing_images._raw_delete(existing_images.db)
+                        bulk_unlink(existing_paths + [
+                            variant for path in existing_paths
+                            for variant in ImageOptimizer.optimized_variant_paths(path)
+                        ])
+
+                    # Create image records ONLY - one INSERT per batch;
+                    # bulk_create skips post_save, so invalidate the cache and storage stats here
+                    created_images = ProjectImage.objects.bulk_create(new_images, batch_size=100)
+                    transaction.on_commit(lambda: bump_cache_generation('projects'))
+                    transaction.on_commit(StorageStat.media_changed)
+            except Exception:
+                _discard_album_uploads(new_images)
+                raise
 
             # SEND IMMEDIATE RESPONSE - before any processing
             response_data = {
@@ -1253,7 +1334,6 @@ class ProjectImageViewSet(viewsets.ModelViewSet):
             # Queue SINGLE optimization for the entire project - completely asynchronous
             def queue_bulk_optimization():
                 try:
-                    from portfolio.async_optimizer import AsyncImageOptimizer
                     AsyncImageOptimizer.queue_project_optimization(
                         project_id=project.id,
                         operation_type='bulk_upload'
@@ -1273,22 +1353,16 @@ class ProjectImageViewSet(viewsets.ModelViewSet):
             return Response({
                 'error': f'Failed during bulk upload: {str(e)}'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        finally:
-            # Always reconnect the signal if not handled by thread
-            try:
-                post_save.connect(optimize_project_album_image_on_save, sender=ProjectImage)
-            except:
-                pass  # Already connected
 
 
-class ServiceImageViewSet(viewsets.ModelViewSet):
+class ServiceImageViewSet(PublicReadAdminWriteMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing service album images
     """
     serializer_class = ServiceImageSerializer
     filter_backends = [DjangoFilterBackend, OrderingFilter]
-    ordering_fields = ['order', 'created_at']
-    ordering = ['order', 'created_at']
+    ordering_fields = ['order', 'id']
+    ordering = ['order', 'id']
 
     def get_queryset(self):
         """Filter images by service if service_id is provided"""
@@ -1298,34 +1372,12 @@ class ServiceImageViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(service_id=service_id)
         return queryset
 
-    def get_serializer_context(self):
-        """Add request to serializer context so it can build absolute URLs"""
-        context = super().get_serializer_context()
-        context['request'] = self.request
-        return context
-
-    def get_permissions(self):
-        """
-        Allow public read access, but require admin for write operations
-        """
-        if self.action in ['create', 'update', 'partial_update', 'destroy']:
-            permission_classes = [IsAdminUser]
-        else:
-            permission_classes = []
-        return [permission() for permission in permission_classes]
-
     @action(detail=False, methods=['post'], permission_classes=[IsAdminUser])
     def bulk_upload(self, request):
         """
         Bulk upload multiple images for a service
         OPTIMIZED: Sends response immediately, processes images efficiently with single optimization call
         """
-        import logging
-        import threading
-        from django.db.models.signals import post_save
-        from .signals import optimize_service_album_image_on_save
-        
-        logger = logging.getLogger(__name__)
         start_time = time.time()
 
         # Validate inputs first
@@ -1334,7 +1386,8 @@ class ServiceImageViewSet(viewsets.ModelViewSet):
             return Response({'error': 'service_id is required'}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            service = Service.objects.get(id=service_id)
+            # Only what the album upload path needs (name/folder_slug)
+            service = Service.objects.only('id', 'name', 'folder_slug').get(id=service_id)
         except Service.DoesNotExist:
             return Response({'error': 'Service not found'}, status=status.HTTP_404_NOT_FOUND)
 
@@ -1351,30 +1404,41 @@ class ServiceImageViewSet(viewsets.ModelViewSet):
 
         replace_existing = request.data.get('replace_existing', 'false').lower() == 'true'
 
-        # CRITICAL FIX: Disconnect ALL optimization signals during bulk upload for instant response
-        post_save.disconnect(optimize_service_album_image_on_save, sender=ServiceImage)
-        
+        # CRITICAL FIX: Suppress optimization signals during bulk upload for instant response
         try:
+            # Write the files to storage in parallel before opening the transaction,
+            # so no row locks are held while uploads are stored
+            new_images = [
+                ServiceImage(service=service, original_filename=image.name, order=i)
+                for i, image in enumerate(images)
+            ]
+            _store_album_uploads(new_images, images)
+            
             # FASTEST PATH: Only database operations, no image processing at all
-            with transaction.atomic():
-                if replace_existing:
-                    # Delete existing images without processing
-                    existing_images = ServiceImage.objects.filter(service=service)
-                    for existing_image in existing_images:
-                        if existing_image.image:
-                            existing_image.image.delete(save=False)
-                    existing_images.delete()
-
-                # Create image records ONLY - no processing whatsoever
-                created_images = []
-                for i, image in enumerate(images):
-                    service_image = ServiceImage.objects.create(
-                        service=service,
-                        image=image,
-                        original_filename=image.name,
-                        order=i
-                    )
-                    created_images.append(service_image)
+            try:
+                with transaction.atomic(), suppress_optimization_signals():
+                    if replace_existing:
+                        # Delete existing images without processing - read only the file
+                        # names, drop the rows in one DELETE and unlink the files as a batch
+                        existing_images = ServiceImage.objects.filter(service=service)
+                        existing_paths = [
+                            os.path.join(settings.MEDIA_ROOT, name)
+                            for name in existing_images.exclude(image='').values_list('image', flat=True)
+                        ]
+                        existing_images._raw_delete(existing_images.db)
+                        bulk_unlink(existing_paths + [
+                            variant for path in existing_paths
+                            for variant in ImageOptimizer.optimized_variant_paths(path)
+                        ])
+
+                    # Create image records ONLY - one INSERT per batch;
+                    # bulk_create skips post_save, so invalidate the cache and storage stats here
+                    created_images = ServiceImage.objects.bulk_create(new_images, batch_size=100)
+                    transaction.on_commit(lambda: bump_cache_generation('services'))
+                    transaction.on_commit(StorageStat.media_changed)
+            except Exception:
+                _discard_album_uploads(new_images)
+                raise
 
             # SEND IMMEDIATE RESPONSE - before any processing
             response_data = {
@@ -1389,7 +1453,6 @@ class ServiceImageViewSet(viewsets.ModelViewSet):
             # Queue SINGLE optimization for the entire service - completely asynchronous
             def queue_bulk_optimization():
                 try:
-                    from portfolio.async_optimizer import AsyncImageOptimizer
                     AsyncImageOptimizer.queue_service_optimization(
                         service_id=service.id,
                         operation_type='bulk_upload'
@@ -1409,31 +1472,60 @@ class ServiceImageViewSet(viewsets.ModelViewSet):
             return Response({
                 'error': f'Failed during bulk upload: {str(e)}'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        finally:
-            # Always reconnect the signal if not handled by thread
-            try:
-                post_save.connect(optimize_service_album_image_on_save, sender=ServiceImage)
-            except:
-                pass  # Already connected
 
 
-class ProjectAlbumView(APIView):
+def _album_page(album_images, request):
+    """
+    Optional ?limit=&offset= window over an album (SQL LIMIT/OFFSET), so large
+    albums can be fetched in pages. Returns (images, total); without a limit the
+    whole album is returned and the total is taken from the serialized list
+    """
+    try:
+        limit = int(request.query_params['limit'])
+        offset = max(int(request.query_params.get('offset', 0)), 0)
+    except (KeyError, ValueError):
+        return album_images, None
+    if limit < 1:
+        return album_images, None
+    return album_images[offset:offset + limit], album_images.count()
+
+
+def _with_primary_category_names(queryset, category_model, subcategory_model, related_name):
+    """
+    Annotate the names get_category_name()/get_subcategory_name() return (the
+    first category/subcategory in their default ordering), so they come back with
+    the object itself instead of costing a query each
+    """
+    return queryset.annotate(
+        primary_category_name=models.Subquery(
+            category_model.objects.filter(**{related_name: models.OuterRef('pk')})
+            .order_by('name').values('name')[:1]
+        ),
+        primary_subcategory_name=models.Subquery(
+            subcategory_model.objects.filter(**{related_name: models.OuterRef('pk')})
+            .order_by('category__name', 'name').values('name')[:1]
+        ),
+    )
+
+
+class ProjectAlbumView(CachedPermissionsMixin, APIView):
     """
     API endpoint to get all album images for a specific project
     """
+    @method_decorator(condition(etag_func=lambda request, project_id: _generation_etag_with_categories('projects', f"album:{project_id}")))
     def get(self, request, project_id):
         try:
-            project = Project.objects.get(id=project_id)
-            album_images = project.album_images.all()
+            project = _with_primary_category_names(Project.objects.all(), ProjectCategory, ProjectSubcategory, 'projects').get(id=project_id)
+            album_images, total_images = _album_page(project.album_images.all(), request)
             
+            # Shared with the cover URL below so the scheme/host is worked out once
+            context = {'request': request}
             try:
-                serializer = ProjectImageSerializer(album_images, many=True, context={'request': request})
+                serializer = ProjectImageSerializer(album_images, many=True, context=context)
                 serialized_data = serializer.data
-                print(f"Successfully serialized {len(serialized_data)} album images for project {project_id}")
+                logger.debug("Serialized %d album images for project %s", len(serialized_data), project_id)
             except Exception as e:
-                print(f"Error serializing album images for project {project_id}: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("Error serializing album images for project %s: %s", project_id, e)
                 # Return a fallback response if serialization fails
                 return Response({
                     'project': {
@@ -1441,8 +1533,8 @@ class ProjectAlbumView(APIView):
                         'title': project.title,
                         'description': project.description,
                         'image': None,
-                        'category_name': project.get_category_name() if hasattr(project, 'get_category_name') else '',
-                        'subcategory_name': project.get_subcategory_name() if hasattr(project, 'get_subcategory_name') else ''
+                        'category_name': project.primary_category_name or '',
+                        'subcategory_name': project.primary_subcategory_name or ''
                     },
                     'album_images': [],
                     'total_images': 0,
@@ -1454,43 +1546,42 @@ class ProjectAlbumView(APIView):
                     'id': project.id,
                     'title': project.title,
                     'description': project.description,
-                    'image': request.build_absolute_uri(project.image.url) if project.image else None,
-                    'category_name': project.get_category_name(),
-                    'subcategory_name': project.get_subcategory_name()
+                    'image': _absolute_uri(context, project.image.url) if project.image else None,
+                    'category_name': project.primary_category_name,
+                    'subcategory_name': project.primary_subcategory_name
                 },
                 'album_images': serialized_data,
-                'total_images': len(serialized_data)
+                'total_images': len(serialized_data) if total_images is None else total_images
             })
         except Project.DoesNotExist:
             return Response({
                 'error': 'Project not found'
             }, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
-            print(f"Unexpected error in ProjectAlbumView for project {project_id}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Unexpected error in ProjectAlbumView for project %s: %s", project_id, e)
             return Response({
                 'error': 'Internal server error occurred while fetching album'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class ServiceAlbumView(APIView):
+class ServiceAlbumView(CachedPermissionsMixin, APIView):
     """
     API endpoint to get all album images for a specific service
     """
+    @method_decorator(condition(etag_func=lambda request, service_id: _generation_etag_with_categories('services', f"album:{service_id}")))
     def get(self, request, service_id):
         try:
-            service = Service.objects.get(id=service_id)
-            album_images = service.album_images.all()
+            service = _with_primary_category_names(Service.objects.all(), ServiceCategory, ServiceSubcategory, 'services').get(id=service_id)
+            album_images, total_images = _album_page(service.album_images.all(), request)
             
+            # Shared with the cover URL below so the scheme/host is worked out once
+            context = {'request': request}
             try:
-                serializer = ServiceImageSerializer(album_images, many=True, context={'request': request})
+                serializer = ServiceImageSerializer(album_images, many=True, context=context)
                 serialized_data = serializer.data
-                print(f"Successfully serialized {len(serialized_data)} album images for service {service_id}")
+                logger.debug("Serialized %d album images for service %s", len(serialized_data), service_id)
             except Exception as e:
-                print(f"Error serializing album images for service {service_id}: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("Error serializing album images for service %s: %s", service_id, e)
                 # Return a fallback response if serialization fails
                 return Response({
                     'service': {
@@ -1499,8 +1590,8 @@ class ServiceAlbumView(APIView):
                         'description': service.description,
                         'icon': None,
                         'price': str(service.price) if hasattr(service, 'price') else '0',
-                        'category_name': service.get_category_name() if hasattr(service, 'get_category_name') else '',
-                        'subcategory_name': service.get_subcategory_name() if hasattr(service, 'get_subcategory_name') else ''
+                        'category_name': service.primary_category_name or '',
+                        'subcategory_name': service.primary_subcategory_name or ''
                     },
                     'album_images': [],
                     'total_images': 0,
@@ -1512,37 +1603,34 @@ class ServiceAlbumView(APIView):
                     'id': service.id,
                     'name': service.name,
                     'description': service.description,
-                    'icon': request.build_absolute_uri(service.icon.url) if service.icon else None,
+                    'icon': _absolute_uri(context, service.icon.url) if service.icon else None,
                     'price': str(service.price),
-                    'category_name': service.get_category_name(),
-                    'subcategory_name': service.get_subcategory_name()
+                    'category_name': service.primary_category_name,
+                    'subcategory_name': service.primary_subcategory_name
                 },
                 'album_images': serialized_data,
-                'total_images': len(serialized_data)
+                'total_images': len(serialized_data) if total_images is None else total_images
             })
         except Service.DoesNotExist:
             return Response({
                 'error': 'Service not found'
             }, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
-            print(f"Unexpected error in ServiceAlbumView for service {service_id}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Unexpected error in ServiceAlbumView for service %s: %s", service_id, e)
             return Response({
                 'error': 'Internal server error occurred while fetching album'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 # Admin-specific ViewSets without pagination for dashboard
-class AdminProjectViewSet(viewsets.ModelViewSet):
+class AdminProjectViewSet(CachedPermissionsMixin, viewsets.ModelViewSet):
     """
     Admin-only ViewSet for projects without pagination.
     Used by the admin dashboard to display all projects.
     """
     serializer_class = ProjectSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_class = ProjectFilter
-    search_fields = ['title', 'description']
     ordering_fields = ['project_date', 'title', 'order']
     ordering = ['order', '-project_date']
     permission_classes = [IsAdminUser]
@@ -1550,45 +1638,31 @@ class AdminProjectViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Optimized queryset with prefetching to avoid N+1 queries"""
-        return Project.objects.select_related().prefetch_related(
-            'categories',
-            'subcategories', 
-            'album_images'
+        return Project.objects.prefetch_related(
+            *_taxonomy_prefetches(ProjectCategory, ProjectSubcategory),
+            _album_images_prefetch(ProjectImage, self.action)
         ).annotate(
-            album_images_count_annotated=models.Count('album_images')
+            album_images_count_annotated=_album_images_count(ProjectImage, 'project')
         ).order_by('order', '-project_date')
 
-    def get_serializer_context(self):
-        """Add request to serializer context so it can build absolute URLs"""
-        context = super().get_serializer_context()
-        context['request'] = self.request
-        return context
-
     def perform_create(self, serializer):
         # Capture original filename from uploaded image
         image_file = self.request.FILES.get('image')
         
         # CRITICAL FIX: Disable optimization signals during creation for instant response
-        from django.db.models.signals import post_save
-        from portfolio.signals import optimize_project_images_on_save
-        
-        # Disconnect optimization signals to ensure instant response
-        post_save.disconnect(optimize_project_images_on_save, sender=serializer.Meta.model)
         
-        try:
+        # Suppress optimization signals (this thread only) to ensure instant response
+        with suppress_optimization_signals():
             # Get the order from the data
             order = serializer.validated_data.get('order')
             
             with transaction.atomic():
                 # If an order is specified, shift existing projects to make room
                 if order is not None and order >= 1:
-                    # Only shift if there are actually projects with order >= new_order
-                    # This avoids unnecessary database operations
-                    existing_count = Project.objects.filter(order__gte=order).count()
-                    if existing_count > 0:
-                        Project.objects.filter(order__gte=order).update(
-                            order=models.F('order') + 1
-                        )
+                    # A single UPDATE; it simply matches no rows when nothing needs shifting
+                    Project.objects.filter(order__gte=order).update(
+                        order=models.F('order') + 1
+                    )
                 
                 # Save the project with the image filename if provided
                 if image_file:
@@ -1600,22 +1674,16 @@ class AdminProjectViewSet(viewsets.ModelViewSet):
                 if image_file:
                     def queue_optimization():
                         try:
-                            from portfolio.async_optimizer import AsyncImageOptimizer
                             AsyncImageOptimizer.queue_project_optimization(
                                 project_id=instance.id,
                                 operation_type='create'
                             )
                         except Exception as e:
-                            import logging
-                            logger = logging.getLogger(__name__)
                             logger.error(f"Failed to queue optimization for new project {instance.id}: {e}")
                     
                     # Queue after transaction commits (non-blocking)
                     transaction.on_commit(queue_optimization)
                     
-        finally:
-            # Reconnect the signal
-            post_save.connect(optimize_project_images_on_save, sender=serializer.Meta.model)
 
     def perform_update(self, serializer):
         # Capture original filename from uploaded image if a new one is provided
@@ -1623,13 +1691,9 @@ class AdminProjectViewSet(viewsets.ModelViewSet):
         album_images = self.request.FILES.getlist('album_images')
         
         # CRITICAL FIX: Disable ALL signals during main image updates to prevent blocking
-        from django.db.models.signals import post_save
-        from portfolio.signals import optimize_project_images_on_save
-        
-        # Disconnect optimization signals to ensure instant response
-        post_save.disconnect(optimize_project_images_on_save, sender=serializer.Meta.model)
         
-        try:
+        # Suppress optimization signals (this thread only) to ensure instant response
+        with suppress_optimization_signals():
             # Mark instance if new image files were uploaded
             instance = serializer.save()
             if image_file or album_images:
@@ -1642,25 +1706,18 @@ class AdminProjectViewSet(viewsets.ModelViewSet):
                 
             # IMMEDIATELY queue async optimization AFTER response is sent
             if image_file or album_images:
-                from django.db import transaction
                 def queue_optimization():
                     try:
-                        from portfolio.async_optimizer import AsyncImageOptimizer
                         AsyncImageOptimizer.queue_project_optimization(
                             project_id=instance.id,
                             operation_type='main_image_update' if image_file else 'album_update'
                         )
                     except Exception as e:
-                        import logging
-                        logger = logging.getLogger(__name__)
                         logger.error(f"Failed to queue optimization for project {instance.id}: {e}")
                 
                 # Queue after transaction commits (non-blocking)
                 transaction.on_commit(queue_optimization)
                 
-        finally:
-            # Reconnect the signal
-            post_save.connect(optimize_project_images_on_save, sender=serializer.Meta.model)
 
     def perform_destroy(self, instance):
         """
@@ -1757,9 +1814,7 @@ class AdminProjectViewSet(viewsets.ModelViewSet):
                     
                     if previous_project:
                         # Swap orders
-                        project.order, previous_project.order = previous_project.order, project.order
-                        project.save()
-                        previous_project.save()
+                        _swap_order(Project, project, previous_project, 'projects')
                         return Response({'message': 'Project moved up successfully'})
                     else:
                         return Response({'error': 'Project is already first'}, status=status.HTTP_400_BAD_REQUEST)
@@ -1778,9 +1833,7 @@ class AdminProjectViewSet(viewsets.ModelViewSet):
                     
                     if next_project:
                         # Swap orders
-                        project.order, next_project.order = next_project.order, project.order
-                        project.save()
-                        next_project.save()
+                        _swap_order(Project, project, next_project, 'projects')
                         return Response({'message': 'Project moved down successfully'})
                     else:
                         return Response({'error': 'Project is already last'}, status=status.HTTP_400_BAD_REQUEST)
@@ -1789,15 +1842,14 @@ class AdminProjectViewSet(viewsets.ModelViewSet):
             return Response({'error': 'Invalid direction or new_order parameter'}, status=status.HTTP_400_BAD_REQUEST)
 
 
-class AdminServiceViewSet(viewsets.ModelViewSet):
+class AdminServiceViewSet(CachedPermissionsMixin, viewsets.ModelViewSet):
     """
     Admin-only ViewSet for services without pagination.
     Used by the admin dashboard to display all services.
     """
     serializer_class = ServiceSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_class = ServiceFilter
-    search_fields = ['name', 'description']
     ordering_fields = ['name', 'order']
     ordering = ['order', 'name']
     permission_classes = [IsAdminUser]
@@ -1805,33 +1857,20 @@ class AdminServiceViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Optimized queryset with prefetching to avoid N+1 queries"""
-        return Service.objects.select_related().prefetch_related(
-            'categories',
-            'subcategories',
-            'album_images'
+        return Service.objects.prefetch_related(
+            *_taxonomy_prefetches(ServiceCategory, ServiceSubcategory),
+            _album_images_prefetch(ServiceImage, self.action)
         ).annotate(
-            album_images_count_annotated=models.Count('album_images')
+            album_images_count_annotated=_album_images_count(ServiceImage, 'service')
         ).order_by('order', 'name')
 
-    def get_serializer_context(self):
-        """Add request to serializer context so it can build absolute URLs"""
-        context = super().get_serializer_context()
-        context['request'] = self.request
-        return context
-
     def perform_create(self, serializer):
-        from django.db import transaction
-        from .signals import post_save
-        from .models import Service
-        from .async_optimizer import AsyncImageOptimizer
         
         # Capture original filename from uploaded icon
         icon_file = self.request.FILES.get('icon')
         
-        # Temporarily disconnect signals during creation for async processing
-        post_save.disconnect(sender=Service)
-        
-        try:
+        # Temporarily suppress optimization signals during creation for async processing
+        with suppress_optimization_signals():
             # Save the service with the icon filename if provided
             if icon_file:
                 instance = serializer.save(original_filename=icon_file.name)
@@ -1842,24 +1881,15 @@ class AdminServiceViewSet(viewsets.ModelViewSet):
             if icon_file:
                 AsyncImageOptimizer.queue_service_optimization(instance.id, 'create')
                 
-        finally:
-            # Reconnect signals
-            post_save.connect(sender=Service)
 
     def perform_update(self, serializer):
-        from django.db import transaction
-        from .signals import post_save
-        from .models import Service
-        from .async_optimizer import AsyncImageOptimizer
         
         # Capture original filename from uploaded icon if a new one is provided
         icon_file = self.request.FILES.get('icon')
         album_images = self.request.FILES.getlist('album_images')
         
-        # Temporarily disconnect signals during update for async processing
-        post_save.disconnect(sender=Service)
-        
-        try:
+        # Temporarily suppress optimization signals during update for async processing
+        with suppress_optimization_signals():
             # Mark instance if new image files were uploaded
             instance = serializer.save()
             if icon_file or album_images:
@@ -1873,9 +1903,6 @@ class AdminServiceViewSet(viewsets.ModelViewSet):
                 # Queue async optimization for new icon
                 AsyncImageOptimizer.queue_service_optimization(instance.id, 'update')
                 
-        finally:
-            # Reconnect signals
-            post_save.connect(sender=Service)
 
     @action(detail=True, methods=['post'], permission_classes=[IsAdminUser])
     def reorder(self, request, pk=None):
@@ -1924,9 +1951,7 @@ class AdminServiceViewSet(viewsets.ModelViewSet):
                     
                     if previous_service:
                         # Swap orders
-                        service.order, previous_service.order = previous_service.order, service.order
-                        service.save()
-                        previous_service.save()
+                        _swap_order(Service, service, previous_service, 'services')
                         return Response({'message': 'Service moved up successfully'})
                     else:
                         return Response({'error': 'Service is already first'}, status=status.HTTP_400_BAD_REQUEST)
@@ -1939,9 +1964,7 @@ class AdminServiceViewSet(viewsets.ModelViewSet):
                     
                     if next_service:
                         # Swap orders
-                        service.order, next_service.order = next_service.order, service.order
-                        service.save()
-                        next_service.save()
+                        _swap_order(Service, service, next_service, 'services')
                         return Response({'message': 'Service moved down successfully'})
                     else:
                         return Response({'error': 'Service is already last'}, status=status.HTTP_400_BAD_REQUEST)